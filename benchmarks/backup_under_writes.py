@@ -0,0 +1,111 @@
+"""Backup benchmark: `jobtracker backup` of a ~1 GB database while writers commit.
+
+A synthetic dataset (see `dataset.py`; 430k jobs come to about 1 GB) is taken from
+the cache and copied to a scratch file in WAL mode. Writer processes then commit
+one job per transaction, the way parallel `jobtracker job add` scripts do, first
+for a baseline window and then while one backup per compression runs. Reported
+per backup: duration, throughput, archive size, and the writers' commits/sec and
+p99 / max commit latency during it, next to the baseline.
+
+Usage: python benchmarks/backup_under_writes.py [--jobs 430000] [--writers 2] [--compress gzip zstd none]
+                                                [--step-pages 1024] [--cache-dir DIR]
+"""
+
+import argparse
+import multiprocessing as mp
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from dataset import DEFAULT_SEED, ensure
+from jobtracker import backup
+from jobtracker import db as dbmod
+from jobtracker.models import Job, generate_uuid
+
+BASELINE_SECONDS = 5.0
+
+
+def _writer(path: Path, stop, results) -> None:
+    """Commit one job per transaction until `stop`; report `(finished_at, latency)` per commit."""
+    engine = dbmod.make_engine(path, profile="interactive")
+    commits = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(insert(Job).values(id=generate_uuid(), company="Writer", title="Dev"))
+        end = time.perf_counter()
+        commits.append((end, end - start))
+    results.put(commits)
+
+
+def _window(commits: list[tuple[float, float]], start: float, end: float) -> dict:
+    latencies = sorted(latency for finished, latency in commits if start <= finished < end)
+    if not latencies:
+        return {"commits_per_sec": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    return {
+        "commits_per_sec": len(latencies) / (end - start),
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def run(source: Path, writers: int, compressions: list[backup.Compression], step_pages: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "jobtracker.db"
+        shutil.copyfile(source, path)
+        dbmod.init_db(dbmod.make_engine(path, profile="interactive"))  # switches the copy to WAL
+        size = path.stat().st_size
+        stop, results = mp.Event(), mp.Queue()
+        procs = [mp.Process(target=_writer, args=(path, stop, results)) for _ in range(writers)]
+        for p in procs:
+            p.start()
+        time.sleep(1.0)  # writers connected and warmed up
+        windows = [("baseline", time.perf_counter(), None)]
+        time.sleep(BASELINE_SECONDS)
+        windows[0] = (*windows[0][:2], time.perf_counter())
+        for compression in compressions:
+            start = time.perf_counter()
+            result = backup.create_backup(path, Path(tmp) / "backups", compression, keep=0, step_pages=step_pages)
+            windows.append((compression.value, start, time.perf_counter(), result))
+        stop.set()
+        commits = [c for _ in procs for c in results.get()]
+        for p in procs:
+            p.join()
+
+    print(f"database {size / 2**20:.0f} MiB, {writers} writer(s), {step_pages} pages per step")
+    print(f"{'run':<9} {'seconds':>8} {'MiB/s':>7} {'archive MiB':>12} {'ratio':>6} {'commits/s':>10} {'p99 ms':>8}")
+    for name, start, end, *rest in windows:
+        stats = _window(commits, start, end)
+        if rest:
+            result = rest[0]
+            ratio = result.database_bytes / result.archive_bytes
+            line = f"{name:<9} {result.seconds:>8.1f} {result.database_bytes / 2**20 / result.seconds:>7.0f} "
+            line += f"{result.archive_bytes / 2**20:>12.1f} {ratio:>6.1f} "
+        else:
+            line = f"{name:<9} {'':>8} {'':>7} {'':>12} {'':>6} "
+        print(line + f"{stats['commits_per_sec']:>10.0f} {stats['p99_ms']:>8.1f}  (max {stats['max_ms']:.1f} ms)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=430_000, help="dataset size (430k jobs is about 1 GB)")
+    parser.add_argument("--writers", type=int, default=2)
+    default = [c.value for c in (backup.Compression.GZIP, backup.default_compression(), backup.Compression.NONE)]
+    parser.add_argument("--compress", nargs="+", choices=[c.value for c in backup.Compression], default=default)
+    parser.add_argument("--step-pages", type=int, default=backup.STEP_PAGES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--cache-dir", type=Path, default=Path.home() / ".cache" / "jobtracker-bench")
+    args = parser.parse_args()
+
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+    source = args.cache_dir / f"jobs-{args.jobs}-seed{args.seed}.db"
+    ensure(source, args.jobs, args.seed)
+    compressions = [backup.Compression(c) for c in dict.fromkeys(args.compress)]
+    run(source, args.writers, compressions, args.step_pages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Benchmark suite for `jobtracker` commands on synthetic datasets.
+
+For every scale, a deterministic dataset (see `benchmarks/dataset.py`) is built or
+taken from the cache and copied to a scratch file. Each command then runs as a fresh
+`jobtracker` process (daemon disabled), the way a user or a script runs it. The
+suite records:
+
+  wall_ms     process wall-clock time, interpreter start-up included
+  command_ms  time spent inside the command (after Python started)
+  peak_rss_kb peak resident set size of the process
+  statements  SQL statements sent to SQLite (migration checks included)
+
+Results go to a JSON file keyed by scale and command. Compare two files with
+`benchmarks/compare.py`.
+
+Usage: python benchmarks/cli_suite.py [--scales 1k 10k 100k] [--runs N] [--commands "job list" ...]
+                                      [--output results.json] [--cache-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import dataset
+
+STATS_ENV = "JOBTRACKER_BENCH_STATS"
+# Runs one command in-process, counting every statement any engine sends to SQLite.
+# Peak RSS is read from VmHWM, which starts afresh at exec; ru_maxrss would include
+# the benchmark process itself on Linux, which forked the child.
+CHILD = f"""
+import json, os, resource, sys, time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+stats = {{"statements": 0}}
+event.listen(Engine, "before_cursor_execute", lambda *a: stats.__setitem__("statements", stats["statements"] + 1))
+from jobtracker.cli.main import root_command
+start = time.perf_counter()
+try:
+    root_command().main(args=sys.argv[1:], prog_name="jobtracker")
+except SystemExit as exc:
+    code = exc.code
+else:
+    code = 0
+stats["command_ms"] = (time.perf_counter() - start) * 1000
+try:
+    with open("/proc/self/status") as f:
+        stats["peak_rss_kb"] = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+except OSError:
+    # ru_maxrss is in bytes on macOS and KiB elsewhere.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    stats["peak_rss_kb"] = peak // 1024 if sys.platform == "darwin" else peak
+with open(os.environ["{STATS_ENV}"], "w") as f:
+    json.dump(stats, f)
+sys.exit(code)
+"""
+
+STATUS_CYCLE = ["recruiter", "video_interview", "1st_interview", "rejected"]
+
+# name -> argv for run `i` against a dataset manifest `m`.
+COMMANDS = {
+    "job list": lambda m, i: ["job", "list", "--limit", "50"],
+    "job list --format tsv": lambda m, i: ["job", "list", "--format", "tsv"],
+    "job add": lambda m, i: [
+        "job", "add", "--company", f"Bench {i}", "--title", "Engineer", "--source", "LinkedIn",
+        "--job-url", f"https://bench.example.com/{i}", "--location", "Remote", "--salary-range", "100000 - 120000",
+        "--resume-id", m["resume_id"], "--cover-letter-id", m["cover_letter_id"],
+    ],  # fmt: skip
+    "job status": lambda m, i: ["job", "status", m["job_id"], STATUS_CYCLE[i % len(STATUS_CYCLE)]],
+    "note list": lambda m, i: ["note", "list", m["job_id"]],
+    "resume remove": lambda m, i: ["resume", "remove", m["spare_resume_ids"][i]],
+    "search": lambda m, i: ["search", m["search_term"], "--limit", "20"],
+}
+
+
+def run_once(argv: list[str], env: dict) -> dict:
+    """Run one command in a fresh process and return its measurements."""
+    with tempfile.NamedTemporaryFile(suffix=".json") as stats_file:
+        env = {**env, STATS_ENV: stats_file.name}
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", CHILD, *argv], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            stderr = proc.stderr.decode(errors="replace")
+            raise RuntimeError(f"`jobtracker {' '.join(argv)}` exited with {proc.returncode}:\n{stderr}")
+        stats = json.loads(Path(stats_file.name).read_text())
+    return {"wall_ms": wall_ms, **stats}
+
+
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+
+
+def summarize(samples: list[dict]) -> dict:
+    wall = [s["wall_ms"] for s in samples]
+    return {
+        "runs": len(samples),
+        "wall_ms": {"median": statistics.median(wall), "p95": _p95(wall), "min": min(wall)},
+        "command_ms": statistics.median(s["command_ms"] for s in samples),
+        "peak_rss_kb": max(s["peak_rss_kb"] for s in samples),
+        "statements": max(s["statements"] for s in samples),
+    }
+
+
+def run_scale(scale: str, commands: list[str], runs: int, warmup: int, seed: int, cache_dir: Path) -> list[dict]:
+    jobs = dataset.SCALES[scale]
+    cached = cache_dir / f"jobs-{scale}-seed{seed}.db"
+    manifest = dataset.ensure(cached, jobs, seed)
+    if runs + warmup > len(manifest["spare_resume_ids"]) and "resume remove" in commands:
+        raise SystemExit(f"resume remove needs --runs + --warmup <= {len(manifest['spare_resume_ids'])}")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp) / "jobtracker.db"
+        shutil.copyfile(cached, work)
+        env = {
+            **os.environ,
+            "HOME": tmp,
+            "JOBTRACKER_DB": str(work),
+            "JOBTRACKER_NO_DAEMON": "1",
+            "COLUMNS": "160",
+        }
+        env.pop("JOBTRACKER_CONFIG", None)
+        env.pop("JOBTRACKER_DB_PROFILE", None)
+        for name in commands:
+            build = COMMANDS[name]
+            samples = [run_once(build(manifest, i), env) for i in range(warmup + runs)][warmup:]
+            summary = summarize(samples)
+            results.append({"scale": scale, "jobs": jobs, "command": name, "argv": build(manifest, 0), **summary})
+            print(
+                f"{scale:>5} {name:<22} {summary['wall_ms']['median']:>9.1f} {summary['command_ms']:>9.1f} "
+                f"{summary['peak_rss_kb'] / 1024:>8.1f} {summary['statements']:>6}",
+                flush=True,
+            )
+    return results
+
+
+def _git(*args: str) -> str:
+    try:
+        out = subprocess.run(["git", *args], capture_output=True, text=True, check=True, cwd=Path(__file__).parent)
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return out.stdout.strip()
+
+
+def metadata(args) -> dict:
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "runs": args.runs,
+        "warmup": args.warmup,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", nargs="+", choices=dataset.SCALES, default=["1k", "10k", "100k"])
+    parser.add_argument("--commands", nargs="+", choices=COMMANDS, default=list(COMMANDS))
+    parser.add_argument("--runs", type=int, default=5, help="timed runs per command")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per command before timing")
+    parser.add_argument("--seed", type=int, default=dataset.DEFAULT_SEED)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path.home() / ".cache" / "jobtracker-bench",
+        help="where generated datasets are kept between runs",
+    )
+    parser.add_argument("--output", type=Path, help="results file (default: bench-<commit>.json)")
+    args = parser.parse_args()
+
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+    meta = metadata(args)
+    output = args.output or Path(f"bench-{meta['commit'][:10] or 'local'}.json")
+
+    print(f"{'scale':>5} {'command':<22} {'wall ms':>9} {'cmd ms':>9} {'RSS MiB':>8} {'stmts':>6}")
+    results = []
+    for scale in args.scales:
+        results.extend(run_scale(scale, args.commands, args.runs, args.warmup, args.seed, args.cache_dir))
+    output.write_text(json.dumps({**meta, "results": results}, indent=2) + "\n")
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare two `benchmarks/cli_suite.py` result files, e.g. from two commits.
+
+Matches results by (scale, command) and prints the median wall time, peak RSS and
+statement count of both runs with the relative change. Exits non-zero when a
+command got slower or grew its peak RSS by more than --threshold percent, or sends
+more SQL statements than before, so the script can gate a CI job.
+
+Usage: python benchmarks/compare.py BASE.json HEAD.json [--threshold 10]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def load(path: Path) -> tuple[dict, dict]:
+    data = json.loads(path.read_text())
+    return data, {(r["scale"], r["command"]): r for r in data["results"]}
+
+
+def _change(base: float, head: float) -> float:
+    return (head - base) / base * 100 if base else 0.0
+
+
+def compare(base: dict, head: dict, threshold: float) -> tuple[list[tuple], list[str]]:
+    """Return table rows for every shared (scale, command) and a list of regressions."""
+    rows, regressions = [], []
+    for key in sorted(base.keys() & head.keys(), key=lambda k: (head[k]["jobs"], k[1])):
+        b, h = base[key], head[key]
+        wall = _change(b["wall_ms"]["median"], h["wall_ms"]["median"])
+        rss = _change(b["peak_rss_kb"], h["peak_rss_kb"])
+        label = f"{key[0]} {key[1]}"
+        if wall > threshold:
+            regressions.append(f"{label}: wall time +{wall:.1f}%")
+        if rss > threshold:
+            regressions.append(f"{label}: peak RSS +{rss:.1f}%")
+        if h["statements"] > b["statements"]:
+            regressions.append(f"{label}: {b['statements']} -> {h['statements']} SQL statements")
+        rows.append((key, b, h, wall, rss))
+    return rows, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown / RSS growth in percent")
+    args = parser.parse_args()
+
+    base_meta, base = load(args.base)
+    head_meta, head = load(args.head)
+    print(f"base {base_meta.get('commit', '')[:10]}  head {head_meta.get('commit', '')[:10]}")
+    rows, regressions = compare(base, head, args.threshold)
+
+    print(f"{'scale':>5} {'command':<22} {'wall ms':>17} {'change':>8} {'RSS MiB':>13} {'change':>8} {'stmts':>9}")
+    for (scale, command), b, h, wall, rss in rows:
+        print(
+            f"{scale:>5} {command:<22} {b['wall_ms']['median']:>8.1f}{h['wall_ms']['median']:>9.1f} {wall:>+7.1f}% "
+            f"{b['peak_rss_kb'] / 1024:>6.1f}{h['peak_rss_kb'] / 1024:>7.1f} {rss:>+7.1f}% "
+            f"{b['statements']:>4}{h['statements']:>5}"
+        )
+    for scale, command in sorted(base.keys() - head.keys()):
+        print(f"{scale:>5} {command:<22} only in base")
+    for scale, command in sorted(head.keys() - base.keys()):
+        print(f"{scale:>5} {command:<22} only in head")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:g}%:")
+        for line in regressions:
+            print(f"  {line}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Concurrent-writer throughput benchmark for the SQLite engine profiles.
+
+Spawns N writer processes that each add jobs one transaction at a time (the way
+parallel `jobtracker job add` scripts do) while a reader process repeatedly scans
+the jobs table. Runs once with a bare `create_engine` ("baseline") and once per
+engine profile, and reports committed rows/sec and "database is locked" errors.
+
+Usage: python benchmarks/concurrent_writers.py [--writers N] [--rows N] [--profiles interactive bulk-load]
+"""
+
+import argparse
+import multiprocessing as mp
+import queue
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select, func
+from sqlalchemy.exc import OperationalError
+
+from jobtracker import db as dbmod
+from jobtracker.models import Job, generate_uuid
+
+BASELINE = "baseline"
+# Seconds between checks that every writer that has not reported is still alive.
+POLL_SECONDS = 1.0
+
+
+def _engine(path: Path, profile: str):
+    if profile == BASELINE:
+        return create_engine(f"sqlite:///{path}", future=True)
+    return dbmod.make_engine(path, profile=profile)
+
+
+def _write(path: Path, profile: str, rows: int, worker: int) -> tuple[int, int]:
+    engine = _engine(path, profile)
+    committed = locked = 0
+    for i in range(rows):
+        try:
+            with engine.begin() as conn:
+                conn.execute(insert(Job).values(id=generate_uuid(), company=f"Co {worker}", title=f"Role {i}"))
+            committed += 1
+        except OperationalError as exc:
+            if "locked" not in str(exc):
+                raise
+            locked += 1
+    return committed, locked
+
+
+def _writer(path: Path, profile: str, rows: int, worker: int, results) -> None:
+    """Put `(worker, committed, locked, error)` on `results`; `error` is None on success."""
+    try:
+        results.put((worker, *_write(path, profile, rows, worker), None))
+    except Exception as exc:
+        results.put((worker, 0, 0, f"{type(exc).__name__}: {exc}"))
+
+
+def _collect(results, procs: list) -> list:
+    """`(committed, locked)` of every writer; raises RuntimeError if one failed or died."""
+    totals = {}
+    while len(totals) < len(procs):
+        try:
+            worker, committed, locked, error = results.get(timeout=POLL_SECONDS)
+        except queue.Empty:
+            dead = [w for w, p in enumerate(procs) if w not in totals and p.exitcode not in (None, 0)]
+            if dead:
+                raise RuntimeError(f"writer {dead[0]} exited with code {procs[dead[0]].exitcode}") from None
+            continue
+        if error is not None:
+            raise RuntimeError(f"writer {worker} failed: {error}")
+        totals[worker] = (committed, locked)
+    return list(totals.values())
+
+
+def _reader(path: Path, profile: str, stop) -> None:
+    engine = _engine(path, profile)
+    while not stop.is_set():
+        try:
+            with engine.connect() as conn:
+                conn.execute(select(func.count()).select_from(Job)).scalar()
+        except OperationalError:
+            pass
+
+
+def run(profile: str, writers: int, rows: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        dbmod.init_db(_engine(path, BASELINE))
+        results, stop = mp.Queue(), mp.Event()
+        reader = mp.Process(target=_reader, args=(path, profile, stop))
+        procs = [mp.Process(target=_writer, args=(path, profile, rows, w, results)) for w in range(writers)]
+        reader.start()
+        start = time.perf_counter()
+        for p in procs:
+            p.start()
+        try:
+            totals = _collect(results, procs)
+            elapsed = time.perf_counter() - start
+        finally:
+            stop.set()
+            for p in procs:
+                if p.exitcode is None and p.is_alive():
+                    p.terminate()
+                p.join()
+            reader.join()
+    committed = sum(c for c, _ in totals)
+    return {
+        "profile": profile,
+        "committed": committed,
+        "locked_errors": sum(locked for _, locked in totals),
+        "seconds": elapsed,
+        "rows_per_sec": committed / elapsed if elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=250, help="rows (transactions) per writer")
+    parser.add_argument("--profiles", nargs="+", default=["interactive", "bulk-load"])
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'rows/sec':>10} {'committed':>10} {'locked':>7} {'seconds':>8}")
+    for profile in [BASELINE, *args.profiles]:
+        try:
+            r = run(profile, args.writers, args.rows)
+        except RuntimeError as exc:
+            print(f"{profile:<12} {str(exc).splitlines()[0]}")
+            continue
+        print(
+            f"{r['profile']:<12} {r['rows_per_sec']:>10.0f} {r['committed']:>10} "
+            f"{r['locked_errors']:>7} {r['seconds']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""End-to-end latency of short `jobtracker` commands: cold, lazy and daemon modes.
+
+Each mode runs every command as a fresh process, the way a shell script would:
+
+  cold    imports every command module up front (a CLI without the lazy registry)
+  lazy    the `jobtracker` entry point with JOBTRACKER_NO_DAEMON=1
+  daemon  the same entry point, forwarded to a running `jobtracker daemon`
+
+Runs against a throwaway database seeded with --jobs rows and reports the median
+and p95 wall-clock milliseconds per command.
+
+Usage: python benchmarks/daemon_latency.py [--runs N] [--jobs N]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ENTRY = "from jobtracker.cli.client import run; run()"
+COLD = (
+    "import importlib; from jobtracker.cli.main import LAZY_COMMANDS, app; "
+    "[importlib.import_module(m) for m, _, _ in LAZY_COMMANDS.values()]; app()"
+)
+
+
+def _seed(env: dict, jobs: int) -> str:
+    code = (
+        "import sys; from sqlalchemy import insert; from jobtracker import db; from jobtracker.models import Job\n"
+        "db.init_db()\n"
+        "with db.engine.begin() as conn:\n"
+        "    conn.execute(insert(Job), [{'id': f'{i:08x}-bench', 'company': f'Co {i}', 'title': 'Dev'}"
+        " for i in range(int(sys.argv[1]))])\n"
+    )
+    subprocess.run([sys.executable, "-c", code, str(jobs)], env=env, check=True)
+    return f"{jobs // 2:08x}"
+
+
+def _time(statement: str, argv: list[str], env: dict, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement, *argv], env=env, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _wait_for(path: Path, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise RuntimeError("daemon did not start")
+        time.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--jobs", type=int, default=1000)
+    args = parser.parse_args()
+
+    # Unix socket paths are limited to ~100 characters, so keep the directory short.
+    tmp = Path(tempfile.mkdtemp(prefix="jtbench", dir="/tmp" if os.path.isdir("/tmp") else None))
+    env = {
+        **os.environ,
+        "JOBTRACKER_DB": str(tmp / "bench.db"),
+        "JOBTRACKER_SOCKET": str(tmp / "daemon.sock"),
+    }
+    env.pop("JOBTRACKER_NO_DAEMON", None)
+    no_daemon = {**env, "JOBTRACKER_NO_DAEMON": "1"}
+    job_id = _seed(env, args.jobs)
+    commands = {
+        "job status": ["job", "status", job_id, "recruiter"],
+        "job list": ["job", "list", "--limit", "20"],
+    }
+
+    daemon = subprocess.Popen(
+        [sys.executable, "-c", ENTRY, "daemon", "start", "--foreground"], env=env, stdout=subprocess.DEVNULL
+    )
+    try:
+        _wait_for(tmp / "daemon.sock")
+        print(f"{'command':<12} {'mode':<7} {'median ms':>10} {'p95 ms':>8}")
+        for name, argv in commands.items():
+            for mode, statement, mode_env in (
+                ("cold", COLD, no_daemon),
+                ("lazy", ENTRY, no_daemon),
+                ("daemon", ENTRY, env),
+            ):
+                samples = sorted(_time(statement, argv, mode_env, args.runs))
+                p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                print(f"{name:<12} {mode:<7} {statistics.median(samples):>10.1f} {p95:>8.1f}")
+    finally:
+        daemon.terminate()
+        daemon.wait()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
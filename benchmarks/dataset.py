@@ -0,0 +1,219 @@
+"""Deterministic synthetic datasets for the benchmark suite.
+
+`generate()` fills a fresh database with jobs, notes, resumes, cover letters and
+their tags. The same seed and size always produce the same rows (IDs, timestamps,
+text), so results from different commits are measured against identical data.
+Rows are written with Core bulk inserts; the migration triggers fill in status
+events, status counts and the search index exactly as the CLI would.
+
+A small manifest (sizes plus IDs the benchmark commands operate on) is written
+next to the database, and `ensure()` reuses a cached database when the seed,
+size, generator version and schema version all match.
+
+Usage: python benchmarks/dataset.py --scale 10k --out /tmp/jobs-10k.db [--seed N]
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from jobtracker import db as dbmod
+from jobtracker.enums import JobStatus
+from jobtracker.migrations import SCHEMA_VERSION
+from jobtracker.models import CoverLetter, Job, Note, Resume, Tag, cover_letter_tags, resume_tags
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SEED = 1
+# Bump whenever the generated rows change, so cached datasets are rebuilt.
+GENERATOR_VERSION = 1
+
+CHUNK = 10_000
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SPAN_SECONDS = 2 * 365 * 24 * 3600
+# Resumes no job refers to, so `resume remove` can be timed repeatedly.
+SPARE_RESUMES = 25
+# A word present in about 2% of notes, for timing `search`.
+SEARCH_TERM = "sponsorship"
+
+STATUS_WEIGHTS = {
+    JobStatus.APPLIED: 40,
+    JobStatus.RECRUITER: 8,
+    JobStatus.VIDEO_INTERVIEW: 5,
+    JobStatus.FIRST: 5,
+    JobStatus.SECOND: 3,
+    JobStatus.FINAL: 2,
+    JobStatus.OFFER: 1,
+    JobStatus.REJECTED: 20,
+    JobStatus.GHOSTED: 16,
+}
+SOURCES = ["LinkedIn", "Referral", "Company site", "Indeed", "Recruiter", "Hacker News", None]
+LOCATIONS = ["Remote", "New York, NY", "Berlin", "London", "San Francisco, CA", "Toronto", "Hybrid", None]
+TITLES = ["Backend Engineer", "Data Engineer", "Staff Engineer", "SRE", "Frontend Developer", "ML Engineer"]
+TAGS = ["python", "go", "backend", "frontend", "data", "ml", "devops", "sql", "remote", "senior", "lead", "cloud"]
+WORDS = (
+    "recruiter called about the role team uses python and postgres interview loop next week "
+    "asked about salary expectations manager seemed friendly follow up on take home exercise "
+    "remote first culture on call rotation benefits equity visa relocation timeline feedback"
+).split()
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _when(rng: random.Random) -> datetime:
+    return BASE_TIME + timedelta(seconds=rng.randrange(SPAN_SECONDS))
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(6, 24))
+    if rng.random() < 0.02:
+        words.insert(rng.randrange(len(words)), SEARCH_TERM)
+    return " ".join(words).capitalize() + "."
+
+
+def _catalog(conn, rng: random.Random, model, links, count: int, prefix: str) -> list[str]:
+    """Insert `count` resumes or cover letters with 1-3 tags each; return their IDs."""
+    rows, link_rows = [], []
+    owner = links.c[f"{model.__tablename__[:-1]}_id"].name
+    for i in range(count):
+        tags = rng.sample(range(len(TAGS)), k=rng.randint(1, 3))
+        row_id = _uuid(rng)
+        rows.append(
+            {
+                "id": row_id,
+                "name": f"{prefix} {i + 1}",
+                "tags": ", ".join(TAGS[t] for t in tags),
+                "file_path": f"/data/{prefix.lower().replace(' ', '_')}_{i + 1}.pdf",
+                "created_at": _when(rng),
+            }
+        )
+        link_rows.extend({owner: row_id, "tag_id": t + 1} for t in tags)
+    conn.execute(insert(model), rows)
+    conn.execute(insert(links), link_rows)
+    return [r["id"] for r in rows]
+
+
+def _job(rng: random.Random, companies: list[str], resumes: list[str], letters: list[str]) -> dict:
+    created = _when(rng)
+    low = rng.randrange(60, 200) * 1000
+    salary = rng.random() < 0.7
+    return {
+        "id": _uuid(rng),
+        "company": rng.choice(companies),
+        "title": rng.choice(TITLES),
+        "location": rng.choice(LOCATIONS),
+        "salary_range": f"${low:,} - ${low + 30000:,}" if salary else None,
+        "salary_min": low if salary else None,
+        "salary_max": low + 30000 if salary else None,
+        "job_url": f"https://jobs.example.com/{rng.getrandbits(40):x}",
+        "source": rng.choice(SOURCES),
+        "status": rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0],
+        "applied_date": created,
+        "created_at": created,
+        "last_updated": created + timedelta(days=rng.randrange(60)),
+        "resume_id": rng.choice(resumes) if rng.random() < 0.8 else None,
+        "cover_letter_id": rng.choice(letters) if rng.random() < 0.5 else None,
+    }
+
+
+def _notes(rng: random.Random, job: dict) -> list[dict]:
+    return [
+        {
+            "id": _uuid(rng),
+            "job_id": job["id"],
+            "content": " ".join(_sentence(rng) for _ in range(rng.randint(1, 3))),
+            "created_at": job["created_at"] + timedelta(hours=rng.randrange(1, 24 * 30)),
+        }
+        for _ in range(rng.choice((0, 0, 1, 1, 2, 3, 5)))
+    ]
+
+
+def generate(path: Path, jobs: int, seed: int = DEFAULT_SEED) -> dict:
+    """Create a database of `jobs` synthetic jobs at `path` and return its manifest."""
+    path = Path(path)
+    for stale in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        stale.unlink(missing_ok=True)
+    rng = random.Random(seed)
+    engine = dbmod.make_engine(path, profile="bulk-load")
+    dbmod.init_db(engine)
+
+    companies = [f"Company {i:05d}" for i in range(max(10, jobs // 20))]
+    used = max(10, jobs // 500)
+    busiest, most_notes, notes_total = None, -1, 0
+    with engine.begin() as conn:
+        conn.execute(insert(Tag), [{"id": i + 1, "name": name} for i, name in enumerate(TAGS)])
+        resumes = _catalog(conn, rng, Resume, resume_tags, used + SPARE_RESUMES, "Resume")
+        letters = _catalog(conn, rng, CoverLetter, cover_letter_tags, used, "Cover letter")
+        for start in range(0, jobs, CHUNK):
+            job_rows = [_job(rng, companies, resumes[:used], letters) for _ in range(min(CHUNK, jobs - start))]
+            note_rows = []
+            for job in job_rows:
+                notes = _notes(rng, job)
+                if len(notes) > most_notes:
+                    busiest, most_notes = job["id"], len(notes)
+                note_rows.extend(notes)
+            conn.execute(insert(Job), job_rows)
+            if note_rows:
+                conn.execute(insert(Note), note_rows)
+            notes_total += len(note_rows)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    engine.dispose()
+
+    manifest = {
+        "generator_version": GENERATOR_VERSION,
+        "schema_version": SCHEMA_VERSION,
+        "seed": seed,
+        "jobs": jobs,
+        "notes": notes_total,
+        "resumes": len(resumes),
+        "cover_letters": len(letters),
+        "job_id": busiest,
+        "resume_id": resumes[0],
+        "cover_letter_id": letters[0],
+        "spare_resume_ids": resumes[used:],
+        "search_term": SEARCH_TERM,
+    }
+    _manifest_path(path).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def _manifest_path(path: Path) -> Path:
+    return path.with_suffix(".manifest.json")
+
+
+def ensure(path: Path, jobs: int, seed: int = DEFAULT_SEED) -> dict:
+    """Return the manifest of a matching cached dataset at `path`, generating it if needed."""
+    path = Path(path)
+    try:
+        manifest = json.loads(_manifest_path(path).read_text())
+    except (OSError, ValueError):
+        manifest = None
+    expected = {"generator_version": GENERATOR_VERSION, "schema_version": SCHEMA_VERSION, "seed": seed, "jobs": jobs}
+    if path.exists() and manifest and all(manifest.get(k) == v for k, v in expected.items()):
+        return manifest
+    return generate(path, jobs, seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="10k")
+    parser.add_argument("--out", type=Path, required=True, help="database file to create (overwritten)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    manifest = generate(args.out, SCALES[args.scale], args.seed)
+    print(
+        f"{args.out}: {manifest['jobs']} jobs, {manifest['notes']} notes, "
+        f"{manifest['resumes']} resumes, {manifest['cover_letters']} cover letters"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Import-time benchmark for the `jobtracker` CLI entry point.
+
+Runs ``python -X importtime`` against the entry point and reports the total
+cumulative import time plus the slowest top-level imports. Exits non-zero when a
+heavy library is imported just to build the CLI, so regressions in the lazy
+command registry show up in CI logs.
+
+Usage: python benchmarks/import_time.py [--runs N] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINT = "import jobtracker.cli.main"
+HEAVY_MODULES = ("sqlalchemy", "pydantic", "rich", "jobtracker.db", "jobtracker.models")
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Return {module: cumulative_us} for every line of ``-X importtime`` output."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def measure(statement: str = ENTRY_POINT) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    totals = [times["jobtracker.cli.main"] for times in runs]
+    print(f"jobtracker.cli.main cumulative import: median {statistics.median(totals) / 1000:.1f} ms")
+
+    last = runs[-1]
+    print(f"\nSlowest imports (last run, top {args.top}):")
+    for name, us in sorted(last.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    heavy = [name for name in last if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES]
+    if heavy:
+        print(f"\nHeavy modules imported at startup: {', '.join(sorted(heavy))}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
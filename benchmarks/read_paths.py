@@ -0,0 +1,100 @@
+"""Read-path benchmark: ORM instances vs read-model tuples for the job list.
+
+Seeds a temporary database with N jobs, then reads the whole job list once as ORM
+`Job` instances (the old list path) and once as `read_models.JobRow` tuples built
+from the `queries.job_list_select` projection. Reports rows/sec from an untraced
+pass and the memory retained per row from a separate tracemalloc pass.
+
+Usage: python benchmarks/read_paths.py [--jobs N] [--repeat N]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from jobtracker import db as dbmod
+from jobtracker.enums import JobStatus
+from jobtracker.models import Job
+from jobtracker.queries import job_list_select
+from jobtracker.read_models import JobRow, fetch_rows
+
+
+def _seed(engine, jobs: int) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": f"{i:032x}",
+            "company": f"Company {i % 500}",
+            "title": "Engineer",
+            "status": JobStatus.APPLIED,
+            "source": "LinkedIn",
+            "applied_date": now,
+            "created_at": now,
+            "last_updated": now,
+            "salary_range": "$100,000 - $120,000",
+            "location": "Remote",
+            "job_url": f"https://example.com/jobs/{i}",
+        }
+        for i in range(jobs)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Job), rows)
+
+
+def read_orm(session) -> list:
+    return session.query(Job).order_by(Job.created_at.desc()).all()
+
+
+def read_model(session) -> list:
+    return list(fetch_rows(session, job_list_select(), JobRow))
+
+
+def measure(engine, reader, repeat: int) -> dict:
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            rows = reader(session)
+            best = min(best, time.perf_counter() - start)
+    with Session(engine) as session:
+        tracemalloc.start()
+        rows = reader(session)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "rows": len(rows),
+        "rows_per_sec": len(rows) / best if best else 0.0,
+        "bytes_per_row": retained / len(rows) if rows else 0.0,
+        "peak_per_row": peak / len(rows) if rows else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per reader (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = dbmod.make_engine(Path(tmp) / "bench.db")
+        dbmod.init_db(engine)
+        _seed(engine, args.jobs)
+
+        print(f"{'reader':<12} {'rows':>8} {'rows/sec':>10} {'B/row':>7} {'peak B/row':>11}")
+        for name, reader in (("orm", read_orm), ("read-model", read_model)):
+            r = measure(engine, reader, args.repeat)
+            print(
+                f"{name:<12} {r['rows']:>8} {r['rows_per_sec']:>10.0f} "
+                f"{r['bytes_per_row']:>7.0f} {r['peak_per_row']:>11.0f}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Hot/cold split: closed applications move to a separate archive database.
+
+Rejected and ghosted jobs pile up and are rarely looked at again, yet every
+pipeline query scans their index entries and pages. `archive_jobs` copies closed
+jobs, their notes and their status history into the archive file, commits, and
+then deletes the archived jobs from the main database. The main file's triggers
+then drop their search documents, status events and status counts.
+
+The two steps are separate transactions because SQLite does not commit ATTACHed
+WAL databases atomically together. A run interrupted between them leaves jobs in
+both files, never in neither: the copy replaces whatever an earlier run archived
+for the same jobs, and the delete only removes jobs present in the archive, so
+running `archive_jobs` again completes the move.
+
+The archive is a plain SQLite file next to the database (`jobtracker-archive.db`
+beside `jobtracker.db`, or `$JOBTRACKER_ARCHIVE_DB`). It is only opened on
+request: `attach_archive` ATTACHes it as schema `archive` and creates the TEMP
+views `all_jobs` / `all_notes` (UNION ALL of the live and archived rows), which
+`--include-archived` reads through `ALL_JOBS` / `ALL_NOTES`. Archived rows are
+read-only and not part of full-text search or `stats`.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Column, Index, MetaData, Table, delete, func, insert, select
+from sqlalchemy.orm import aliased
+
+from jobtracker.enums import JobStatus
+from jobtracker.models import Job, Note, StatusEvent
+
+ARCHIVE_SCHEMA = "archive"
+CLOSED_STATUSES = (JobStatus.REJECTED, JobStatus.GHOSTED)
+DEFAULT_AGE = timedelta(days=180)
+
+
+class ArchiveError(RuntimeError):
+    """Raised when the archive database cannot be used."""
+
+
+class ArchiveResult(NamedTuple):
+    jobs: int
+    notes: int
+
+
+def _copy(table: Table, metadata: MetaData, name: Optional[str] = None, schema: Optional[str] = None) -> Table:
+    """The columns of `table` without its foreign keys (they cannot span databases)."""
+    columns = (Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable) for c in table.c)
+    return Table(name or table.name, metadata, *columns, schema=schema)
+
+
+# Tables inside the archive file
+archive_metadata = MetaData()
+archived_jobs = _copy(Job.__table__, archive_metadata, schema=ARCHIVE_SCHEMA)
+archived_notes = _copy(Note.__table__, archive_metadata, schema=ARCHIVE_SCHEMA)
+archived_status_events = _copy(StatusEvent.__table__, archive_metadata, schema=ARCHIVE_SCHEMA)
+Index("ix_archive_jobs_created_at_id", archived_jobs.c.created_at, archived_jobs.c.id)
+Index("ix_archive_jobs_status", archived_jobs.c.status)
+Index("ix_archive_notes_job_id_created_at", archived_notes.c.job_id, archived_notes.c.created_at)
+Index("ix_archive_status_events_job_id", archived_status_events.c.job_id, archived_status_events.c.changed_at)
+
+# The TEMP views over live and archived rows, mapped like `Job` / `Note` for the query builders
+_view_metadata = MetaData()
+ALL_JOBS = aliased(Job, _copy(Job.__table__, _view_metadata, "all_jobs"), adapt_on_names=True)
+ALL_NOTES = aliased(Note, _copy(Note.__table__, _view_metadata, "all_notes"), adapt_on_names=True)
+
+
+def _view_ddl(name: str, table: Table) -> str:
+    columns = ", ".join(c.name for c in table.c)
+    return (
+        f"CREATE TEMP VIEW IF NOT EXISTS {name} AS SELECT {columns} FROM main.{table.name} "
+        f"UNION ALL SELECT {columns} FROM {ARCHIVE_SCHEMA}.{table.name}"
+    )
+
+
+_VIEWS_DDL = (_view_ddl("all_jobs", Job.__table__), _view_ddl("all_notes", Note.__table__))
+
+
+def archive_path(db) -> Path:
+    """The archive file for the database behind session `db`."""
+    if os.environ.get("JOBTRACKER_ARCHIVE_DB"):
+        return Path(os.environ["JOBTRACKER_ARCHIVE_DB"])
+    database = db.get_bind().engine.url.database
+    if not database or database == ":memory:":
+        raise ArchiveError("An in-memory database has no archive file; set JOBTRACKER_ARCHIVE_DB")
+    path = Path(database)
+    return path.with_name(f"{path.stem}-archive{path.suffix}")
+
+
+def _add_missing_columns(conn) -> None:
+    """Give archive tables the columns migrations added to the live tables since they were created."""
+    for table in archive_metadata.tables.values():
+        existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA {ARCHIVE_SCHEMA}.table_info({table.name})")}
+        for column in table.c:
+            if existing and column.name not in existing:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {ARCHIVE_SCHEMA}.{table.name} ADD COLUMN {column.name} {column_type}"
+                )
+
+
+def attach_archive(db, create: bool = False) -> bool:
+    """ATTACH the archive to the connection of session `db` and create the `all_*` views.
+
+    Returns False, attaching nothing, when there is no archive file yet and `create`
+    is false. Must run before the session starts writing: SQLite cannot ATTACH
+    inside a transaction.
+    """
+    path = archive_path(db)
+    conn = db.connection()
+    attached = {row[1] for row in conn.exec_driver_sql("PRAGMA database_list")}
+    if ARCHIVE_SCHEMA not in attached:
+        if not create and not path.exists():
+            return False
+        conn.exec_driver_sql(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (str(path),))
+    if create:
+        archive_metadata.create_all(conn)
+    _add_missing_columns(conn)
+    for ddl in _VIEWS_DDL:
+        conn.exec_driver_sql(ddl)
+    return True
+
+
+def job_sources(db, include_archived: bool = False) -> tuple:
+    """The `(jobs, notes)` entities to read: the live tables, or with `include_archived`
+    the `all_*` views over live and archived rows (when there is an archive)."""
+    if include_archived and attach_archive(db):
+        return ALL_JOBS, ALL_NOTES
+    return Job, Note
+
+
+def _closed_jobs(older_than: timedelta):
+    cutoff = datetime.now(timezone.utc) - older_than
+    return select(Job.id).where(Job.status.in_(CLOSED_STATUSES), Job.last_updated < cutoff)
+
+
+def count_archivable(db, older_than: timedelta = DEFAULT_AGE) -> ArchiveResult:
+    """Jobs (and their notes) that `archive_jobs` would move."""
+    selected = _closed_jobs(older_than)
+    jobs = db.scalar(select(func.count()).select_from(selected.subquery()))
+    notes = db.scalar(select(func.count()).select_from(Note).where(Note.job_id.in_(selected)))
+    return ArchiveResult(jobs, notes)
+
+
+def archive_jobs(db, older_than: timedelta = DEFAULT_AGE) -> ArchiveResult:
+    """Move closed jobs not updated for `older_than`, with notes and history, to the archive."""
+    attach_archive(db, create=True)
+    selected = _closed_jobs(older_than)
+    # Copies left by an interrupted run are replaced, so the archive gets the current rows.
+    for table, column in (
+        (archived_status_events, archived_status_events.c.job_id),
+        (archived_notes, archived_notes.c.job_id),
+        (archived_jobs, archived_jobs.c.id),
+    ):
+        db.execute(delete(table).where(column.in_(selected)))
+    jobs = db.execute(
+        insert(archived_jobs).from_select(
+            list(Job.__table__.c.keys()), select(Job.__table__).where(Job.id.in_(selected))
+        )
+    ).rowcount
+    notes = db.execute(
+        insert(archived_notes).from_select(
+            list(Note.__table__.c.keys()), select(Note.__table__).where(Note.job_id.in_(selected))
+        )
+    ).rowcount
+    # Event IDs are rowids the main file may reuse, so the archive numbers its own.
+    event_columns = [c for c in StatusEvent.__table__.c if c.name != "id"]
+    db.execute(
+        insert(archived_status_events).from_select(
+            [c.name for c in event_columns], select(*event_columns).where(StatusEvent.job_id.in_(selected))
+        )
+    )
+    db.commit()
+
+    # The session may hand out another pooled connection for the second transaction.
+    attach_archive(db)
+    moved = select(archived_jobs.c.id).where(archived_jobs.c.id.in_(selected))
+    # Notes are deleted explicitly: their ON DELETE CASCADE needs foreign keys enabled on
+    # this connection. Search documents and status events go with them (triggers).
+    db.execute(delete(Note).where(Note.job_id.in_(moved)), execution_options={"synchronize_session": False})
+    db.execute(delete(Job).where(Job.id.in_(moved)), execution_options={"synchronize_session": False})
+    db.commit()
+    return ArchiveResult(jobs, notes)
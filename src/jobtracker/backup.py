@@ -0,0 +1,277 @@
+"""Online, compressed backups of the SQLite database, and restores from them.
+
+A backup copies the live database with SQLite's online backup API, `STEP_PAGES`
+pages per step. In WAL mode (what every writing engine profile uses) the copy runs
+inside one read transaction: it is a consistent point-in-time snapshot and writers
+keep committing meanwhile. In rollback-journal mode the read lock is released
+between steps so waiting writers get in, and SQLite restarts the copy when they
+changed the database.
+
+The snapshot is written to a temporary file in the backup directory, streamed
+through gzip or zstd (with the optional `zstandard` package) and renamed into
+place, so an interrupted backup never looks like a finished one. Making a backup
+therefore needs free space for one uncompressed copy of the database.
+"""
+
+import enum
+import gzip
+import importlib.util
+import os
+import re
+import shutil
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from jobtracker.db import APP_DIR
+
+BACKUP_DIR = Path(os.environ.get("JOBTRACKER_BACKUP_DIR", APP_DIR / "backups"))
+# Pages copied per backup step (4 MiB with SQLite's default 4 KiB pages).
+STEP_PAGES = 1024
+# Pause between steps in rollback-journal mode, so waiting writers can commit.
+STEP_PAUSE = 0.005
+# Backups kept by rotation, newest first.
+DEFAULT_KEEP = 7
+CHUNK_SIZE = 1 << 20
+# gzip -1 compresses ~3x faster than -6 for ~13% larger archives; zstd beats both.
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+
+class Compression(str, enum.Enum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    NONE = "none"
+
+
+SUFFIXES = {Compression.GZIP: ".gz", Compression.ZSTD: ".zst", Compression.NONE: ""}
+# jobtracker-20261017T093000Z.db.gz; a -N counter separates backups made in the same second.
+_NAME_RE = re.compile(r"^jobtracker-(\d{8}T\d{6}Z)(?:-(\d+))?\.db(\.gz|\.zst)?$")
+
+
+class BackupError(RuntimeError):
+    """Raised when a backup cannot be made or an archive cannot be restored."""
+
+
+class BackupResult(NamedTuple):
+    path: Path
+    pages: int
+    database_bytes: int
+    archive_bytes: int
+    seconds: float
+    removed: list[Path]
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise BackupError("zstd compression needs the zstandard package (pip install 'jobtracker[zstd]')") from None
+    return zstandard
+
+
+def default_compression() -> Compression:
+    """zstd when `zstandard` is installed, else gzip."""
+    return Compression.ZSTD if importlib.util.find_spec("zstandard") else Compression.GZIP
+
+
+def compression_of(path: Path) -> Compression:
+    return next((c for c, suffix in SUFFIXES.items() if suffix and path.name.endswith(suffix)), Compression.NONE)
+
+
+@contextmanager
+def _compressing(raw, compression: Compression):
+    if compression is Compression.GZIP:
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=GZIP_LEVEL, mtime=0) as out:
+            yield out
+    elif compression is Compression.ZSTD:
+        cctx = _zstandard().ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+        with cctx.stream_writer(raw, closefd=False) as out:
+            yield out
+    else:
+        yield raw
+
+
+@contextmanager
+def _decompressing(path: Path):
+    compression = compression_of(path)
+    with open(path, "rb") as raw:
+        if compression is Compression.GZIP:
+            with gzip.GzipFile(fileobj=raw, mode="rb") as src:
+                yield src
+        elif compression is Compression.ZSTD:
+            with _zstandard().ZstdDecompressor().stream_reader(raw, closefd=False) as src:
+                yield src
+        else:
+            yield raw
+
+
+def _remove(path: Path) -> None:
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+
+def _sort_key(path: Path) -> tuple[str, int]:
+    match = _NAME_RE.match(path.name)
+    return match.group(1), int(match.group(2) or 0)
+
+
+def list_backups(directory: Path = BACKUP_DIR) -> list[Path]:
+    """Backups in `directory`, newest first."""
+    if not directory.is_dir():
+        return []
+    return sorted((p for p in directory.iterdir() if _NAME_RE.match(p.name)), key=_sort_key, reverse=True)
+
+
+def prune(directory: Path = BACKUP_DIR, keep: int = DEFAULT_KEEP) -> list[Path]:
+    """Delete all but the newest `keep` backups (0 keeps all); returns the deleted paths."""
+    removed = list_backups(directory)[keep:] if keep else []
+    for path in removed:
+        path.unlink()
+    return removed
+
+
+def _archive_path(directory: Path, compression: Compression) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    taken = {_sort_key(p) for p in list_backups(directory)}
+    n = 0
+    while (stamp, n) in taken:
+        n += 1
+    return directory / f"jobtracker-{stamp}{f'-{n}' if n else ''}.db{SUFFIXES[compression]}"
+
+
+def snapshot(
+    db_path: Path,
+    dest: Path,
+    step_pages: int = STEP_PAGES,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """Copy the database at `db_path` to the new file `dest`; returns the number of pages.
+
+    `progress(copied, total)` is called after every step.
+    """
+    if not Path(db_path).is_file():
+        raise BackupError(f"No database at {db_path}")
+    with closing(sqlite3.connect(db_path, isolation_level=None)) as src, closing(sqlite3.connect(dest)) as dst:
+        src.execute("PRAGMA busy_timeout = 5000")
+        wal = src.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        if wal:
+            # Reading inside BEGIN pins the snapshot for every step of the copy.
+            src.execute("BEGIN")
+            src.execute("SELECT count(*) FROM sqlite_master").fetchone()
+        total = 0
+
+        def step(status, remaining, pages):
+            nonlocal total
+            total = pages
+            if progress:
+                progress(pages - remaining, pages)
+            if not wal:
+                time.sleep(STEP_PAUSE)
+
+        try:
+            src.backup(dst, pages=step_pages, progress=step)
+        finally:
+            if wal:
+                src.execute("COMMIT")
+        # A self-contained file: the copy keeps no -wal of its own.
+        dst.execute("PRAGMA journal_mode = DELETE")
+    return total
+
+
+def create_backup(
+    db_path: Path,
+    directory: Path = BACKUP_DIR,
+    compression: Optional[Compression] = None,
+    keep: int = DEFAULT_KEEP,
+    step_pages: int = STEP_PAGES,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> BackupResult:
+    """Back up the database at `db_path` into `directory`, then rotate old backups."""
+    compression = compression or default_compression()
+    if compression is Compression.ZSTD:
+        _zstandard()  # fail before copying anything
+    start = time.perf_counter()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = _archive_path(directory, compression)
+    copy = directory / f".{path.name}.snapshot"
+    part = directory / f".{path.name}.part"
+    try:
+        pages = snapshot(db_path, part if compression is Compression.NONE else copy, step_pages, progress)
+        if compression is not Compression.NONE:
+            with open(copy, "rb") as src, open(part, "wb") as raw:
+                with _compressing(raw, compression) as out:
+                    shutil.copyfileobj(src, out, CHUNK_SIZE)
+                raw.flush()
+                os.fsync(raw.fileno())
+        database_bytes = (part if compression is Compression.NONE else copy).stat().st_size
+        os.replace(part, path)
+    finally:
+        _remove(copy)
+        _remove(part)
+    removed = prune(directory, keep)
+    return BackupResult(path, pages, database_bytes, path.stat().st_size, time.perf_counter() - start, removed)
+
+
+def _catalog_versions(conn) -> dict:
+    try:
+        return dict(conn.execute("SELECT name, version FROM catalog_versions"))
+    except sqlite3.OperationalError:  # a database from before the catalog counters
+        return {}
+
+
+def _bump_catalog_versions(conn, before: dict) -> None:
+    """Move each catalog counter past both its restored and its pre-restore value.
+
+    Caches in other processes (`jobtracker daemon`) only reload a listing when its
+    counter changes, and the restored counter may equal the one they cached.
+    """
+    with conn:
+        for name, version in _catalog_versions(conn).items():
+            conn.execute(
+                "UPDATE catalog_versions SET version = ? WHERE name = ?", (max(version, before.get(name, 0)) + 1, name)
+            )
+
+
+def restore_backup(archive: Path, db_path: Path) -> int:
+    """Replace the contents of the database at `db_path` with the backup `archive`.
+
+    The archive is decompressed next to the database and checked with
+    `PRAGMA quick_check` first. The database is then overwritten through the backup
+    API in one transaction, so connections that are open elsewhere see either the
+    old or the restored contents. The catalog counters are then bumped, so cached
+    resume and cover letter listings reload. Returns the number of pages restored.
+    """
+    if not archive.is_file():
+        raise BackupError(f"No backup at {archive}")
+    staged = Path(f"{db_path}.restore")
+    read_errors = (OSError, EOFError)
+    if compression_of(archive) is Compression.ZSTD:
+        read_errors += (_zstandard().ZstdError,)
+    try:
+        with _decompressing(archive) as src, open(staged, "wb") as out:
+            shutil.copyfileobj(src, out, CHUNK_SIZE)
+        with closing(sqlite3.connect(staged)) as restored:
+            try:
+                check = restored.execute("PRAGMA quick_check").fetchone()[0]
+            except sqlite3.DatabaseError as exc:
+                check = str(exc)
+            if check != "ok":
+                raise BackupError(f"{archive} is not a usable backup: {check}")
+            with closing(sqlite3.connect(db_path)) as live:
+                live.execute("PRAGMA busy_timeout = 30000")
+                pages = restored.execute("PRAGMA page_count").fetchone()[0]
+                before = _catalog_versions(live)
+                try:
+                    restored.backup(live)
+                    _bump_catalog_versions(live, before)
+                except sqlite3.Error as exc:
+                    raise BackupError(f"Could not restore into {db_path}: {exc}") from exc
+    except read_errors as exc:
+        raise BackupError(f"Could not read {archive}: {exc}") from exc
+    finally:
+        _remove(staged)
+    return pages
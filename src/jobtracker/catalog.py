@@ -0,0 +1,133 @@
+"""Cached `(id, name, tags)` listings of resumes and cover letters for the job pickers.
+
+The cache lives as long as the process, so it only pays off in long-lived ones
+(`jobtracker daemon`, `jobtracker shell`). Each use reads the table's counter from
+`catalog_versions`, which triggers bump on every change, and reloads when it moved.
+
+`catalog_index` adds a trigram index over each entry's name and tags, built once
+per loaded listing, so pickers can filter thousands of variants as the user types.
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+
+from jobtracker import db as dbmod
+from jobtracker.models import CatalogVersion
+
+
+class CatalogEntry(NamedTuple):
+    id: str
+    name: str
+    tags: str
+
+
+# (engine, table name) -> (version, entries newest first)
+_cache: dict = {}
+# (engine, table name) -> CatalogIndex over the entries last returned for it
+_indexes: dict = {}
+
+
+def _cached_entries(db, model) -> tuple:
+    """`(version, entries)`: the table's current counter, and its cached listing if still current."""
+    table = model.__tablename__
+    version = db.execute(select(CatalogVersion.version).where(CatalogVersion.name == table)).scalar()
+    cached = _cache.get((db.get_bind().engine, table))
+    if cached is not None and version is not None and cached[0] == version:
+        return version, cached[1]
+    return version, None
+
+
+def catalog_entries(db, model) -> list[CatalogEntry]:
+    """`(id, name)` of every `Resume` or `CoverLetter`, newest first."""
+    version, entries = _cached_entries(db, model)
+    if entries is not None:
+        return entries
+    stmt = select(model.id, model.name, model.tags).order_by(model.created_at.desc())
+    entries = [CatalogEntry(id, name or "", tags or "") for id, name, tags in db.execute(stmt)]
+    # Inside a shared transaction the counter may still be rolled back to a value
+    # that a different change reuses later, so only cache committed state.
+    if version is not None and dbmod._shared_connection is None:
+        _cache[(db.get_bind().engine, model.__tablename__)] = (version, entries)
+    return entries
+
+
+def clear_cache() -> None:
+    """Forget every cached listing, e.g. after the database file was replaced."""
+    _cache.clear()
+    _indexes.clear()
+
+
+def catalog_name(db, model, row_id: str) -> Optional[str]:
+    """Name of the `Resume` or `CoverLetter` with ID `row_id`, or None.
+
+    Looks in the cached listing when it is current; otherwise reads just that row,
+    rather than loading the whole listing for one name.
+    """
+    _, entries = _cached_entries(db, model)
+    if entries is not None:
+        return next((entry.name for entry in entries if entry.id == row_id), None)
+    row = db.execute(select(model.name).where(model.id == row_id)).first()
+    return None if row is None else row.name or ""
+
+
+# A search term matches an entry when at least this share of its trigrams occur in
+# the entry's name or tags; below 1.0 this tolerates typos.
+MATCH_THRESHOLD = 0.6
+_WORD = re.compile(r"\w+")
+
+
+def _trigrams(word: str, whole: bool = True) -> set[str]:
+    """Trigrams of `word` padded like pg_trgm: two spaces before, one after.
+
+    Search terms are not padded at the end (`whole=False`), so a term's trigrams are
+    all found in any word it prefixes: "ba" matches "backend".
+    """
+    padded = f"  {word} " if whole else f"  {word}"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class CatalogIndex:
+    """Trigram index over the names and tags of catalog entries."""
+
+    def __init__(self, entries: list[CatalogEntry]):
+        self.entries = entries
+        self.postings = defaultdict(list)  # trigram -> positions in `entries`, ascending
+        word_grams = {}  # names and tags of variants share most of their words
+        for pos, entry in enumerate(entries):
+            grams = set()
+            for word in set(_WORD.findall(f"{entry.name} {entry.tags}".lower())):
+                if word not in word_grams:
+                    word_grams[word] = _trigrams(word)
+                grams |= word_grams[word]
+            for gram in grams:
+                self.postings[gram].append(pos)
+
+    def search(self, query: str, limit: int = 10) -> list[CatalogEntry]:
+        """Entries matching every word of `query`, best matches first, newest first among equals."""
+        scores = None
+        for term in _WORD.findall(query.lower()):
+            grams = _trigrams(term, whole=False)
+            shared = Counter(pos for gram in grams for pos in self.postings.get(gram, ()))
+            needed = MATCH_THRESHOLD * len(grams)
+            term_scores = {pos: count / len(grams) for pos, count in shared.items() if count >= needed}
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {pos: score + term_scores[pos] for pos, score in scores.items() if pos in term_scores}
+        if scores is None:
+            return self.entries[:limit]
+        ranked = sorted(scores, key=lambda pos: (-scores[pos], pos))
+        return [self.entries[pos] for pos in ranked[:limit]]
+
+
+def catalog_index(db, model) -> CatalogIndex:
+    """`CatalogIndex` over `catalog_entries(db, model)`, rebuilt only when those reload."""
+    entries = catalog_entries(db, model)
+    key = (db.get_bind().engine, model.__tablename__)
+    index = _indexes.get(key)
+    if index is None or index.entries is not entries:
+        index = _indexes[key] = CatalogIndex(entries)
+    return index
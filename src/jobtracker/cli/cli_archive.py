@@ -0,0 +1,43 @@
+"""`jobtracker archive`: move closed applications into the archive database."""
+
+from datetime import timedelta
+
+import typer
+from rich.console import Console
+from sqlalchemy.exc import OperationalError
+
+from jobtracker.archive import DEFAULT_AGE, ArchiveError, archive_jobs, archive_path, count_archivable
+from jobtracker.cli.params import parse_age
+from jobtracker.db import get_db
+
+console = Console()
+archive_app = typer.Typer()
+
+
+@archive_app.command("archive")
+def archive(
+    older_than: timedelta = typer.Option(
+        f"{DEFAULT_AGE.days}d", parser=parse_age, metavar="AGE", help="Only jobs not updated for this long, e.g. 180d"
+    ),
+    dry_run: bool = typer.Option(False, help="Only count the jobs that would be archived"),
+    vacuum: bool = typer.Option(False, help="Afterwards rebuild the database file to return the freed space"),
+):
+    """Move rejected and ghosted jobs, with their notes and history, to the archive database
+
+    Archived jobs no longer appear in lists, stats or search; `job list` and
+    `note list` show them again with --include-archived.
+    """
+    with get_db() as db:
+        try:
+            path = archive_path(db)
+            if dry_run:
+                result = count_archivable(db, older_than)
+                console.print(f"Would archive [bold]{result.jobs}[/bold] job(s) and {result.notes} note(s) to {path}")
+                return
+            result = archive_jobs(db, older_than)
+        except (ArchiveError, OperationalError) as exc:
+            console.print(f"[red]Archive failed:[/red] {exc}")
+            raise typer.Exit(code=1)
+        console.print(f"Archived [bold]{result.jobs}[/bold] job(s) and {result.notes} note(s) to {path}")
+        if vacuum and result.jobs:
+            db.connection().exec_driver_sql("VACUUM main")
@@ -0,0 +1,116 @@
+"""`jobtracker backup` and `jobtracker restore`: compressed online backups with rotation."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from jobtracker import catalog
+from jobtracker import db as dbmod
+from jobtracker.backup import (
+    BACKUP_DIR,
+    DEFAULT_KEEP,
+    STEP_PAGES,
+    BackupError,
+    Compression,
+    create_backup,
+    list_backups,
+    restore_backup,
+)
+
+console = Console()
+backup_app = typer.Typer()
+restore_app = typer.Typer()
+
+
+def _database_path() -> Path:
+    """File of the application engine (follows `JOBTRACKER_DB`)."""
+    database = dbmod.SessionLocal.kw["bind"].url.database
+    if not database or database == ":memory:":
+        console.print("[red]The database is not a file; nothing to back up or restore.[/red]")
+        raise typer.Exit(code=1)
+    return Path(database)
+
+
+def _mib(size: int) -> str:
+    return f"{size / 1048576:.1f} MiB"
+
+
+def _print_backups(directory: Path) -> None:
+    backups = list_backups(directory)
+    if not backups:
+        console.print(f"No backups in {directory}")
+        return
+    table = Table(title=f"Backups in {directory}", title_justify="left", header_style="bold cyan")
+    table.add_column("File")
+    table.add_column("Size", justify="right")
+    table.add_column("Modified")
+    for path in backups:
+        stat = path.stat()
+        table.add_row(path.name, _mib(stat.st_size), datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"))
+    console.print(table)
+
+
+@backup_app.command("backup")
+def backup(
+    directory: Path = typer.Option(
+        BACKUP_DIR, "--dir", file_okay=False, envvar="JOBTRACKER_BACKUP_DIR", help="Directory holding the backups"
+    ),
+    compress: Optional[Compression] = typer.Option(
+        None, help="gzip, zstd (needs the zstandard package) or none \\[default: zstd when installed, else gzip]"
+    ),
+    keep: int = typer.Option(DEFAULT_KEEP, min=0, help="Backups kept in the directory, newest first; 0 keeps all"),
+    step_pages: int = typer.Option(STEP_PAGES, min=1, help="Pages copied per step of the online backup"),
+    list_only: bool = typer.Option(False, "--list", help="List the existing backups instead of making one"),
+):
+    """Back up the database while it is in use, compressed, keeping the newest --keep backups
+
+    The copy is a consistent snapshot taken with SQLite's online backup API; other
+    commands keep reading and writing while it runs.
+    """
+    if list_only:
+        _print_backups(directory)
+        return
+    try:
+        result = create_backup(_database_path(), directory, compress, keep, step_pages)
+    except (BackupError, OSError) as exc:
+        console.print(f"[red]Backup failed:[/red] {exc}")
+        raise typer.Exit(code=1)
+    console.print(
+        f"Backed up {_mib(result.database_bytes)} to [bold]{result.path}[/bold] "
+        f"({_mib(result.archive_bytes)}) in {result.seconds:.1f}s"
+    )
+    if result.removed:
+        console.print(f"[dim]Removed {len(result.removed)} old backup(s)[/dim]")
+
+
+@restore_app.command("restore")
+def restore(
+    archive: Optional[Path] = typer.Argument(None, dir_okay=False, help="Backup file \\[default: the newest backup]"),
+    directory: Path = typer.Option(
+        BACKUP_DIR, "--dir", file_okay=False, envvar="JOBTRACKER_BACKUP_DIR", help="Directory holding the backups"
+    ),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Restore without asking for confirmation"),
+):
+    """Replace the database with a backup made by `jobtracker backup`"""
+    if archive is None:
+        backups = list_backups(directory)
+        if not backups:
+            console.print(f"[red]No backups in {directory}[/red]")
+            raise typer.Exit(code=1)
+        archive = backups[0]
+    db_path = _database_path()
+    if not yes:
+        typer.confirm(f"Replace {db_path} with {archive.name}? Changes since the backup are lost", abort=True)
+    try:
+        pages = restore_backup(archive, db_path)
+    except BackupError as exc:
+        console.print(f"[red]Restore failed:[/red] {exc}")
+        raise typer.Exit(code=1)
+    # Bring an older backup up to the current schema and drop what this process cached.
+    dbmod.init_db(dbmod.SessionLocal.kw["bind"])
+    catalog.clear_cache()
+    console.print(f"Restored {pages} pages from [bold]{archive}[/bold]")
@@ -1,16 +1,21 @@
 import typer
 from typing import Optional
-from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
 from rich import box
 from jobtracker.db import get_db
+from jobtracker.cli.lookup import full_id
+from jobtracker.ids import short_ids
+from jobtracker.cli.output import OutputFormat, export_select
+from jobtracker.tags import tag_counts_select
+from jobtracker.queries import catalog_list_select
+from jobtracker.read_models import CatalogRow, TagCountRow, fetch_rows
 from jobtracker.models import CoverLetter
-from jobtracker.schemas import CoverLetterCreate
+from jobtracker.services import CoverLetterService, InUseError, NotFoundError
 from pydantic import ValidationError
 
 console = Console()
-cover_letter_app = typer.Typer(help="Manage cover letters: add, list, update, remove")
+cover_letter_app = typer.Typer(help="Manage cover letters: add, list, tags, update, remove")
 
 # use centralized `get_db` contextmanager
 
@@ -25,32 +30,31 @@ def add_cover_letter(
     tags: Optional[str] = typer.Option(None, prompt=True),
 ):
     """Add a cover letter to the catalog"""
-    # Validate inputs
-    try:
-        CoverLetterCreate(name=name, file_path=file_path, tags=tags)
-    except ValidationError as exc:
-        console.print(f"[red]Invalid input:[/red] {exc}")
-        raise typer.Exit(code=1)
-
     with get_db() as db:
-        cl = CoverLetter(name=name, file_path=file_path, tags=tags, created_at=datetime.now(timezone.utc))
         try:
-            db.add(cl)
-            db.commit()
-            db.refresh(cl)
-        except Exception:
-            db.rollback()
-            raise
+            cl = CoverLetterService(db).add(name, file_path, tags)
+        except ValidationError as exc:
+            console.print(f"[red]Invalid input:[/red] {exc}")
+            raise typer.Exit(code=1)
 
         console.print(f"Added cover letter [bold]{cl.name}[/bold]")
         console.print(f"ID: {cl.id}")
 
 
 @cover_letter_app.command("list")
-def list_cover_letters():
+def list_cover_letters(
+    tag: Optional[list[str]] = typer.Option(None, help="Only cover letters with this tag (repeatable; all must match)"),
+    any_tag: bool = typer.Option(False, "--any", help="Match any of the --tag values instead of all"),
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
     """List available cover letters"""
     with get_db() as db:
-        letters = db.query(CoverLetter).order_by(CoverLetter.created_at.desc()).all()
+        if fmt != OutputFormat.TABLE:
+            stmt = catalog_list_select(CoverLetter, raw=True, tags=tag or (), match_any=any_tag)
+            export_select(db, stmt, CatalogRow, fmt)
+            return
+        letters = list(fetch_rows(db, catalog_list_select(CoverLetter, tags=tag or (), match_any=any_tag), CatalogRow))
+        short = short_ids(db, CoverLetter, (cl.id for cl in letters))
         if not letters:
             console.print("No cover letters found.")
             return
@@ -61,7 +65,28 @@ def list_cover_letters():
     table.add_column("File Path")
     table.add_column("Created (UTC)")
     for cl in letters:
-        table.add_row(cl.id, cl.name, cl.tags or "-", cl.file_path, cl.created_at.strftime("%Y-%m-%d %H:%M:%S"))
+        table.add_row(short[cl.id], cl.name, cl.tags or "-", cl.file_path, cl.created_at.strftime("%Y-%m-%d %H:%M:%S"))
+    console.print(table)
+
+
+@cover_letter_app.command("tags")
+def cover_letter_tag_counts(
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
+    """Count cover letters per tag, most used first"""
+    with get_db() as db:
+        if fmt != OutputFormat.TABLE:
+            export_select(db, tag_counts_select(CoverLetter), TagCountRow, fmt)
+            return
+        counts = list(fetch_rows(db, tag_counts_select(CoverLetter), TagCountRow))
+    if not counts:
+        console.print("No tags found.")
+        return
+    table = Table(title="Cover Letter Tags", box=box.SQUARE, header_style="bold cyan")
+    table.add_column("Tag")
+    table.add_column("Cover Letters", justify="right")
+    for row in counts:
+        table.add_row(row.tag, str(row.count))
     console.print(table)
 
 
@@ -74,33 +99,18 @@ def update_cover_letter(
 ):
     """Update fields on an existing cover letter"""
     with get_db() as db:
-        cl = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
-        if not cl:
-            console.print(f"Cover letter ID {cover_letter_id} not found")
-            raise typer.Exit()
-        updated = False
-        if name is not None:
-            cl.name = name
-            updated = True
-        if tags is not None:
-            cl.tags = tags
-            updated = True
-        if file_path is not None:
-            try:
-                CoverLetterCreate(name=cl.name, file_path=file_path, tags=cl.tags)
-            except ValidationError as exc:
-                console.print(f"[red]Invalid file_path:[/red] {exc}")
-                raise typer.Exit(code=1)
-            cl.file_path = file_path
-            updated = True
-        if not updated:
+        cover_letter_id = full_id(db, CoverLetter, cover_letter_id, console)
+        if name is None and tags is None and file_path is None:
             console.print("No fields provided to update")
             raise typer.Exit()
         try:
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
+            cl = CoverLetterService(db).update(cover_letter_id, name=name, tags=tags, file_path=file_path)
+        except NotFoundError as exc:
+            console.print(str(exc))
+            raise typer.Exit()
+        except ValidationError as exc:
+            console.print(f"[red]Invalid file_path:[/red] {exc}")
+            raise typer.Exit(code=1)
         console.print(f"Updated cover letter [bold]{cl.name}[/bold]")
 
 
@@ -108,17 +118,10 @@ def update_cover_letter(
 def remove_cover_letter(cover_letter_id: str = typer.Argument(...)):
     """Remove a cover letter if it is not associated with any jobs"""
     with get_db() as db:
-        cl = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
-        if not cl:
-            console.print(f"Cover letter ID {cover_letter_id} not found")
-            raise typer.Exit()
-        if cl.jobs:
-            console.print(f"Cannot remove cover letter [bold]{cl.name}[/bold] (used by {len(cl.jobs)} job(s))")
-            raise typer.Exit()
+        cover_letter_id = full_id(db, CoverLetter, cover_letter_id, console)
         try:
-            db.delete(cl)
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
+            cl = CoverLetterService(db).remove(cover_letter_id)
+        except (NotFoundError, InUseError) as exc:
+            console.print(str(exc))
+            raise typer.Exit()
         console.print(f"Removed cover letter [bold]{cl.name}[/bold]")
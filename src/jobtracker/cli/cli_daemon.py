@@ -0,0 +1,307 @@
+"""`jobtracker daemon`: a warm process that runs commands forwarded by `jobtracker.cli.client`.
+
+The daemon imports every command module and opens the engine once, so forwarded
+commands skip interpreter start-up, imports and the schema check. The engine's
+connection pool and compiled-statement cache stay resident, as does the
+resume/cover letter catalog cache (`jobtracker.catalog`). Commands run one at a
+time, with the client's cwd and its stdin/stdout/stderr in place of the daemon's.
+"""
+
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager, suppress
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from jobtracker import db as dbmod
+from jobtracker.catalog import catalog_index
+from jobtracker.cli.client import FORWARDED_ENV, connect, daemon_supported, encode, read_message, socket_path
+from jobtracker.models import CoverLetter, Resume
+
+console = Console()
+daemon_app = typer.Typer(help="Warm background process serving commands: start, stop, status")
+
+LOG_PATH = dbmod.APP_DIR / "daemon.log"
+# Seconds a client may take to send its request (a command itself has no limit).
+CLIENT_TIMEOUT = 5.0
+_STOP = "stop"
+# True while a forwarded command runs; the hang-up watcher only interrupts then.
+_busy = False
+_stopping = False
+
+
+def _interrupt_command(signum, frame):
+    if _busy:
+        raise KeyboardInterrupt
+
+
+def _terminate(signum, frame):
+    global _stopping
+    _stopping = True
+    raise SystemExit(0)
+
+
+def _warm_up() -> None:
+    """Import and register every command module in the root group."""
+    from jobtracker.cli.main import LAZY_COMMANDS, import_times, root_command
+
+    root = root_command()
+    ctx = typer.Context(root)
+    for name in LAZY_COMMANDS:
+        root.get_command(ctx, name)
+    import_times.clear()  # paid once at start-up, not by the commands served
+
+
+def _listen(path: str) -> socket.socket:
+    with suppress(FileNotFoundError):
+        os.unlink(path)  # left behind by a daemon that did not shut down cleanly
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # only the owner may connect
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(old_umask)
+    listener.listen(16)
+    return listener
+
+
+@contextmanager
+def _client_stdio(fds: list[int]):
+    """Swap the process's stdin/stdout/stderr for the client's for the duration of a command."""
+    for stream in (sys.stdout, sys.stderr):
+        stream.flush()
+    saved_fds = [os.dup(n) for n in (0, 1, 2)]
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    try:
+        for n, fd in enumerate(fds):
+            os.dup2(fd, n)
+        # Fresh text streams so no buffered input or output crosses between clients.
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+        yield
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            with suppress(OSError, ValueError):
+                stream.flush()
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        for n, fd in enumerate(saved_fds):
+            os.dup2(fd, n)
+            os.close(fd)
+
+
+def _watch_hangup(conn: socket.socket, done: threading.Event, main_thread: int) -> None:
+    # The client sends nothing after "go", so its socket only turns readable when it
+    # hangs up (e.g. Ctrl-C); interrupt the command it was waiting for.
+    while not done.is_set():
+        readable, _, _ = select.select([conn], [], [], 0.2)
+        if readable:
+            if not done.is_set():
+                signal.pthread_kill(main_thread, signal.SIGUSR1)
+            return
+
+
+def _run_argv(argv: list[str]) -> int:
+    from jobtracker.cli.main import root_command
+
+    try:
+        root_command().main(args=argv, prog_name="jobtracker")
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        with suppress(OSError):
+            traceback.print_exc()
+        return 1
+    return 0
+
+
+def _run_for_client(conn: socket.socket, message: dict, fds: list[int]) -> int:
+    global _busy
+    done = threading.Event()
+    watcher = threading.Thread(target=_watch_hangup, args=(conn, done, threading.get_ident()), daemon=True)
+    cwd = os.getcwd()
+    try:
+        os.chdir(message["cwd"])
+        with _client_stdio(fds):
+            watcher.start()
+            _busy = True
+            try:
+                return _run_argv(message["argv"])
+            finally:
+                _busy = False
+    finally:
+        done.set()
+        os.chdir(cwd)
+
+
+def _serve_command(conn: socket.socket, message: dict, fds: list[int], state: dict) -> None:
+    env = message.get("env") or {}
+    mismatched = [key for key in FORWARDED_ENV if env.get(key) != os.environ.get(key)]
+    if mismatched or len(fds) != 3:
+        conn.sendall(encode({"fallback": f"environment differs: {', '.join(mismatched) or 'stdio'}"}))
+        return
+    conn.sendall(encode({"ready": True}))
+    if not read_message(conn).get("go"):
+        return
+    conn.settimeout(None)
+    code = _run_for_client(conn, message, fds)
+    state["served"] += 1
+    conn.sendall(encode({"exit": code}))
+
+
+def _handle(conn: socket.socket, state: dict) -> Optional[str]:
+    conn.settimeout(CLIENT_TIMEOUT)
+    data, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+    try:
+        while data and not data.endswith(b"\n"):
+            chunk = conn.recv(65536)
+            if not chunk:
+                return None
+            data += chunk
+        message = json.loads(data)
+        if message.get("op") == "run":
+            _serve_command(conn, message, fds, state)
+        elif message.get("op") == "ping":
+            conn.sendall(encode({**state, "db": str(dbmod.DB_PATH)}))
+        elif message.get("op") == _STOP:
+            conn.sendall(encode({"stopping": True}))
+            return _STOP
+    finally:
+        for fd in fds:
+            os.close(fd)
+    return None
+
+
+def serve(path: str) -> None:
+    """Serve forwarded commands on the Unix socket at `path` until stopped."""
+    _warm_up()
+    with dbmod.get_db() as db:
+        for model in (Resume, CoverLetter):
+            catalog_index(db, model)
+    listener = _listen(path)
+    signal.signal(signal.SIGUSR1, _interrupt_command)
+    signal.signal(signal.SIGTERM, _terminate)
+    state = {"pid": os.getpid(), "started": time.time(), "served": 0}
+    try:
+        while not _stopping:
+            conn, _ = listener.accept()
+            with conn:
+                try:
+                    if _handle(conn, state) == _STOP:
+                        return
+                except (OSError, ValueError):
+                    pass  # the client went away or sent garbage; it falls back on its own
+                except Exception:
+                    traceback.print_exc()
+    finally:
+        listener.close()
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+def _request(op: str) -> Optional[dict]:
+    sock = connect()
+    if sock is None:
+        return None
+    with sock:
+        try:
+            socket.send_fds(sock, [encode({"op": op})], [])
+            return read_message(sock)
+        except (OSError, ValueError):
+            return None
+
+
+def _detach() -> None:
+    """Start a new session and point stdio at /dev/null and the daemon log."""
+    os.setsid()
+    null = os.open(os.devnull, os.O_RDONLY)
+    log = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    for fd, n in ((null, 0), (log, 1), (log, 2)):
+        os.dup2(fd, n)
+    os.close(null)
+    os.close(log)
+
+
+@daemon_app.command("start")
+def start(foreground: bool = typer.Option(False, help="Serve from this process instead of detaching")):
+    """Start the daemon; `jobtracker` commands are then forwarded to it
+
+    Set JOBTRACKER_NO_DAEMON=1 to run a command in-process anyway.
+    """
+    if not daemon_supported():
+        console.print("[red]The daemon needs Unix domain sockets with file descriptor passing[/red]")
+        raise typer.Exit(code=1)
+    if _request("ping") is not None:
+        console.print("Daemon is already running.")
+        return
+    path = socket_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if foreground:
+        console.print(f"Serving on {path}")
+        serve(path)
+        return
+    # Import command modules while still attached to the terminal, so their rich
+    # consoles pick its color support; the database is opened after the fork.
+    _warm_up()
+    pid = os.fork()
+    if pid == 0:
+        _detach()
+        code = 0
+        try:
+            serve(path)
+        except SystemExit as exc:  # SIGTERM
+            code = exc.code if isinstance(exc.code, int) else 1
+        except BaseException:
+            traceback.print_exc()  # into the daemon log, which the parent points the user to
+            code = 1
+        finally:
+            sys.stderr.flush()
+            os._exit(code)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if _request("ping") is not None:
+            console.print(f"Daemon started (pid {pid}) on {path}")
+            return
+        if os.waitpid(pid, os.WNOHANG)[0]:
+            break
+        time.sleep(0.05)
+    console.print(f"[red]Daemon failed to start; see {LOG_PATH}[/red]")
+    raise typer.Exit(code=1)
+
+
+@daemon_app.command("stop")
+def stop():
+    """Stop the running daemon"""
+    if _request(_STOP) is None:
+        console.print("Daemon is not running.")
+        return
+    path = socket_path()
+    deadline = time.monotonic() + 5
+    while os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    console.print("Daemon stopped.")
+
+
+@daemon_app.command("status")
+def status():
+    """Show whether the daemon is running and how many commands it served"""
+    info = _request("ping")
+    if info is None:
+        console.print("Daemon is not running.")
+        raise typer.Exit(code=1)
+    uptime = time.time() - info["started"]
+    console.print(
+        f"Daemon running (pid {info['pid']}) on {socket_path()}\n"
+        f"Database: {info['db']}\nServed {info['served']} command(s) in {uptime:.0f}s"
+    )
@@ -1,18 +1,28 @@
 import typer
-from typing import Optional
-from datetime import datetime, timezone
+from typing import Annotated, Optional
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich import box
+from jobtracker.archive import ArchiveError, job_sources
 from jobtracker.db import get_db
-from sqlalchemy.orm import joinedload
+from jobtracker.catalog import catalog_name
+from jobtracker.cli.lookup import full_id, full_ids
+from jobtracker.cli.output import EXPORT_BATCH_SIZE, OutputFormat, write_rows
+from jobtracker.cli.params import parse_age
+from jobtracker.cli.picker import pick
+from jobtracker.ids import short_ids
+from jobtracker.importer import detect_format, import_jobs, read_records
 from jobtracker.models import Job, Resume, CoverLetter
+from jobtracker.queries import JobSort, encode_cursor, job_filter_clauses, job_list_select
+from jobtracker.read_models import JobRow, batches, fetch_rows
+from jobtracker.services import JobDTO, JobService, NotFoundError
 from jobtracker.enums import JobStatus
-from jobtracker.schemas import JobCreate, JobUpdate
 from pydantic import ValidationError
 
 console = Console()
-job_app = typer.Typer(help="Manage tracked job applications: add, list, update, status, note, remove")
+job_app = typer.Typer(help="Manage tracked job applications: add, import, list, update, status, note, remove")
 
 # use `get_db` contextmanager from `jobtracker.db`
 
@@ -34,71 +44,33 @@ def _parse_applied_date(applied_date: Optional[str], now: datetime) -> Optional[
         return now
 
 
-def _select_resume_id(db) -> Optional[str]:
-    """Prompt the user to select a resume ID from available resumes, or return None."""
-    resumes = db.query(Resume).order_by(Resume.created_at.desc()).all()
-    if not resumes:
-        return None
-    console.print("\nAvailable Resumes:")
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="dim")
-    table.add_column("Name")
-    for r in resumes:
-        table.add_row(r.id, r.name.replace("\n", " ").strip())
-    console.print(table)
-    selected = typer.prompt("Enter resume ID to attach", default="")
-    return selected or None
-
-
-def _select_cover_letter_id(db) -> Optional[str]:
-    """Prompt the user to select a cover letter ID from available letters, or return None."""
-    letters = db.query(CoverLetter).order_by(CoverLetter.created_at.desc()).all()
-    if not letters:
-        return None
-    console.print("\nAvailable Cover Letters:")
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="dim")
-    table.add_column("Name")
-    for cl in letters:
-        table.add_row(cl.id, cl.name.replace("\n", " ").strip())
-    console.print(table)
-    selected = typer.prompt("Enter cover letter ID to attach", default="")
-    return selected or None
+def _job_sources(db, include_archived: bool) -> tuple:
+    """`archive.job_sources`, reporting an unusable archive as a command error."""
+    try:
+        return job_sources(db, include_archived)
+    except ArchiveError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1)
 
 
-def _create_and_commit_job(db, job: Job) -> Job:
-    """Add, commit, and refresh a job instance in the database."""
-    try:
-        db.add(job)
-        db.commit()
-        db.refresh(job)
-        return job
-    except Exception:
-        db.rollback()
-        raise
+# `--resume-id` / `--cover-letter-id` value that attaches nothing without prompting.
+NO_ATTACHMENT = "none"
+
 
+def _attachment_id(db, model, value: Optional[str]) -> Optional[str]:
+    """Resolve a resume / cover letter ID prefix; `NO_ATTACHMENT` means none."""
+    return None if value == NO_ATTACHMENT else full_id(db, model, value, console)
 
-def _print_added_job_details(db, job: Job, resume_id: Optional[str], cover_letter_id: Optional[str]) -> None:
+
+def _print_added_job_details(db, job: JobDTO, resume_id: Optional[str], cover_letter_id: Optional[str]) -> None:
     console.print(f"\nAdded job [bold]{job.company} — {job.title}[/bold]")
     if resume_id:
-        resume = db.query(Resume).filter(Resume.id == resume_id).first()
-        console.print(f"   Resume attached: {resume.name if resume else resume_id}")
+        console.print(f"   Resume attached: {catalog_name(db, Resume, resume_id) or resume_id}")
     if cover_letter_id:
-        cl = db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id).first()
-        console.print(f"   Cover Letter attached: {cl.name if cl else cover_letter_id}")
+        console.print(f"   Cover Letter attached: {catalog_name(db, CoverLetter, cover_letter_id) or cover_letter_id}")
     console.print(f"ID: {job.id}")
 
 
-def _commit_job(db, job: Job) -> None:
-    """Commit changes to a job and refresh from the database."""
-    try:
-        db.commit()
-        db.refresh(job)
-    except Exception:
-        db.rollback()
-        raise
-
-
 @job_app.command("add")
 def add_job(
     company: str = typer.Option(..., prompt=True),
@@ -108,8 +80,10 @@ def add_job(
     location: Optional[str] = typer.Option(None, prompt=True),
     salary_range: Optional[str] = typer.Option(None, prompt=True),
     applied_date: Optional[str] = typer.Option(None, help="Applied date in YYYY-MM-DD format"),
-    resume_id: Optional[str] = typer.Option(None, help="Optional resume ID"),
-    cover_letter_id: Optional[str] = typer.Option(None, help="Optional cover letter ID"),
+    resume_id: Optional[str] = typer.Option(None, help=f"Optional resume ID ({NO_ATTACHMENT!r}: attach none)"),
+    cover_letter_id: Optional[str] = typer.Option(
+        None, help=f"Optional cover letter ID ({NO_ATTACHMENT!r}: attach none)"
+    ),
 ):
     """Add a new job application"""
     now = datetime.now(timezone.utc)
@@ -117,45 +91,30 @@ def add_job(
         applied_dt = _parse_applied_date(applied_date, now)
 
         if not resume_id:
-            resume_id = _select_resume_id(db)
+            resume_id = pick(db, Resume, "Resume", console)
+        resume_id = _attachment_id(db, Resume, resume_id)
 
         if not cover_letter_id:
-            cover_letter_id = _select_cover_letter_id(db)
+            cover_letter_id = pick(db, CoverLetter, "Cover letter", console)
+        cover_letter_id = _attachment_id(db, CoverLetter, cover_letter_id)
 
-        # Validate inputs using Pydantic schema which normalizes salary_range
+        # Validated (and salary_range normalized) by the service
         try:
-            job_in = JobCreate(
-                company=company,
-                title=title,
+            job = JobService(db).add(
+                company,
+                title,
+                source=source,
+                job_url=job_url,
                 location=location,
                 salary_range=salary_range,
-                job_url=job_url,
-                source=source,
+                applied_date=applied_dt,
+                resume_id=resume_id,
+                cover_letter_id=cover_letter_id,
             )
-        except ValidationError as exc:
+        except (ValidationError, NotFoundError) as exc:
             console.print(f"[red]Invalid input:[/red] {exc}")
             raise typer.Exit(code=1)
 
-        # -----------------------------
-        # Create Job
-        # -----------------------------
-        job = Job(
-            company=job_in.company,
-            title=job_in.title,
-            source=job_in.source,
-            # Pydantic HttpUrl converts to an object; ensure we store a string in the DB
-            job_url=str(job_in.job_url) if job_in.job_url else (job_url or None),
-            location=job_in.location,
-            salary_range=job_in.salary_range,
-            status=JobStatus.APPLIED.value,
-            applied_date=applied_dt,
-            last_updated=now,
-            created_at=now,
-            resume_id=resume_id,
-            cover_letter_id=cover_letter_id,
-        )
-
-        _create_and_commit_job(db, job)
         _print_added_job_details(db, job, resume_id, cover_letter_id)
 
 
@@ -163,187 +122,435 @@ def add_job(
 def update_job(job_id: str = typer.Argument(..., help="ID of the job to update")):
     """Update fields on an existing job"""
     with get_db() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        service = JobService(db)
+        job_id = full_id(db, Job, job_id, console)
+        job = service.get(job_id)
         if not job:
             console.print(f"[red]Job ID {job_id} not found[/red]")
             raise typer.Exit()
 
         console.print(f"Updating job: [bold]{job.company} — {job.title}[/bold]\nPress Enter to keep current value.\n")
 
-        # Update basic fields
-        _prompt_update_basic_fields(job)
+        changes = _prompt_update_basic_fields(job)
+        changes.update(_prompt_update_resume(db, job), **_prompt_update_cover_letter(db, job))
 
-        # Validate updates using JobUpdate schema (salary_range normalization/validation)
+        # Validated by the service (salary_range normalization/validation)
         try:
-            job_up = JobUpdate(
-                company=job.company,
-                title=job.title,
-                location=job.location,
-                salary_range=job.salary_range,
-                job_url=job.job_url,
-                source=job.source,
-            )
-        except ValidationError as exc:
+            job = service.update(job_id, **changes)
+        except (ValidationError, NotFoundError) as exc:
             console.print(f"[red]Invalid update:[/red] {exc}")
             raise typer.Exit(code=1)
 
-        # Apply any normalized values (e.g., salary_range)
-        if job_up.salary_range is not None:
-            job.salary_range = job_up.salary_range
-        # Ensure job_url gets stored as a string (JobUpdate may contain a HttpUrl)
-        if job_up.job_url is not None:
-            job.job_url = str(job_up.job_url)
+        console.print(f"\nUpdated job [bold]{job.company} — {job.title}[/bold]")
+        resume_name = job.resume_id and catalog_name(db, Resume, job.resume_id)
+        if resume_name:
+            console.print(f"   Resume attached: {resume_name}")
+        cover_letter_name = job.cover_letter_id and catalog_name(db, CoverLetter, job.cover_letter_id)
+        if cover_letter_name:
+            console.print(f"   Cover Letter attached: {cover_letter_name}")
+        console.print(f"ID: {job.id}")
+
 
-        # Update Resume
-        _prompt_update_resume(db, job)
+# Columns of the job listing: (header, row attribute, fixed width used when streaming)
+JOB_LIST_COLUMNS = [
+    ("ID", "id", 36),
+    ("Company", "company", 20),
+    ("Title", "title", 24),
+    ("Status", "status", 15),
+    ("Source", "source", 12),
+    ("Applied (UTC)", "applied_date", 13),
+    ("Resume", "resume_name", 16),
+    ("Cover Letter", "cover_letter_name", 16),
+    ("Salary Range", "salary_range", 21),
+    ("Location", "location", 14),
+    ("URL", "job_url", 30),
+]
+STREAM_BATCH_SIZE = 500
+# Width of the streamed ID column: the first UUID group, longer than most unique prefixes.
+STREAM_ID_WIDTH = 8
+
+
+def _job_row_cells(row, short_id: str) -> list[str]:
+    cells = []
+    for _, attr, _ in JOB_LIST_COLUMNS:
+        value = getattr(row, attr)
+        if attr == "status":
+            value = value.value if value else None
+        elif attr == "applied_date":
+            value = value.strftime("%Y-%m-%d") if value else None
+        cells.append(short_id if attr == "id" else (value or "-"))
+    return cells
+
+
+def _job_table(stream: bool = False, show_header: bool = True, id_width: Optional[int] = None) -> Table:
+    """Build the job listing table; streamed batches use fixed widths so they line up."""
+    if stream:
+        table = Table(box=box.SIMPLE, show_header=show_header, header_style="bold cyan", pad_edge=False)
+        for header, attr, width in JOB_LIST_COLUMNS:
+            width = max(id_width, len(header)) if attr == "id" and id_width else width
+            table.add_column(header, width=width, no_wrap=True, overflow="ellipsis")
+        return table
+    table = Table(title="Tracked Job Applications", box=box.SQUARE, show_lines=True, header_style="bold cyan")
+    for header, attr, _ in JOB_LIST_COLUMNS:
+        table.add_column(header, no_wrap=attr == "id")
+    return table
+
+
+def _print_next_cursor(last_row) -> None:
+    cursor = encode_cursor(last_row.created_at, last_row.id)
+    console.print(f"[dim]More jobs available; next page: --after {cursor}[/dim]")
+
+
+def _stream_jobs(db, stmt, limit: Optional[int], paged: bool = True, jobs=Job) -> None:
+    """Render jobs in fixed-size batches as they are fetched, keeping memory bounded."""
+    rows = fetch_rows(db, stmt, JobRow, batch_size=STREAM_BATCH_SIZE)
+    shown, last_row = 0, None
+    for batch in batches(rows, STREAM_BATCH_SIZE):
+        # Short IDs are found per batch; the column keeps one width unless a batch needs more.
+        short = short_ids(db, jobs, (row.id for row in batch))
+        id_width = max(STREAM_ID_WIDTH, *map(len, short.values()))
+        table = _job_table(stream=True, show_header=shown == 0, id_width=id_width)
+        for row in batch:
+            if limit is not None and shown == limit:
+                console.print(table)
+                if paged:
+                    _print_next_cursor(last_row)
+                return
+            table.add_row(*_job_row_cells(row, short[row.id]))
+            shown, last_row = shown + 1, row
+        console.print(table)
+    if shown == 0:
+        console.print("No jobs tracked yet.")
 
-        # Update Cover Letter
-        _prompt_update_cover_letter(db, job)
 
-        job.last_updated = datetime.now(timezone.utc)
-        _commit_job(db, job)
+def _export_jobs(db, stmt, fmt: OutputFormat, limit: Optional[int], paged: bool = True) -> None:
+    """Stream jobs to stdout in a machine-readable format; the next-page cursor goes to stderr."""
+    rows = fetch_rows(db, stmt, JobRow, batch_size=EXPORT_BATCH_SIZE)
+    last_row, has_more = None, False
 
-        console.print(f"\nUpdated job [bold]{job.company} — {job.title}[/bold]")
-        if job.resume:
-            console.print(f"   Resume attached: {job.resume.name}")
-        if job.cover_letter:
-            console.print(f"   Cover Letter attached: {job.cover_letter.name}")
-        console.print(f"ID: {job.id}")
+    def page():
+        nonlocal last_row, has_more
+        for shown, row in enumerate(rows):
+            if limit is not None and shown == limit:
+                has_more = True
+                return
+            last_row = row
+            yield row
+
+    write_rows(fmt, JobRow._fields, page())
+    if has_more and paged:
+        typer.echo(f"next page: --after {encode_cursor(last_row.created_at, last_row.id)}", err=True)
 
 
 @job_app.command("list")
-def list_jobs():
-    """List all tracked job applications"""
+def list_jobs(
+    status: Annotated[Optional[list[JobStatus]], typer.Option(help="Only jobs in this status (repeatable)")] = None,
+    company: Annotated[Optional[str], typer.Option(help="Only jobs at this company (exact match)")] = None,
+    title_contains: Annotated[Optional[str], typer.Option(help="Only jobs whose title contains this text")] = None,
+    applied_since: Annotated[
+        Optional[datetime], typer.Option(formats=["%Y-%m-%d"], help="Applied on or after YYYY-MM-DD")
+    ] = None,
+    applied_until: Annotated[
+        Optional[datetime], typer.Option(formats=["%Y-%m-%d"], help="Applied on or before YYYY-MM-DD")
+    ] = None,
+    source: Annotated[Optional[str], typer.Option(help="Only jobs from this source (exact match)")] = None,
+    resume_id: Annotated[Optional[str], typer.Option(help="Only jobs that used this resume")] = None,
+    min_salary: Annotated[
+        Optional[int], typer.Option(min=0, help="Only jobs whose salary range reaches at least this amount")
+    ] = None,
+    max_salary: Annotated[
+        Optional[int], typer.Option(min=0, help="Only jobs whose salary range starts at or below this amount")
+    ] = None,
+    sort: Annotated[JobSort, typer.Option(help="Sort order")] = JobSort.CREATED,
+    limit: Annotated[Optional[int], typer.Option(min=1, help="Show at most N jobs")] = None,
+    after: Annotated[Optional[str], typer.Option(help="Continue after the cursor printed by a previous page")] = None,
+    stream: Annotated[bool, typer.Option(help="Print rows in batches as they are read, with bounded memory")] = False,
+    fmt: Annotated[
+        OutputFormat, typer.Option("--format", help="table, or stream ndjson/csv/tsv for piping")
+    ] = OutputFormat.TABLE,
+    include_archived: Annotated[
+        bool, typer.Option("--include-archived", help="Also list jobs moved to the archive by `jobtracker archive`")
+    ] = False,
+):
+    """List tracked job applications, optionally filtered and sorted
+
+    The ID column shows the shortest prefix that identifies each job; any command
+    taking an ID accepts it. Machine-readable formats keep full IDs.
+    """
     with get_db() as db:
-        # Eager-load related Resume and CoverLetter so we can access their
-        # attributes after the session is closed.
-        jobs = (
-            db.query(Job)
-            .options(joinedload(Job.resume), joinedload(Job.cover_letter))
-            .order_by(Job.created_at.desc())
-            .all()
+        jobs, _ = _job_sources(db, include_archived)
+        where = job_filter_clauses(
+            statuses=status,
+            company=company,
+            title_contains=title_contains,
+            applied_since=applied_since,
+            applied_until=applied_until,
+            source=source,
+            resume_id=full_id(db, Resume, resume_id, console),
+            min_salary=min_salary,
+            max_salary=max_salary,
+            jobs=jobs,
         )
+        try:
+            # Fetch one extra row to know whether another page follows.
+            stmt = job_list_select(
+                where=where,
+                sort=sort,
+                after=after,
+                limit=None if limit is None else limit + 1,
+                raw=fmt != OutputFormat.TABLE,
+                jobs=jobs,
+            )
+        except ValueError as exc:
+            console.print(f"[red]Invalid --after:[/red] {exc}")
+            raise typer.Exit(code=1)
 
-    if not jobs:
-        console.print("No jobs tracked yet.")
+        if fmt != OutputFormat.TABLE:
+            _export_jobs(db, stmt, fmt, limit, paged=sort == JobSort.CREATED)
+            return
+        if stream:
+            _stream_jobs(db, stmt, limit, paged=sort == JobSort.CREATED, jobs=jobs)
+            return
+        rows = list(fetch_rows(db, stmt, JobRow))
+        has_more = limit is not None and len(rows) > limit
+        rows = rows[:limit] if has_more else rows
+        short = short_ids(db, jobs, (row.id for row in rows))
+
+    if not rows:
+        console.print("No matching jobs found." if where else "No jobs tracked yet.")
         return
 
-    table = Table(title="Tracked Job Applications", box=box.SQUARE, show_lines=True, header_style="bold cyan")
-
-    table.add_column("ID", no_wrap=True)
-    table.add_column("Company")
-    table.add_column("Title")
-    table.add_column("Status")
-    table.add_column("Source")
-    table.add_column("Applied (UTC)")
-    table.add_column("Resume")
-    table.add_column("Cover Letter")
-    table.add_column("Salary Range")
-    table.add_column("Location")
-    table.add_column("URL")
-
-    for job in jobs:
-        table.add_row(
-            job.id,
-            job.company,
-            job.title,
-            job.status,
-            job.source or "-",
-            job.applied_date.strftime("%Y-%m-%d") if job.applied_date else "-",
-            job.resume.name if job.resume else "-",
-            job.cover_letter.name if job.cover_letter else "-",
-            job.salary_range or "-",
-            job.location or "-",
-            job.job_url or "-",
-        )
+    table = _job_table()
+    for row in rows:
+        table.add_row(*_job_row_cells(row, short[row.id]))
 
     # Print the table once after all rows are added
     console.print(table)
+    if has_more and sort == JobSort.CREATED:
+        _print_next_cursor(rows[-1])
 
 
-def _prompt_update_basic_fields(job: Job) -> None:
-    """Prompt to update basic job fields in-place."""
-    job.company = typer.prompt("Company", default=job.company)
-    job.title = typer.prompt("Title", default=job.title)
-    job.source = typer.prompt("Source", default=job.source or "")
-    job.job_url = typer.prompt("Job URL", default=job.job_url or "")
-    job.location = typer.prompt("Location", default=job.location or "")
-    job.salary_range = typer.prompt("Salary Range", default=job.salary_range or "")
+@job_app.command("import")
+def import_jobs_cmd(
+    file: Path = typer.Argument(..., exists=True, dir_okay=False, help="CSV, JSON (array) or NDJSON file of jobs"),
+    fmt: Optional[str] = typer.Option(None, "--format", help="csv, json or ndjson (default: from the file suffix)"),
+    batch_size: int = typer.Option(1000, min=1, help="Rows validated and inserted per transaction"),
+    dry_run: bool = typer.Option(False, help="Validate every row without writing anything"),
+):
+    """Bulk-import jobs; invalid rows are reported and skipped (exit code 1 if any)
+
+    Columns match `job add` (company, title, source, job_url, location, salary_range,
+    applied_date) plus optional status, resume and cover_letter (ID or name).
+    Set JOBTRACKER_DB_PROFILE=bulk-load for very large files.
+    """
+    try:
+        records = read_records(file, detect_format(file, fmt))
+        with get_db() as db:
+            report = import_jobs(db, records, batch_size=batch_size, dry_run=dry_run)
+    except (ValueError, UnicodeDecodeError) as exc:
+        console.print(f"[red]Cannot import {file}:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+    for position, message in report.errors:
+        console.print(f"[red]Row {position}:[/red] {message}")
+    verb = "Validated" if dry_run else "Imported"
+    console.print(f"{verb} [bold]{report.inserted}[/bold] job(s); rejected {len(report.errors)} row(s)")
+    if report.errors:
+        raise typer.Exit(code=1)
+
+
+def _prompt_update_basic_fields(job: JobDTO) -> dict:
+    """Prompt for the basic job fields; return them keyed by field name."""
+    changes = {
+        "company": typer.prompt("Company", default=job.company),
+        "title": typer.prompt("Title", default=job.title),
+        "source": typer.prompt("Source", default=job.source or ""),
+        "job_url": typer.prompt("Job URL", default=job.job_url or ""),
+        "location": typer.prompt("Location", default=job.location or ""),
+        "salary_range": typer.prompt("Salary Range", default=job.salary_range or ""),
+    }
 
     applied_default = job.applied_date.strftime("%Y-%m-%d") if job.applied_date else ""
     applied_input = typer.prompt("Applied Date (YYYY-MM-DD)", default=applied_default)
     if applied_input.strip():
         try:
-            job.applied_date = datetime.strptime(applied_input.strip(), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            applied = datetime.strptime(applied_input.strip(), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            changes["applied_date"] = applied
         except ValueError:
             console.print("[red]Invalid date format. Keeping current value.[/red]")
+    return changes
 
 
-def _prompt_update_resume(db, job: Job) -> None:
-    resumes = db.query(Resume).order_by(Resume.created_at.desc()).all()
-    if not resumes:
-        return
-    console.print("\nAvailable Resumes:")
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="dim")
-    table.add_column("Name")
-    for r in resumes:
-        table.add_row(r.id, r.name.replace("\n", " ").strip())
-    console.print(table)
-    resume_default = job.resume_id if job.resume else ""
-    resume_selected = typer.prompt("Enter resume ID to attach", default=resume_default)
-    job.resume_id = resume_selected if resume_selected else job.resume_id
+def _prompt_update_resume(db, job: JobDTO) -> dict:
+    selected = pick(db, Resume, "Resume", console, default=job.resume_id)
+    return {"resume_id": selected} if selected else {}
 
 
-def _prompt_update_cover_letter(db, job: Job) -> None:
-    letters = db.query(CoverLetter).order_by(CoverLetter.created_at.desc()).all()
-    if not letters:
-        return
-    console.print("\nAvailable Cover Letters:")
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="dim")
-    table.add_column("Name")
-    for cl in letters:
-        table.add_row(cl.id, cl.name.replace("\n", " ").strip())
-    console.print(table)
-    cover_default = job.cover_letter_id if job.cover_letter else ""
-    cover_selected = typer.prompt("Enter cover letter ID to attach", default=cover_default)
-    job.cover_letter_id = cover_selected if cover_selected else job.cover_letter_id
+def _prompt_update_cover_letter(db, job: JobDTO) -> dict:
+    selected = pick(db, CoverLetter, "Cover letter", console, default=job.cover_letter_id)
+    return {"cover_letter_id": selected} if selected else {}
+
+
+# Keys accepted by `--where` on batch commands
+BATCH_WHERE_KEYS = ("status", "company", "source")
+
+
+def _batch_filters(where: Optional[list[str]], older_than: Optional[timedelta]) -> dict:
+    """Translate repeatable `key=value` filters (plus `--older-than`) into batch-service filters."""
+    filters: dict[str, list[str]] = {}
+    for item in where or ():
+        key, sep, value = item.partition("=")
+        key = key.strip().lower().replace("-", "_")
+        if not sep or key not in BATCH_WHERE_KEYS or not value.strip():
+            raise typer.BadParameter(f"expected one of {', '.join(BATCH_WHERE_KEYS)} as key=value, got {item!r}")
+        filters.setdefault(key, []).append(value.strip())
+    for key in ("company", "source"):
+        if len(filters.get(key, ())) > 1:
+            raise typer.BadParameter(f"--where {key}= may only be given once")
+    try:
+        statuses = [JobStatus(s) for s in filters.get("status", ())]
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from None
+    return {
+        "statuses": statuses,
+        "company": filters.get("company", [None])[0],
+        "source": filters.get("source", [None])[0],
+        "older_than": older_than,
+    }
+
+
+def _read_ids(source: str) -> list[str]:
+    """Read job IDs or unique ID prefixes, one per line, from a file or `-` (stdin); blank lines are skipped."""
+    if source == "-":
+        lines = typer.get_text_stream("stdin").read().splitlines()
+    else:
+        try:
+            lines = Path(source).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise typer.BadParameter(f"cannot read {source}: {exc.strerror}") from None
+    return list(dict.fromkeys(line.strip() for line in lines if line.strip()))
 
 
 @job_app.command("remove")
-def remove_job(job_id: str = typer.Argument(...)):
-    """Remove a job from tracking"""
+def remove_job(
+    job_id: Optional[str] = typer.Argument(None, help="ID of the job (omit when using --ids-from or --where)"),
+    ids_from: Optional[str] = typer.Option(
+        None, "--ids-from", help="File of job IDs or unique prefixes to remove (- for stdin)"
+    ),
+    where: Optional[list[str]] = typer.Option(
+        None, "--where", help="Remove jobs matching key=value (status, company, source; repeatable)"
+    ),
+    older_than: Optional[timedelta] = typer.Option(
+        None, parser=parse_age, metavar="AGE", help="Only jobs not updated for this long, e.g. 60d, 8w, 12h"
+    ),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Remove many jobs without asking for confirmation"),
+):
+    """Remove a job (and its notes), or many jobs at once with --ids-from / --where"""
+    if ids_from is not None or where or older_than is not None:
+        if job_id is not None:
+            console.print("[red]Pass a job ID, or select jobs with --ids-from / --where, not both[/red]")
+            raise typer.Exit(code=2)
+        _remove_jobs_batch(ids_from, where, older_than, yes)
+        return
+    if job_id is None:
+        console.print("[red]Pass a job ID, or select jobs with --ids-from / --where[/red]")
+        raise typer.Exit(code=2)
+
     with get_db() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if not job:
+        job_id = full_id(db, Job, job_id, console)
+        try:
+            job = JobService(db).remove(job_id)
+        except NotFoundError:
             console.print(f"Job ID {job_id} not found")
             raise typer.Exit()
-        try:
-            db.delete(job)
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
         console.print(f"Removed job [bold]{job.company} — {job.title}[/bold]")
 
 
+def _remove_jobs_batch(
+    ids_from: Optional[str], where: Optional[list[str]], older_than: Optional[timedelta], yes: bool
+) -> None:
+    if ids_from == "-" and not yes:
+        # The IDs use up stdin, so there is nothing left to answer the prompt with.
+        console.print("[red]--ids-from - reads stdin; pass --yes to remove without confirmation[/red]")
+        raise typer.Exit(code=2)
+    filters = _batch_filters(where, older_than)
+    ids = _read_ids(ids_from) if ids_from is not None else None
+    with get_db() as db:
+        if ids is not None:
+            ids = full_ids(db, Job, ids, console)
+        service = JobService(db)
+        if not yes:
+            matching = service.count_many(ids, **filters)
+            if not matching:
+                console.print("No matching jobs.")
+                return
+            typer.confirm(f"Remove {matching} job(s) and their notes?", abort=True)
+        count = service.remove_many(ids, **filters)
+
+    console.print(f"Removed [bold]{count}[/bold] job(s)")
+    if ids is not None and count < len(ids):
+        console.print(f"[dim]{len(ids) - count} ID(s) not found or filtered out[/dim]")
+
+
 @job_app.command("status")
-def update_job_status(job_id: str = typer.Argument(...), new_status: JobStatus = typer.Argument(...)):
-    """Update the status of a job"""
+def update_job_status(
+    job_id: Optional[str] = typer.Argument(None, help="ID of the job (omit when using --ids-from or --where)"),
+    new_status: Optional[JobStatus] = typer.Argument(None, help="Status to move the job(s) to"),
+    ids_from: Optional[str] = typer.Option(
+        None, "--ids-from", help="File of job IDs or unique prefixes to update (- for stdin)"
+    ),
+    where: Optional[list[str]] = typer.Option(
+        None, "--where", help="Update jobs matching key=value (status, company, source; repeatable)"
+    ),
+    older_than: Optional[timedelta] = typer.Option(
+        None, parser=parse_age, metavar="AGE", help="Only jobs not updated for this long, e.g. 60d, 8w, 12h"
+    ),
+):
+    """Update the status of a job, or of many jobs at once with --ids-from / --where"""
+    if ids_from is not None or where or older_than is not None:
+        _update_job_status_batch(job_id, new_status, ids_from, where, older_than)
+        return
+    if job_id is None or new_status is None:
+        console.print("[red]Pass a job ID and the new status, or select jobs with --ids-from / --where[/red]")
+        raise typer.Exit(code=2)
+
     with get_db() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if not job:
+        job_id = full_id(db, Job, job_id, console)
+        try:
+            job = JobService(db).set_status(job_id, new_status)
+        except NotFoundError:
             console.print(f"Job ID {job_id} not found")
             raise typer.Exit()
 
-        job.status = new_status.value
-        job.last_updated = datetime.now(timezone.utc)
-        try:
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
-
         msg = f"Updated status for [bold]{job.company} — {job.title}[/bold] to " f"[green]{new_status.value}[/green]"
         console.print(msg)
+
+
+def _update_job_status_batch(
+    status_arg: Optional[str],
+    new_status: Optional[JobStatus],
+    ids_from: Optional[str],
+    where: Optional[list[str]],
+    older_than: Optional[timedelta],
+) -> None:
+    # With --ids-from/--where no job ID is given, so the only positional is the status.
+    if new_status is not None or status_arg is None:
+        console.print("[red]With --ids-from or --where, pass only the new status[/red]")
+        raise typer.Exit(code=2)
+    try:
+        new_status = JobStatus(status_arg)
+    except ValueError:
+        choices = ", ".join(s.value for s in JobStatus)
+        console.print(f"[red]Unknown status {status_arg!r}; expected one of: {choices}[/red]")
+        raise typer.Exit(code=2)
+
+    filters = _batch_filters(where, older_than)
+    ids = _read_ids(ids_from) if ids_from is not None else None
+    with get_db() as db:
+        if ids is not None:
+            ids = full_ids(db, Job, ids, console)
+        count = JobService(db).set_status_many(new_status, ids, **filters)
+
+    console.print(f"Updated status of [bold]{count}[/bold] job(s) to [green]{new_status.value}[/green]")
+    if ids is not None and count < len(ids):
+        console.print(f"[dim]{len(ids) - count} ID(s) not found, filtered out or already {new_status.value}[/dim]")
@@ -0,0 +1,117 @@
+"""`jobtracker match`: rank resumes by how well they fit a job's title and AI summary."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy import select
+
+from jobtracker.catalog import catalog_entries
+from jobtracker.cli.lookup import full_id
+from jobtracker.cli.output import OutputFormat, write_rows
+from jobtracker.db import get_db
+from jobtracker.enums import JobStatus
+from jobtracker.ids import short_ids
+from jobtracker.matching import MatchError, MatchResult, match_jobs
+from jobtracker.models import Job, Resume
+from jobtracker.queries import job_filter_clauses
+
+console = Console()
+match_app = typer.Typer()
+
+# Resumes listed for one job when --limit is not given.
+DEFAULT_LIMIT = 10
+EXPORT_COLUMNS = ("job_id", "company", "title", "resume_id", "resume_name", "score")
+
+
+def _match(db, jobs: list, top: int) -> MatchResult:
+    try:
+        result = match_jobs(db, [(job.id, job.title, job.ai_summary) for job in jobs], top)
+    except MatchError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1)
+    if result.unreadable:
+        Console(stderr=True).print(
+            f"[yellow]{len(result.unreadable)} resume file(s) could not be read (missing, PDF or binary); "
+            "those resumes are scored on their name and tags only[/yellow]"
+        )
+    return result
+
+
+def _print_job_matches(db, job, result: MatchResult) -> None:
+    matches = result.matches[job.id]
+    if not matches:
+        console.print(f"No resume shares any words with {job.title} at {job.company}.")
+        return
+    names = {entry.id: entry.name for entry in catalog_entries(db, Resume)}
+    short = short_ids(db, Resume, (m.resume_id for m in matches))
+    table = Table(title=f"Resumes for {job.title} at {job.company}", title_justify="left", header_style="bold cyan")
+    table.add_column("#", justify="right")
+    table.add_column("ID", style="dim")
+    table.add_column("Name")
+    table.add_column("Score", justify="right")
+    for n, m in enumerate(matches, 1):
+        name = names.get(m.resume_id, "")
+        if m.resume_id == job.resume_id:
+            name += " [dim](attached)[/dim]"
+        table.add_row(str(n), short[m.resume_id], name, f"{m.score:.3f}")
+    console.print(table)
+
+
+def _print_all_matches(db, jobs: list, result: MatchResult, fmt: OutputFormat) -> None:
+    names = {entry.id: entry.name for entry in catalog_entries(db, Resume)}
+    rows = (
+        (job.id, job.company, job.title, m.resume_id, names.get(m.resume_id, ""), m.score)
+        for job in jobs
+        for m in result.matches[job.id]
+    )
+    if fmt != OutputFormat.TABLE:
+        write_rows(fmt, EXPORT_COLUMNS, rows)
+        return
+    table = Table(header_style="bold cyan")
+    for column in ("Job", "Company", "Title", "Resume", "Score"):
+        table.add_column(column, justify="right" if column == "Score" else "left")
+    job_short = short_ids(db, Job, (job.id for job in jobs))
+    for job_id, company, title, _, resume_name, score in rows:
+        table.add_row(job_short[job_id], company, title, resume_name, f"{score:.3f}")
+    console.print(table)
+    console.print(f"[dim]Scored {result.resumes} resume(s) against {len(jobs)} job(s)[/dim]")
+
+
+@match_app.command("match")
+def match(
+    job_id: Optional[str] = typer.Argument(None, help="ID of the job to find resumes for"),
+    all_jobs: bool = typer.Option(False, "--all", help="Find the best resumes for every job"),
+    status: Optional[list[JobStatus]] = typer.Option(None, help="With --all: only jobs in this status (repeatable)"),
+    limit: Optional[int] = typer.Option(
+        None, min=1, help=f"Resumes shown per job \\[default: {DEFAULT_LIMIT} for one job, 1 with --all]"
+    ),
+    fmt: OutputFormat = typer.Option(
+        OutputFormat.TABLE, "--format", help="With --all: table, or stream ndjson/csv/tsv for piping"
+    ),
+):
+    """Rank resumes by TF-IDF similarity to a job's title and AI summary
+
+    Resume files are read as plain text or .docx; their word counts are cached by
+    file content, so only new or changed resumes are tokenized.
+    """
+    if all_jobs == bool(job_id):
+        console.print("[red]Give a job ID or --all[/red]")
+        raise typer.Exit(code=1)
+    columns = (Job.id, Job.company, Job.title, Job.ai_summary, Job.resume_id)
+    with get_db() as db:
+        if all_jobs:
+            where = job_filter_clauses(statuses=status)
+            jobs = db.execute(select(*columns).where(*where).order_by(Job.created_at.desc(), Job.id)).all()
+            if not jobs and fmt == OutputFormat.TABLE:
+                console.print("No matching jobs found." if where else "No jobs tracked yet.")
+                return
+            result = _match(db, jobs, limit or 1)
+            _print_all_matches(db, jobs, result, fmt)
+            return
+        job = db.execute(select(*columns).where(Job.id == full_id(db, Job, job_id, console))).first()
+        if job is None:
+            console.print(f"[red]Job ID {job_id} not found[/red]")
+            raise typer.Exit(code=1)
+        _print_job_matches(db, job, _match(db, [job], limit or DEFAULT_LIMIT))
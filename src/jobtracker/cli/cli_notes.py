@@ -1,10 +1,14 @@
-from datetime import datetime, timezone
-
 import typer
 from rich.console import Console
 from rich.table import Table
+from jobtracker.archive import ArchiveError, job_sources
 from jobtracker.db import get_db
-from jobtracker.models import Job, Note
+from jobtracker.cli.lookup import full_id
+from jobtracker.cli.output import OutputFormat, export_select
+from jobtracker.queries import job_header_select, note_list_select
+from jobtracker.read_models import JobHeader, NoteRow, fetch_rows
+from jobtracker.models import Job
+from jobtracker.services import NoteService, NotFoundError
 
 console = Console()
 note_app = typer.Typer(help="Manage job notes")
@@ -17,44 +21,43 @@ def add_note(
 ):
     """Add a note to a job"""
     with get_db() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
-
-        if not job:
+        job_id = full_id(db, Job, job_id, console)
+        try:
+            NoteService(db).add(job_id, " ".join(content))
+        except NotFoundError:
             console.print(f"[red]Job ID {job_id} not found[/red]")
             raise typer.Exit(1)
 
-        note_text = " ".join(content)
-
-        note = Note(
-            job_id=job.id,
-            content=note_text,
-            created_at=datetime.now(timezone.utc),
-        )
-
-        try:
-            db.add(note)
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
-
         console.print("[green]Note added successfully[/green]")
 
 
 @note_app.command("list")
 def list_notes(
     job_id: str = typer.Argument(..., help="Job ID to list notes for"),
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+    include_archived: bool = typer.Option(False, "--include-archived", help="Also look for the job in the archive"),
 ):
     """List notes for a job"""
 
     with get_db() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        try:
+            jobs, notes_source = job_sources(db, include_archived)
+        except ArchiveError as exc:
+            console.print(f"[red]{exc}[/red]")
+            raise typer.Exit(1)
+        job_id = full_id(db, jobs, job_id, console)
+        job = next(fetch_rows(db, job_header_select(job_id, jobs), JobHeader), None)
 
         if not job:
             console.print(f"[red]Job ID {job_id} not found[/red]")
             raise typer.Exit(1)
 
-        if not job.notes:
+        if fmt != OutputFormat.TABLE:
+            export_select(db, note_list_select(job.id, raw=True, notes=notes_source), NoteRow, fmt)
+            return
+
+        notes = list(fetch_rows(db, note_list_select(job.id, notes=notes_source), NoteRow))
+        if not notes:
             console.print("No notes found for this job.")
             return
 
@@ -62,7 +65,7 @@ def list_notes(
         table.add_column("Created (UTC)", style="cyan", no_wrap=True)
         table.add_column("Note")
 
-        for note in sorted(job.notes, key=lambda n: n.created_at):
+        for note in notes:
             table.add_row(
                 note.created_at.strftime("%Y-%m-%d %H:%M"),
                 note.content,
@@ -1,16 +1,21 @@
 import typer
 from typing import Optional
-from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
 from rich import box
 from jobtracker.db import get_db
+from jobtracker.cli.lookup import full_id
+from jobtracker.ids import short_ids
+from jobtracker.cli.output import OutputFormat, export_select
+from jobtracker.tags import tag_counts_select
+from jobtracker.queries import catalog_list_select
+from jobtracker.read_models import CatalogRow, TagCountRow, fetch_rows
 from jobtracker.models import Resume
-from jobtracker.schemas import ResumeCreate
+from jobtracker.services import ResumeService, InUseError, NotFoundError
 from pydantic import ValidationError
 
 console = Console()
-resume_app = typer.Typer(help="Manage resumes: add, list, update, remove")
+resume_app = typer.Typer(help="Manage resumes: add, list, tags, update, remove")
 
 # use centralized `get_db` contextmanager
 
@@ -25,32 +30,31 @@ def add_resume(
     tags: Optional[str] = typer.Option(None, prompt=True),
 ):
     """Add a resume to the catalog"""
-    # Validate input early using Pydantic schema
-    try:
-        ResumeCreate(name=name, file_path=file_path, tags=tags)
-    except ValidationError as exc:
-        console.print(f"[red]Invalid input:[/red] {exc}")
-        raise typer.Exit(code=1)
-
     with get_db() as db:
-        resume = Resume(name=name, file_path=file_path, tags=tags, created_at=datetime.now(timezone.utc))
         try:
-            db.add(resume)
-            db.commit()
-            db.refresh(resume)
-        except Exception:
-            db.rollback()
-            raise
+            resume = ResumeService(db).add(name, file_path, tags)
+        except ValidationError as exc:
+            console.print(f"[red]Invalid input:[/red] {exc}")
+            raise typer.Exit(code=1)
 
         console.print(f"Added resume [bold]{resume.name}[/bold]")
         console.print(f"ID: {resume.id}")
 
 
 @resume_app.command("list")
-def list_resumes():
+def list_resumes(
+    tag: Optional[list[str]] = typer.Option(None, help="Only resumes with this tag (repeatable; all must match)"),
+    any_tag: bool = typer.Option(False, "--any", help="Match any of the --tag values instead of all"),
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
     """List available resumes"""
     with get_db() as db:
-        resumes = db.query(Resume).order_by(Resume.created_at.desc()).all()
+        if fmt != OutputFormat.TABLE:
+            stmt = catalog_list_select(Resume, raw=True, tags=tag or (), match_any=any_tag)
+            export_select(db, stmt, CatalogRow, fmt)
+            return
+        resumes = list(fetch_rows(db, catalog_list_select(Resume, tags=tag or (), match_any=any_tag), CatalogRow))
+        short = short_ids(db, Resume, (r.id for r in resumes))
     if not resumes:
         console.print("No resumes found.")
         return
@@ -63,7 +67,28 @@ def list_resumes():
     table.add_column("Created (UTC)")
 
     for r in resumes:
-        table.add_row(r.id, r.name, r.tags or "-", r.file_path, r.created_at.strftime("%Y-%m-%d %H:%M:%S"))
+        table.add_row(short[r.id], r.name, r.tags or "-", r.file_path, r.created_at.strftime("%Y-%m-%d %H:%M:%S"))
+    console.print(table)
+
+
+@resume_app.command("tags")
+def resume_tag_counts(
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
+    """Count resumes per tag, most used first"""
+    with get_db() as db:
+        if fmt != OutputFormat.TABLE:
+            export_select(db, tag_counts_select(Resume), TagCountRow, fmt)
+            return
+        counts = list(fetch_rows(db, tag_counts_select(Resume), TagCountRow))
+    if not counts:
+        console.print("No tags found.")
+        return
+    table = Table(title="Resume Tags", box=box.SQUARE, header_style="bold cyan")
+    table.add_column("Tag")
+    table.add_column("Resumes", justify="right")
+    for row in counts:
+        table.add_row(row.tag, str(row.count))
     console.print(table)
 
 
@@ -76,36 +101,18 @@ def update_resume(
 ):
     """Update fields on an existing resume"""
     with get_db() as db:
-        resume = db.query(Resume).filter(Resume.id == resume_id).first()
-        if not resume:
-            console.print(f"Resume ID {resume_id} not found")
-            raise typer.Exit()
-
-        updated = False
-        if name is not None:
-            resume.name = name
-            updated = True
-        if tags is not None:
-            resume.tags = tags
-            updated = True
-        if file_path is not None:
-            # Validate file_path
-            try:
-                ResumeCreate(name=resume.name, file_path=file_path, tags=resume.tags)
-            except ValidationError as exc:
-                console.print(f"[red]Invalid file_path:[/red] {exc}")
-                raise typer.Exit(code=1)
-            resume.file_path = file_path
-            updated = True
-
-        if not updated:
+        resume_id = full_id(db, Resume, resume_id, console)
+        if name is None and tags is None and file_path is None:
             console.print("No fields provided to update")
             raise typer.Exit()
         try:
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
+            resume = ResumeService(db).update(resume_id, name=name, tags=tags, file_path=file_path)
+        except NotFoundError as exc:
+            console.print(str(exc))
+            raise typer.Exit()
+        except ValidationError as exc:
+            console.print(f"[red]Invalid file_path:[/red] {exc}")
+            raise typer.Exit(code=1)
         console.print(f"Updated resume [bold]{resume.name}[/bold]")
 
 
@@ -113,17 +120,10 @@ def update_resume(
 def remove_resume(resume_id: str = typer.Argument(...)):
     """Remove a resume if it is not associated with any jobs"""
     with get_db() as db:
-        resume = db.query(Resume).filter(Resume.id == resume_id).first()
-        if not resume:
-            console.print(f"Resume ID {resume_id} not found")
-            raise typer.Exit()
-        if resume.jobs:
-            console.print(f"Cannot remove resume [bold]{resume.name}[/bold] (used by {len(resume.jobs)} job(s))")
-            raise typer.Exit()
+        resume_id = full_id(db, Resume, resume_id, console)
         try:
-            db.delete(resume)
-            db.commit()
-        except Exception:
-            db.rollback()
-            raise
+            resume = ResumeService(db).remove(resume_id)
+        except (NotFoundError, InUseError) as exc:
+            console.print(str(exc))
+            raise typer.Exit()
         console.print(f"Removed resume [bold]{resume.name}[/bold]")
@@ -0,0 +1,63 @@
+import typer
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+from rich import box
+from sqlalchemy.exc import OperationalError
+from jobtracker.db import get_db
+from jobtracker.cli.output import OutputFormat, write_rows
+from jobtracker.search import HIGHLIGHT_END, HIGHLIGHT_START, SearchUnavailable, search
+
+console = Console()
+search_app = typer.Typer()
+
+
+def _highlighted(snippet: str) -> Text:
+    """Render snippet() markers as bold text without interpreting rich markup in the note."""
+    text = Text()
+    for i, part in enumerate(snippet.replace(HIGHLIGHT_END, HIGHLIGHT_START).split(HIGHLIGHT_START)):
+        text.append(part, style="bold yellow" if i % 2 else None)
+    return text
+
+
+def _plain(snippet: str) -> str:
+    return snippet.replace(HIGHLIGHT_START, "[").replace(HIGHLIGHT_END, "]")
+
+
+@search_app.command("search")
+def search_cmd(
+    query: list[str] = typer.Argument(..., help="Words to find (all must match)"),
+    limit: int = typer.Option(20, min=1, help="Maximum number of results"),
+    raw: bool = typer.Option(False, help="Pass the query to FTS5 unchanged (phrases, OR, NOT, prefix*)"),
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
+    """Full-text search over job notes and AI summaries, best matches first"""
+    with get_db() as db:
+        try:
+            results = search(db, " ".join(query), limit=limit, raw=raw)
+        except SearchUnavailable as exc:
+            console.print(f"[red]{exc}[/red]")
+            raise typer.Exit(code=1)
+        except OperationalError as exc:
+            console.print(f"[red]Invalid search query:[/red] {exc.orig}")
+            raise typer.Exit(code=1)
+
+    if fmt != OutputFormat.TABLE:
+        columns = ["job_id", "company", "title", "status", "kind", "snippet", "score"]
+        write_rows(fmt, columns, ((*r[:5], _plain(r.snippet), round(r.score, 4)) for r in results))
+        return
+
+    if not results:
+        console.print("No matches found.")
+        return
+
+    table = Table(title=f"Search — {' '.join(query)}", box=box.SQUARE, show_lines=True, header_style="bold cyan")
+    table.add_column("Job ID", no_wrap=True)
+    table.add_column("Company")
+    table.add_column("Title")
+    table.add_column("Status")
+    table.add_column("In")
+    table.add_column("Match")
+    for r in results:
+        table.add_row(r.job_id, r.company, r.title, r.status, r.kind, _highlighted(r.snippet))
+    console.print(table)
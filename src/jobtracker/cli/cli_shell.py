@@ -0,0 +1,150 @@
+"""Run many jobtracker commands in one process: an interactive shell and a batch runner.
+
+Commands run in-process against the already-open engine, so imports, engine setup
+and the schema check happen once instead of once per command.
+"""
+
+import shlex
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from jobtracker.db import transaction_scope
+
+console = Console()
+shell_app = typer.Typer()
+batch_app = typer.Typer()
+
+# Runner commands cannot be nested inside a runner.
+_RUNNER_COMMANDS = {"shell", "batch", "daemon"}
+
+
+def run_command(args: list[str]) -> int:
+    """Run one jobtracker command line in this process and return its exit code."""
+    if args and args[0] in _RUNNER_COMMANDS:
+        console.print(f"[red]{args[0]} cannot be run from inside shell or batch[/red]")
+        return 2
+    from jobtracker.cli.main import root_command
+
+    try:
+        rv = root_command().main(args=args, prog_name="jobtracker", standalone_mode=False)
+    except typer.TyperException as exc:
+        # Usage errors (unknown command, bad option value, ...)
+        console.print(f"[red]Error:[/red] {exc.format_message()}")
+        return exc.exit_code
+    except typer.Abort:
+        console.print("[red]Aborted[/red]")
+        return 1
+    except Exception as exc:
+        console.print(f"[red]Command failed:[/red] {exc}")
+        return 1
+    return rv if isinstance(rv, int) else 0
+
+
+def _split(line: str) -> list[str]:
+    """Split a command line like a POSIX shell; `#` starts a comment."""
+    return shlex.split(line, comments=True)
+
+
+@batch_app.command("batch")
+def batch(
+    file: Path = typer.Option(..., "--file", "-f", exists=True, dir_okay=False, help="File of commands, one per line"),
+    transaction: bool = typer.Option(False, help="Run every command in one transaction, committed at the end"),
+    keep_going: bool = typer.Option(False, help="Continue after a failed command instead of stopping"),
+):
+    """Run jobtracker commands from a file in one process
+
+    Each line is a command as typed after `jobtracker`, e.g. `job status 3fa9 offer`;
+    blank lines and `#` comments are skipped. Commands must not prompt, so pass every
+    value as an option. With --transaction, a failure rolls back the whole file
+    unless --keep-going is given, in which case only the failed commands are undone.
+    """
+    failed = ran = 0
+    with ExitStack() as stack:
+        if transaction:
+            stack.enter_context(transaction_scope())
+        for number, line in enumerate(file.read_text(encoding="utf-8").splitlines(), start=1):
+            try:
+                args = _split(line)
+            except ValueError as exc:
+                args, code = None, 2
+                console.print(f"[red]Line {number}: {exc}[/red]")
+            if args == []:
+                continue
+            if args is not None:
+                code = run_command(args)
+            ran += 1
+            if code == 0:
+                continue
+            failed += 1
+            typer.echo(f"Line {number} failed with exit code {code}: {line.strip()}", err=True)
+            if not keep_going:
+                if transaction:
+                    typer.echo("Rolling back every command in the batch", err=True)
+                # Leaving the transaction scope with an exception rolls it back.
+                raise typer.Exit(code=1)
+
+    typer.echo(f"Ran {ran} command(s); {failed} failed", err=True)
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _shell_meta(command: str, stack: ExitStack, state: dict) -> None:
+    """Handle the shell's own begin/commit/rollback commands."""
+    if command == "begin":
+        if state["conn"] is not None:
+            console.print("[red]A transaction is already open[/red]")
+            return
+        state["conn"] = stack.enter_context(transaction_scope())
+        console.print("Transaction started; commands are committed together by `commit`.")
+        return
+    if state["conn"] is None:
+        console.print("[red]No transaction is open; use `begin` first[/red]")
+        return
+    if command == "rollback":
+        state["conn"].rollback()
+    stack.close()
+    state["conn"] = None
+    console.print("Committed." if command == "commit" else "Rolled back.")
+
+
+@shell_app.command("shell")
+def shell(prompt: Optional[str] = typer.Option("jobtracker> ", help="Prompt text")):
+    """Interactive prompt running jobtracker commands in this process
+
+    Type commands as after `jobtracker` (e.g. `job list --limit 5`); `help` lists
+    them. `begin` … `commit` (or `rollback`) groups commands into one transaction.
+    `exit`, `quit` or Ctrl-D leaves; an open transaction is rolled back.
+    """
+    try:
+        import readline  # noqa: F401  (line editing and history when available)
+    except ImportError:
+        pass
+    state = {"conn": None}
+    with ExitStack() as stack:
+        while True:
+            try:
+                line = input(prompt)
+            except EOFError:
+                break
+            except KeyboardInterrupt:
+                console.print()
+                continue
+            try:
+                args = _split(line)
+            except ValueError as exc:
+                console.print(f"[red]{exc}[/red]")
+                continue
+            if not args:
+                continue
+            if args[0] in ("exit", "quit"):
+                break
+            if args[0] in ("begin", "commit", "rollback") and len(args) == 1:
+                _shell_meta(args[0], stack, state)
+                continue
+            run_command(["--help"] if args == ["help"] else args)
+        if state["conn"] is not None:
+            state["conn"].rollback()
+            console.print("Open transaction rolled back.")
@@ -0,0 +1,118 @@
+import typer
+from rich.console import Console
+from rich.table import Table
+from rich import box
+from jobtracker.db import get_db
+from jobtracker.cli.output import OutputFormat, write_rows
+from jobtracker.stats import SALARY_PERCENTILES, SalaryGroup, funnel, time_in_stage
+from jobtracker.stats import salary_histogram, salary_percentiles
+
+console = Console()
+stats_app = typer.Typer(help="Pipeline analytics: funnel, time-in-stage, salary")
+
+
+def _percent(ratio) -> str:
+    return "-" if ratio is None else f"{ratio:.0%}"
+
+
+def _days(value) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+@stats_app.command("funnel")
+def funnel_cmd(
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
+    """How many applications reached each stage, and how many are there now"""
+    with get_db() as db:
+        rows = funnel(db)
+
+    if fmt != OutputFormat.TABLE:
+        write_rows(fmt, ["status", "reached", "current", "of_applied", "from_previous"], rows)
+        return
+
+    table = Table(title="Application Funnel", box=box.SQUARE, header_style="bold cyan")
+    table.add_column("Stage")
+    table.add_column("Reached", justify="right")
+    table.add_column("Now", justify="right")
+    table.add_column("% of Applied", justify="right")
+    table.add_column("From Previous", justify="right")
+    for r in rows:
+        table.add_row(r.status, str(r.reached), str(r.current), _percent(r.of_applied), _percent(r.from_previous))
+    console.print(table)
+
+
+@stats_app.command("time-in-stage")
+def time_in_stage_cmd(
+    include_current: bool = typer.Option(False, help="Also count each job's current stage up to now"),
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
+    """Days applications spent in each stage before moving on"""
+    with get_db() as db:
+        rows = time_in_stage(db, include_current=include_current)
+
+    if fmt != OutputFormat.TABLE:
+        write_rows(fmt, ["status", "jobs", "avg_days", "median_days", "max_days"], rows)
+        return
+
+    if not rows:
+        console.print("No stage changes recorded yet.")
+        return
+
+    table = Table(title="Time in Stage (days)", box=box.SQUARE, header_style="bold cyan")
+    table.add_column("Stage")
+    table.add_column("Jobs", justify="right")
+    table.add_column("Average", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("Longest", justify="right")
+    for r in rows:
+        table.add_row(r.status, str(r.jobs), _days(r.avg_days), _days(r.median_days), _days(r.max_days))
+    console.print(table)
+
+
+def _money(value) -> str:
+    return "-" if value is None else f"${value:,}"
+
+
+@stats_app.command("salary")
+def salary_cmd(
+    by: SalaryGroup = typer.Option(SalaryGroup.ALL, help="Group salaries by status or source"),
+    histogram: bool = typer.Option(False, help="Show a histogram instead of percentiles"),
+    bucket: int = typer.Option(25_000, min=1, help="Histogram bin width"),
+    fmt: OutputFormat = typer.Option(OutputFormat.TABLE, "--format", help="table, or stream ndjson/csv/tsv for piping"),
+):
+    """Salary percentiles or histogram over jobs with a listed salary range (range midpoints)"""
+    with get_db() as db:
+        rows = salary_histogram(db, by, bucket) if histogram else salary_percentiles(db, by)
+
+    if fmt != OutputFormat.TABLE:
+        if histogram:
+            columns = ["group", "bucket", "jobs"]
+        else:
+            columns = ["group", "jobs", "min", *(f"p{p}" for p in SALARY_PERCENTILES), "max", "mean"]
+        write_rows(fmt, columns, rows)
+        return
+
+    if not rows:
+        console.print("No jobs with a salary range yet.")
+        return
+
+    if histogram:
+        widest = max(r.jobs for r in rows)
+        table = Table(title=f"Salary Histogram ({_money(bucket)} bins)", box=box.SQUARE, header_style="bold cyan")
+        table.add_column("Group")
+        table.add_column("From", justify="right")
+        table.add_column("Jobs", justify="right")
+        table.add_column("")
+        for r in rows:
+            bar = "█" * max(1, round(30 * r.jobs / widest))
+            table.add_row(r.group, _money(r.bucket), str(r.jobs), bar)
+        console.print(table)
+        return
+
+    table = Table(title="Salary Percentiles", box=box.SQUARE, header_style="bold cyan")
+    for header in ("Group", "Jobs", "Min", "P10", "P25", "Median", "P75", "P90", "Max", "Mean"):
+        table.add_column(header, justify="left" if header == "Group" else "right")
+    for r in rows:
+        table.add_row(r.group, str(r.jobs), *(_money(v) for v in r[2:]))
+    console.print(table)
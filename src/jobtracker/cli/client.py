@@ -0,0 +1,124 @@
+"""`jobtracker` entry point: forward the command to a running daemon, else run it here.
+
+Only the standard library is imported on the forwarding path, so a command served
+by `jobtracker daemon` costs a bare interpreter start plus one socket round trip.
+The client passes its stdin/stdout/stderr file descriptors along, so prompts,
+colors and pipes behave as if the command ran in this process.
+
+Protocol (one JSON object per line):
+  client -> daemon  {"op": "run", "argv": [...], "cwd": ..., "env": {...}}  + fds 0, 1, 2
+  daemon -> client  {"ready": true} or {"fallback": reason}
+  client -> daemon  {"go": true}
+  daemon -> client  {"exit": code}
+The extra "go" step lets a client that gave up waiting (the daemon is busy with
+another command) fall back to running in-process without the command running twice.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Optional
+
+NO_DAEMON_ENV = "JOBTRACKER_NO_DAEMON"
+SOCKET_ENV = "JOBTRACKER_SOCKET"
+# Environment that selects the database and engine; the daemon only serves
+# clients whose values match its own.
+FORWARDED_ENV = (
+    "HOME",
+    "JOBTRACKER_DB",
+    "JOBTRACKER_CONFIG",
+    "JOBTRACKER_DB_PROFILE",
+    "JOBTRACKER_BACKUP_DIR",
+    "JOBTRACKER_ARCHIVE_DB",
+    "JOBTRACKER_MATCH_CACHE",
+    "JOBTRACKER_PROFILE",
+    "JOBTRACKER_PROFILE_OUTPUT",
+)
+# Commands that always run in the client process.
+LOCAL_COMMANDS = {"daemon", "shell"}
+# Seconds to wait for the daemon to pick up a command before running it here.
+READY_TIMEOUT = 0.5
+
+
+def socket_path() -> str:
+    # Same directory as `jobtracker.db.APP_DIR`, without importing SQLAlchemy.
+    return os.environ.get(SOCKET_ENV) or os.path.join(os.path.expanduser("~"), ".jobtracker", "daemon.sock")
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def connect(path: Optional[str] = None) -> Optional[socket.socket]:
+    """Connect to the daemon socket, or return None when no daemon is listening."""
+    if not daemon_supported():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path or socket_path())
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message).encode() + b"\n"
+
+
+def read_message(sock: socket.socket) -> dict:
+    """Read one JSON line; raises ConnectionError if the peer hangs up first."""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = sock.recv(4096)
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return json.loads(data)
+
+
+def forward(argv: list[str]) -> Optional[int]:
+    """Run `argv` in the daemon and return its exit code; None when it cannot serve it."""
+    if os.environ.get(NO_DAEMON_ENV) or (argv and argv[0] in LOCAL_COMMANDS):
+        return None
+    if any(key.endswith("_COMPLETE") for key in os.environ if key.startswith("_JOBTRACKER")):
+        return None  # shell completion
+    sock = connect()
+    if sock is None:
+        return None
+    with sock:
+        request = {
+            "op": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": {key: os.environ.get(key) for key in FORWARDED_ENV},
+        }
+        try:
+            socket.send_fds(sock, [encode(request)], [0, 1, 2])
+            sock.settimeout(READY_TIMEOUT)
+            if not read_message(sock).get("ready"):
+                return None
+            sock.settimeout(None)
+            sock.sendall(encode({"go": True}))
+        except (OSError, ValueError):
+            return None
+        # From here on the command belongs to the daemon; never run it again locally.
+        try:
+            return int(read_message(sock).get("exit", 1))
+        except KeyboardInterrupt:
+            # Hanging up tells the daemon to interrupt the command.
+            return 130
+        except (OSError, ValueError):
+            print("jobtracker: lost connection to the daemon", file=sys.stderr)
+            return 1
+
+
+def run() -> None:
+    """Console-script entry point."""
+    code = forward(sys.argv[1:])
+    if code is None:
+        from jobtracker.cli.main import app
+
+        app()
+    sys.exit(code)
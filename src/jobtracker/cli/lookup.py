@@ -0,0 +1,61 @@
+"""ID arguments: accept any unique prefix of a resume, cover letter, job or note ID."""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from sqlalchemy import select
+
+from jobtracker.ids import MAX_CANDIDATES, AmbiguousIdError, resolve_id
+
+# IDs checked per exact-match query, well below SQLite's bound-parameter limit.
+EXACT_CHUNK = 500
+
+
+def full_id(db, model, ref: Optional[str], console: Console, label: Optional[str] = None) -> Optional[str]:
+    """Expand `ref` to the full ID it uniquely prefixes.
+
+    Unmatched references are returned unchanged so each command keeps its own
+    "not found" handling; ambiguous ones print the candidates and exit with code 1.
+    """
+    if not ref:
+        return ref
+    try:
+        return resolve_id(db, model, ref, label) or ref
+    except AmbiguousIdError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1)
+
+
+def full_ids(db, model, refs: list[str], console: Console) -> list[str]:
+    """Expand each of `refs` (e.g. the lines of an --ids-from file) like `full_id`.
+
+    Full IDs are confirmed in bulk; only the remaining references are resolved as
+    prefixes, one query each. Unmatched references are listed and returned
+    unchanged; if any is ambiguous, every ambiguous one is printed and the command
+    exits with code 1, so nothing is changed.
+    """
+    refs = [ref.strip().lower() for ref in refs]
+    exact = set()
+    for start in range(0, len(refs), EXACT_CHUNK):
+        exact.update(db.scalars(select(model.id).where(model.id.in_(refs[start : start + EXACT_CHUNK]))))
+    resolved, unknown, ambiguous = {}, [], []
+    for ref in dict.fromkeys(refs):
+        if ref in exact:
+            resolved[ref] = ref
+            continue
+        try:
+            resolved[ref] = resolve_id(db, model, ref) or ref
+        except AmbiguousIdError as exc:
+            ambiguous.append(str(exc))
+            continue
+        if resolved[ref] == ref:
+            unknown.append(ref)
+    if ambiguous:
+        for message in ambiguous:
+            console.print(f"[red]{message}[/red]")
+        raise typer.Exit(code=1)
+    if unknown:
+        shown = ", ".join(unknown[:MAX_CANDIDATES]) + (", ..." if len(unknown) > MAX_CANDIDATES else "")
+        console.print(f"[yellow]{len(unknown)} ID(s) match nothing: {shown}[/yellow]")
+    return list(dict.fromkeys(resolved.values()))
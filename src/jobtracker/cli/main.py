@@ -1,24 +1,157 @@
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
 import typer
-from jobtracker.cli.cli_jobs import job_app
-from jobtracker.cli.cli_resume import resume_app
-from jobtracker.cli.cli_cover_letter import cover_letter_app
-from jobtracker.db import init_db
-from jobtracker.cli.cli_notes import note_app
+from typer.core import TyperCommand, TyperGroup
+
+# Sub-apps are registered lazily: name -> (module, attribute, short help).
+# Importing a command module pulls in SQLAlchemy, pydantic, rich and the models,
+# so that only happens once typer has resolved which command is being run.
+LAZY_COMMANDS = {
+    "job": (
+        "jobtracker.cli.cli_jobs",
+        "job_app",
+        "Manage tracked job applications: add, import, list, update, status, note, remove",
+    ),
+    "resume": ("jobtracker.cli.cli_resume", "resume_app", "Manage resumes: add, list, tags, update, remove"),
+    "cover-letter": (
+        "jobtracker.cli.cli_cover_letter",
+        "cover_letter_app",
+        "Manage cover letters: add, list, tags, update, remove",
+    ),
+    "note": ("jobtracker.cli.cli_notes", "note_app", "Manage job notes"),
+    "search": ("jobtracker.cli.cli_search", "search_app", "Full-text search over job notes and AI summaries"),
+    "stats": ("jobtracker.cli.cli_stats", "stats_app", "Pipeline analytics: funnel, time-in-stage, salary"),
+    "shell": ("jobtracker.cli.cli_shell", "shell_app", "Interactive prompt running commands in one process"),
+    "batch": ("jobtracker.cli.cli_shell", "batch_app", "Run commands from a file in one process"),
+    "backup": (
+        "jobtracker.cli.cli_backup",
+        "backup_app",
+        "Back up the database while in use, compressed, with rotation",
+    ),
+    "restore": ("jobtracker.cli.cli_backup", "restore_app", "Replace the database with a backup"),
+    "archive": (
+        "jobtracker.cli.cli_archive",
+        "archive_app",
+        "Move rejected and ghosted jobs to the archive database",
+    ),
+    "match": (
+        "jobtracker.cli.cli_match",
+        "match_app",
+        "Rank resumes by how well they fit a job, or the best resume for every job",
+    ),
+    "daemon": (
+        "jobtracker.cli.cli_daemon",
+        "daemon_app",
+        "Warm background process serving commands: start, stop, status",
+    ),
+}
+
+# Seconds spent importing each lazily loaded command module, for `--profile`.
+import_times: dict[str, float] = {}
+# `ctx.meta` key holding the command line below the root group, e.g. "job list --limit 5".
+COMMAND_LINE_KEY = "jobtracker.command_line"
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports sub-apps from `LAZY_COMMANDS` on first use.
+
+    Listing commands (``--help`` and shell completion of command names) only needs
+    the short help stored in the registry, so no command module is imported for it.
+    """
+
+    _listing = False
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(LAZY_COMMANDS))
 
+    def get_command(self, ctx, cmd_name):
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in LAZY_COMMANDS:
+            return cmd
+        module_name, attr, short_help = LAZY_COMMANDS[cmd_name]
+        if self._listing:
+            return TyperCommand(name=cmd_name, help=short_help)
+        start = time.perf_counter()
+        sub_app = getattr(importlib.import_module(module_name), attr)
+        cmd = typer.main.get_command(sub_app)
+        import_times[cmd_name] = time.perf_counter() - start
+        # Shell-completion options belong to the root app, as with `add_typer`.
+        cmd.params = [p for p in cmd.params if p.name not in ("install_completion", "show_completion")]
+        cmd.name = cmd_name
+        self.add_command(cmd, cmd_name)
+        return cmd
 
-app = typer.Typer(help="JobTracker - CLI job application tracker")
+    def resolve_command(self, ctx, args):
+        cmd_name, cmd, rest = super().resolve_command(ctx, args)
+        ctx.meta[COMMAND_LINE_KEY] = " ".join([cmd_name or "", *rest])
+        return cmd_name, cmd, rest
 
-# Add sub-apps
-app.add_typer(job_app, name="job")
-app.add_typer(resume_app, name="resume")
-app.add_typer(cover_letter_app, name="cover-letter")
-app.add_typer(note_app, name="note")
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx, incomplete):
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
+
+app = typer.Typer(cls=LazyGroup, help="JobTracker - CLI job application tracker")
 
 
 @app.callback()
-def main():
-    """Initialize database (if needed)"""
-    init_db()
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        envvar="JOBTRACKER_PROFILE",
+        help="Report SQL statements and time per phase (import, validation, query, render) on stderr",
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        "--profile-output",
+        envvar="JOBTRACKER_PROFILE_OUTPUT",
+        dir_okay=False,
+        help="Also write the profile as JSON (.json) or as cProfile stats (any other suffix)",
+    ),
+):
+    """JobTracker - CLI job application tracker"""
+    # The database schema is initialized lazily by `jobtracker.db.get_db`, so
+    # `--help` and shell completion never open the database.
+    import_seconds = import_times.pop(ctx.invoked_subcommand, 0.0)
+    # Only loaded if the command's module uses the database.
+    dbmod = sys.modules.get("jobtracker.db")
+    if dbmod is not None and dbmod.engine_config_error is not None:
+        typer.echo(f"jobtracker: {dbmod.engine_config_error}", err=True)
+        raise typer.Exit(code=2)
+    if profile or profile_output:
+        from jobtracker import profiling
+
+        command = ctx.meta.get(COMMAND_LINE_KEY, ctx.invoked_subcommand or "")
+        profiler = profiling.start(command, profile_output, import_seconds)
+        if profiler is not None:
+            ctx.call_on_close(profiler.stop)
+
+
+_root_command = None
+
+
+def root_command():
+    """The click group behind `app`, built once so sub-apps stay loaded between in-process runs."""
+    global _root_command
+    if _root_command is None:
+        _root_command = typer.main.get_command(app)
+    return _root_command
 
 
 if __name__ == "__main__":
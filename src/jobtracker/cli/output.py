@@ -0,0 +1,91 @@
+"""Machine-readable output for list commands.
+
+Rows are written straight to stdout as they are fetched: no rich Table is built and
+no cell widths are measured, so exports run at I/O speed with bounded memory.
+"""
+
+import csv
+import enum
+import json
+import sys
+from typing import Iterable, Sequence
+
+from jobtracker.profiling import phase
+from jobtracker.read_models import fetch_rows
+
+
+class OutputFormat(str, enum.Enum):
+    TABLE = "table"
+    NDJSON = "ndjson"
+    CSV = "csv"
+    TSV = "tsv"
+
+
+# Rows fetched per round-trip when exporting.
+EXPORT_BATCH_SIZE = 1000
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _write_ndjson(out, columns, rows) -> int:
+    encode = json.JSONEncoder(ensure_ascii=False, default=_text).encode
+    count = 0
+    for row in rows:
+        out.write(encode(dict(zip(columns, row))))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _write_csv(out, columns, rows) -> int:
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow([_text(v) for v in row])
+        count += 1
+    return count
+
+
+def _write_tsv(out, columns, rows) -> int:
+    out.write("\t".join(columns) + "\n")
+    count = 0
+    for row in rows:
+        out.write("\t".join(_text(v).translate(_TSV_ESCAPES) for v in row))
+        out.write("\n")
+        count += 1
+    return count
+
+
+_WRITERS = {
+    OutputFormat.NDJSON: _write_ndjson,
+    OutputFormat.CSV: _write_csv,
+    OutputFormat.TSV: _write_tsv,
+}
+
+
+def write_rows(fmt: OutputFormat, columns: Sequence[str], rows: Iterable[Sequence], out=None) -> int:
+    """Stream `rows` to `out` (default: stdout) in `fmt`; return the number of rows written.
+
+    CSV and TSV start with a header line even when there are no rows. TSV escapes
+    backslash, tab and newline characters inside values as `\\\\`, `\\t` and `\\n`.
+    """
+    out = out or sys.stdout
+    with phase("render"):
+        count = _WRITERS[OutputFormat(fmt)](out, list(columns), rows)
+        out.flush()
+    return count
+
+
+def export_select(db, stmt, row_type, fmt: OutputFormat, out=None) -> int:
+    """Execute a column projection and stream its rows, read as `row_type`, in `fmt`."""
+    rows = fetch_rows(db, stmt, row_type, batch_size=EXPORT_BATCH_SIZE)
+    return write_rows(fmt, row_type._fields, rows, out=out)
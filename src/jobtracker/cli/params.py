@@ -0,0 +1,16 @@
+"""Parsers for option values shared by several commands."""
+
+import re
+from datetime import timedelta
+
+import typer
+
+_AGE_UNITS = {"h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_age(value: str) -> timedelta:
+    """Parse an age such as `60d`, `8w` or `12h`."""
+    match = re.fullmatch(r"\s*(\d+)\s*([hdw])\s*", value.lower())
+    if not match:
+        raise typer.BadParameter(f"{value!r} is not an age like 60d, 8w or 12h")
+    return timedelta(**{_AGE_UNITS[match.group(2)]: int(match.group(1))})
@@ -0,0 +1,76 @@
+"""Interactive resume / cover letter picker for `job add` and `job update`.
+
+Catalogs can hold thousands of tailored variants, so the picker lists only the
+newest few and filters as the user types: each answer is either a number from the
+last list, an ID (or unique ID prefix), `?` for the whole table, or words to search
+names and tags with. The entries and their search index come from
+`jobtracker.catalog`, loaded once per process and reloaded only after changes.
+"""
+
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from jobtracker.catalog import CatalogEntry, catalog_index
+from jobtracker.ids import MIN_PREFIX_LENGTH
+
+# Entries listed per search (and before the first one).
+PICKER_RESULTS = 10
+SHOW_ALL = "?"
+
+
+def _print_entries(console: Console, title: str, entries: list[CatalogEntry]) -> None:
+    table = Table(title=title, title_justify="left", show_header=True, header_style="bold cyan")
+    table.add_column("#", justify="right")
+    table.add_column("ID", style="dim")
+    table.add_column("Name")
+    table.add_column("Tags")
+    for n, entry in enumerate(entries, 1):
+        table.add_row(str(n), entry.id, entry.name.replace("\n", " ").strip(), entry.tags)
+    console.print(table)
+
+
+def _chosen(answer: str, shown: list[CatalogEntry], entries: list[CatalogEntry]) -> Optional[str]:
+    """The entry ID `answer` selects by list number or by ID prefix, or None for a search."""
+    if answer.isdigit() and 1 <= int(answer) <= len(shown):
+        return shown[int(answer) - 1].id
+    prefix = answer.lower()
+    if len(prefix) >= MIN_PREFIX_LENGTH:
+        ids = [entry.id for entry in entries if entry.id.startswith(prefix)]
+        if prefix in ids:
+            return prefix
+        if len(ids) == 1:
+            return ids[0]
+    return None
+
+
+def pick(db, model, label: str, console: Console, default: Optional[str] = None) -> Optional[str]:
+    """Prompt for the `model` entry to attach; returns its ID, or `default` on an empty answer.
+
+    Returns None without prompting when the catalog is empty.
+    """
+    index = catalog_index(db, model)
+    if not index.entries:
+        return None
+    shown = index.search("", PICKER_RESULTS)
+    more = len(index.entries) - len(shown)
+    _print_entries(console, f"\n{label}s" + (f" (newest {len(shown)} of {len(index.entries)})" if more else ""), shown)
+    question = f"{label} to attach: #, ID, search words or {SHOW_ALL} for all"
+    while True:
+        answer = typer.prompt(question, default=default or "", show_default=bool(default)).strip()
+        if not answer:
+            return default or None
+        if answer == SHOW_ALL:
+            shown = index.entries
+            _print_entries(console, f"All {label.lower()}s", shown)
+            continue
+        chosen = _chosen(answer, shown, index.entries)
+        if chosen:
+            return chosen
+        shown = index.search(answer, PICKER_RESULTS)
+        if shown:
+            _print_entries(console, f"{label}s matching {answer!r}", shown)
+        else:
+            console.print(f"[yellow]No {label.lower()}s match {answer!r}[/yellow]")
@@ -1,10 +1,14 @@
-from sqlalchemy import create_engine
+import configparser
+import os
+import re
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from pathlib import Path
 from contextlib import contextmanager
 
 APP_DIR = Path.home() / ".jobtracker"
-DB_PATH = APP_DIR / "jobtracker.db"
+DB_PATH = Path(os.environ.get("JOBTRACKER_DB", APP_DIR / "jobtracker.db"))
+CONFIG_PATH = Path(os.environ.get("JOBTRACKER_CONFIG", APP_DIR / "config.ini"))
 
 try:
     APP_DIR.mkdir(parents=True, exist_ok=True)
@@ -12,26 +16,219 @@ except Exception:
     # If we cannot create the dir, let the error surface; callers will see clearer exception
     raise
 
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False, future=True)
+# -----------------------------
+# Engine profiles
+# -----------------------------
+# PRAGMAs applied to every new SQLite connection, in order. busy_timeout comes
+# first so switching the journal mode waits for other writers instead of failing.
+ENGINE_PROFILES = {
+    # Short CLI commands, possibly run in parallel from scripts.
+    "interactive": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -65536,  # KiB (64 MiB)
+        "mmap_size": 268435456,  # 256 MiB
+    },
+    # Large imports and migrations: bigger cache, fewer WAL checkpoints.
+    "bulk-load": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -262144,  # KiB (256 MiB)
+        "mmap_size": 1073741824,  # 1 GiB
+        "wal_autocheckpoint": 10000,
+    },
+    # Reporting against a live database; rejects any write.
+    "read-only": {
+        "busy_timeout": 5000,
+        "query_only": "ON",
+        "temp_store": "MEMORY",
+        "cache_size": -131072,  # KiB (128 MiB)
+        "mmap_size": 1073741824,  # 1 GiB
+    },
+}
+DEFAULT_PROFILE = "interactive"
+
+
+class EngineConfigError(ValueError):
+    """Raised for an unknown engine profile or an unsupported PRAGMA setting."""
+
+
+_PRAGMA_NAMES = {name for pragmas in ENGINE_PROFILES.values() for name in pragmas}
+_PRAGMA_VALUE_RE = re.compile(r"^-?\w+$")
+
+
+def load_engine_settings(config_path: Path = CONFIG_PATH, environ=os.environ) -> tuple[str, dict]:
+    """Return the `(profile_name, pragma_overrides)` to use for the application engine.
+
+    The profile is taken from `JOBTRACKER_DB_PROFILE`, else the `profile` key of the
+    `[engine]` section in the config file, else `DEFAULT_PROFILE`. Any other key in
+    `[engine]` overrides the PRAGMA of the same name, e.g. `busy_timeout = 10000`.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(config_path)
+    section = dict(parser["engine"]) if parser.has_section("engine") else {}
+    config_profile = section.pop("profile", None)
+    profile = environ.get("JOBTRACKER_DB_PROFILE") or config_profile or DEFAULT_PROFILE
+    return profile, section
+
+
+def resolve_pragmas(profile: str, overrides: dict | None = None) -> dict:
+    """Merge a named profile with PRAGMA overrides, validating both."""
+    if profile not in ENGINE_PROFILES:
+        raise EngineConfigError(f"Unknown engine profile {profile!r}; choose from {', '.join(ENGINE_PROFILES)}")
+    pragmas = dict(ENGINE_PROFILES[profile])
+    for name, value in (overrides or {}).items():
+        if name not in _PRAGMA_NAMES or not _PRAGMA_VALUE_RE.match(str(value)):
+            raise EngineConfigError(f"Unsupported engine setting {name} = {value!r}")
+        pragmas[name] = value
+    return pragmas
+
+
+def apply_profile(eng, profile: str = DEFAULT_PROFILE, overrides: dict | None = None):
+    """Apply a profile's PRAGMAs to every connection `eng` opens; return `eng`."""
+    # PRAGMAs cannot take bound parameters; names and values are validated above.
+    statements = [f"PRAGMA {name} = {value}" for name, value in resolve_pragmas(profile, overrides).items()]
+
+    @event.listens_for(eng, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    return eng
+
+
+def _enable_foreign_keys(dbapi_conn, _record):
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.execute("PRAGMA foreign_keys = ON")
+    finally:
+        cursor.close()
+
+
+def enforce_foreign_keys(eng):
+    """Enforce foreign keys (and their ON DELETE CASCADE) on every new connection of `eng`."""
+    if not event.contains(eng, "connect", _enable_foreign_keys):
+        event.listen(eng, "connect", _enable_foreign_keys)
+    return eng
+
+
+def make_engine(path=DB_PATH, profile: str | None = None, overrides: dict | None = None):
+    """Create a SQLite engine for `path` tuned by the configured (or given) profile."""
+    eng = enforce_foreign_keys(create_engine(f"sqlite:///{path}", echo=False, future=True))
+    if profile is not None:
+        return apply_profile(eng, profile, overrides)
+    profile, config_overrides = load_engine_settings()
+    try:
+        return apply_profile(eng, profile, {**config_overrides, **(overrides or {})})
+    except EngineConfigError as exc:
+        from_env = profile not in ENGINE_PROFILES and os.environ.get("JOBTRACKER_DB_PROFILE")
+        source = "JOBTRACKER_DB_PROFILE" if from_env else f"[engine] in {CONFIG_PATH}"
+        raise EngineConfigError(f"{exc} (set by {source})") from None
+
+
+def _unconfigured_engine(path, error: EngineConfigError):
+    """Engine for `path` whose every connection attempt raises `error`."""
+    eng = create_engine(f"sqlite:///{path}", echo=False, future=True)
+
+    @event.listens_for(eng, "connect")
+    def _refuse(_dbapi_conn, _record):
+        raise error
+
+    return eng
+
+
+# A bad engine configuration must not break importing this module, or every command
+# would die with a traceback; the CLI reports `engine_config_error` in one line
+# instead, and connecting to the engine raises it.
+engine_config_error = None
+try:
+    engine = make_engine(DB_PATH)
+except EngineConfigError as exc:
+    engine_config_error = exc
+    engine = _unconfigured_engine(DB_PATH, exc)
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 Base = declarative_base()
 
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
+_initialized_binds = set()
+# Set by `transaction_scope()`: while set, `get_db()` sessions join its transaction.
+_shared_connection = None
+
+
+def init_db(bind=None) -> int:
+    """Migrate the schema on `bind` (defaults to the application engine) to the current version.
+
+    Engines not made by `make_engine` get foreign key enforcement here, for the
+    connections they open from now on; notes rely on it to go with their job.
+    """
+    from jobtracker.migrations import migrate
+
+    bind = bind or engine
+    enforce_foreign_keys(getattr(bind, "engine", bind))
+    return migrate(bind)
+
+
+def _ensure_schema(bind) -> None:
+    """Initialize the schema once per process for the engine behind `bind`."""
+    bind = bind.engine  # a Connection when sessions share `transaction_scope()`
+    if bind in _initialized_binds:
+        return
+    init_db(bind)
+    _initialized_binds.add(bind)
+
+
+@contextmanager
+def transaction_scope():
+    """Run every `get_db()` session opened inside the block in one database transaction.
+
+    Sessions join the transaction through a SAVEPOINT, so a command's own commit or
+    rollback only affects its own work. The block commits once at the end and rolls
+    everything back if it raises. The write lock is taken up front (BEGIN IMMEDIATE).
+    """
+    global _shared_connection
+    if _shared_connection is not None:
+        raise RuntimeError("a transaction scope is already active")
+    bind = SessionLocal.kw["bind"]
+    _ensure_schema(bind)
+    with bind.connect() as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        _shared_connection = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            _shared_connection = None
 
 
 @contextmanager
-def get_db():
+def get_db(bind=None):
     """Yield a database session and ensure it's closed afterwards.
 
     Use as: with get_db() as db: ...
-    Commits/rollbacks should be handled by callers where appropriate.
+    Commits/rollbacks should be handled by callers where appropriate. `bind` (an
+    engine or connection) replaces the application engine for this session.
     """
-    db = SessionLocal()
+    if bind is not None:
+        db = SessionLocal(bind=bind)
+    elif _shared_connection is not None:
+        db = SessionLocal(bind=_shared_connection, join_transaction_mode="create_savepoint")
+    else:
+        db = SessionLocal()
     try:
+        _ensure_schema(db.get_bind())
         yield db
     finally:
         db.close()
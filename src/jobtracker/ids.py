@@ -0,0 +1,109 @@
+"""Git-style short IDs: resolve unique prefixes and abbreviate IDs for display.
+
+Prefix lookups are range scans on the primary key (`id >= prefix AND id < next`),
+which SQLite answers from the key's index, unlike `LIKE 'prefix%'`.
+"""
+
+import json
+import os
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import func, select
+
+# Displayed IDs are never shorter than this, even when fewer characters are unique.
+MIN_PREFIX_LENGTH = 4
+# Candidates listed in an ambiguity error.
+MAX_CANDIDATES = 5
+# `short_ids` looks up the index neighbours of at most this many IDs (~17 us each);
+# beyond that, one pass over the whole key index (~0.6 s per 100k rows) is used.
+NEIGHBOUR_LOOKUPS = 20_000
+
+
+class AmbiguousIdError(ValueError):
+    def __init__(self, label: str, prefix: str, candidates: list[str]):
+        self.candidates = candidates
+        shown = ", ".join(candidates[:MAX_CANDIDATES]) + (", ..." if len(candidates) > MAX_CANDIDATES else "")
+        super().__init__(f"{label} ID prefix {prefix!r} is ambiguous; it matches {shown}")
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """The smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def resolve_id(db, model, prefix: str, label: Optional[str] = None) -> Optional[str]:
+    """Return the full ID of the `model` row whose ID is or starts with `prefix`.
+
+    Returns None when nothing matches and raises `AmbiguousIdError` when several
+    rows do (an exact match always wins). UUIDs are lower-case, so the prefix is too.
+    """
+    prefix = prefix.strip().lower()
+    if not prefix:
+        return None
+    stmt = (
+        select(model.id)
+        .where(model.id >= prefix, model.id < prefix_upper_bound(prefix))
+        .order_by(model.id)
+        .limit(MAX_CANDIDATES + 1)
+    )
+    matches = db.execute(stmt).scalars().all()
+    if len(matches) > 1 and matches[0] != prefix:
+        label = label or model.__tablename__[:-1].replace("_", " ").capitalize()
+        raise AmbiguousIdError(label, prefix, matches)
+    return matches[0] if matches else None
+
+
+def _needed_lengths(sorted_ids: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """Yield `(id, shortest unique prefix length)` for IDs given in sorted order.
+
+    An ID's prefix must extend one character past what it shares with either
+    neighbour, so a single pass comparing adjacent IDs is enough.
+    """
+    prev_id, prev_shared = None, 0
+    for current in sorted_ids:
+        if prev_id is not None:
+            shared = len(os.path.commonprefix([prev_id, current]))
+            yield prev_id, min(len(prev_id), max(MIN_PREFIX_LENGTH, prev_shared + 1, shared + 1))
+            prev_shared = shared
+        prev_id = current
+    if prev_id is not None:
+        yield prev_id, min(len(prev_id), max(MIN_PREFIX_LENGTH, prev_shared + 1))
+
+
+def _sorted_ids(db, model) -> Iterator[str]:
+    # The primary key index returns IDs in order without a sort step.
+    return db.execute(select(model.id).order_by(model.id).execution_options(yield_per=5000)).scalars()
+
+
+def _neighbour_lengths(db, model, wanted: set[str]) -> Iterator[tuple[str, int]]:
+    """Yield `(id, shortest unique prefix length)` for each of `wanted`, from its two
+    neighbours in the key index; one statement, two index probes per ID."""
+    wanted_ids = func.json_each(json.dumps(sorted(wanted))).table_valued("value").alias("wanted")
+    below = select(model.id).where(model.id < wanted_ids.c.value).order_by(model.id.desc()).limit(1)
+    above = select(model.id).where(model.id > wanted_ids.c.value).order_by(model.id).limit(1)
+    stmt = select(wanted_ids.c.value, below.scalar_subquery(), above.scalar_subquery())
+    for row_id, *neighbours in db.execute(stmt):
+        shared = max((len(os.path.commonprefix([row_id, n])) for n in neighbours if n is not None), default=0)
+        yield row_id, min(len(row_id), max(MIN_PREFIX_LENGTH, shared + 1))
+
+
+def short_ids(db, model, wanted: Iterable[str]) -> dict[str, str]:
+    """Map each ID in `wanted` to its shortest prefix that is unique among all `model` IDs.
+
+    Only the index neighbours of the wanted IDs are read, so a page of output costs
+    the same however large the table. Past `NEIGHBOUR_LOOKUPS` IDs one ordered pass
+    over the whole key index is cheaper and is used instead.
+    """
+    wanted = set(wanted)
+    if not wanted:
+        return {}
+    if len(wanted) > NEIGHBOUR_LOOKUPS:
+        lengths = (item for item in _needed_lengths(_sorted_ids(db, model)) if item[0] in wanted)
+    else:
+        lengths = _neighbour_lengths(db, model, wanted)
+    return {row_id: row_id[:n] for row_id, n in lengths}
+
+
+def unique_prefix_length(db, model) -> int:
+    """Length at which every `model` ID is unique. Reads the whole key index."""
+    return max((n for _, n in _needed_lengths(_sorted_ids(db, model))), default=MIN_PREFIX_LENGTH)
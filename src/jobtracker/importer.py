@@ -0,0 +1,178 @@
+"""Bulk job import from CSV, JSON or NDJSON files.
+
+Rows are validated with `JobCreate` and inserted through one Core `executemany` per
+batch, each batch in its own transaction. Resume and cover-letter references are
+resolved (by ID or name) against a single prefetch of both catalogs. Invalid rows are
+reported with their line/record number and skipped; they never abort a batch.
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+
+from jobtracker.enums import JobStatus
+from jobtracker.models import CoverLetter, Job, Resume, generate_uuid
+from jobtracker.profiling import phase
+from jobtracker.schemas import JobCreate, parse_salary_range
+
+IMPORT_FORMATS = ("csv", "json", "ndjson")
+_SUFFIX_FORMATS = {".csv": "csv", ".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+# Accepted spellings for the resume / cover letter reference columns.
+_RESUME_KEYS = ("resume", "resume_id", "resume_submitted")
+_COVER_LETTER_KEYS = ("cover_letter", "cover_letter_id", "cover_letter_submitted")
+
+
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+def detect_format(path: Path, fmt: Optional[str] = None) -> str:
+    fmt = fmt or _SUFFIX_FORMATS.get(path.suffix.lower())
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"cannot tell the format of {path.name}; pass one of {', '.join(IMPORT_FORMATS)}")
+    return fmt
+
+
+def read_records(path: Path, fmt: str) -> Iterator[tuple[int, Union[dict, str]]]:
+    """Yield `(position, record)` pairs; position is the file line (CSV/NDJSON) or array index (JSON).
+
+    NDJSON records are yielded as raw lines and decoded per row, so one malformed
+    line is reported as a row error instead of aborting the import.
+    """
+    with open(path, newline="", encoding="utf-8") as fh:
+        if fmt == "csv":
+            # Line 1 is the header row.
+            yield from enumerate(csv.DictReader(fh), start=2)
+        elif fmt == "ndjson":
+            yield from ((n, line) for n, line in enumerate(fh, start=1) if line.strip())
+        else:
+            records = json.load(fh)
+            if not isinstance(records, list):
+                raise ValueError("a JSON import file must contain an array of job objects")
+            yield from enumerate(records, start=1)
+
+
+def _normalize(record: Union[dict, str]) -> dict:
+    """Decode NDJSON lines, lower-case/underscore the keys and turn empty strings into None."""
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise ValueError("expected an object of job fields")
+    out = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        out[key.strip().lower().replace(" ", "_").replace("-", "_")] = value
+    return out
+
+
+def _first(record: dict, keys: Iterable[str]) -> Optional[str]:
+    return next((record[k] for k in keys if record.get(k)), None)
+
+
+class _CatalogLookup:
+    """Resolve a resume/cover-letter reference given as an ID or a name (newest wins)."""
+
+    def __init__(self, db, model, label: str):
+        self.label = label
+        self.ids = set()
+        self.by_name = {}
+        for row_id, name in db.execute(select(model.id, model.name).order_by(model.created_at)):
+            self.ids.add(row_id)
+            self.by_name[name.strip().lower()] = row_id
+
+    def resolve(self, ref: Optional[str]) -> Optional[str]:
+        if not ref:
+            return None
+        if ref in self.ids:
+            return ref
+        try:
+            return self.by_name[ref.strip().lower()]
+        except KeyError:
+            raise ValueError(f"unknown {self.label} {ref!r}") from None
+
+
+def _parse_date(value) -> Optional[datetime]:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(str(value))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in exc.errors())
+
+
+def build_job_row(record: Union[dict, str], resumes: _CatalogLookup, letters: _CatalogLookup, now: datetime) -> dict:
+    """Validate one record and return the `jobs` row to insert; raises ValueError when invalid."""
+    record = _normalize(record)
+    try:
+        with phase("validation"):
+            job_in = JobCreate(
+                company=record.get("company") or "",
+                title=record.get("title") or "",
+                location=record.get("location"),
+                salary_range=record.get("salary_range"),
+                job_url=record.get("job_url"),
+                source=record.get("source"),
+                resume_submitted=_first(record, _RESUME_KEYS),
+                cover_letter_submitted=_first(record, _COVER_LETTER_KEYS),
+            )
+    except ValidationError as exc:
+        raise ValueError(_validation_message(exc)) from None
+    salary_min, salary_max = parse_salary_range(job_in.salary_range)
+    return {
+        "id": generate_uuid(),
+        "company": job_in.company,
+        "title": job_in.title,
+        "location": job_in.location,
+        "salary_range": job_in.salary_range,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "job_url": str(job_in.job_url) if job_in.job_url else None,
+        "source": job_in.source,
+        "status": JobStatus(record.get("status") or JobStatus.APPLIED.value),
+        "applied_date": _parse_date(record.get("applied_date")) or now,
+        "last_updated": now,
+        "created_at": now,
+        "resume_id": resumes.resolve(job_in.resume_submitted),
+        "cover_letter_id": letters.resolve(job_in.cover_letter_submitted),
+    }
+
+
+def import_jobs(db, records: Iterable[tuple[int, dict]], batch_size: int = 1000, dry_run: bool = False):
+    """Validate and insert `records`, committing once per batch of `batch_size` records.
+
+    With `dry_run`, rows are validated and counted but nothing is written.
+    """
+    report = ImportReport()
+    resumes, letters = _CatalogLookup(db, Resume, "resume"), _CatalogLookup(db, CoverLetter, "cover letter")
+    now = datetime.now(timezone.utc)
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        rows = []
+        for position, record in batch:
+            try:
+                rows.append(build_job_row(record, resumes, letters, now))
+            except ValueError as exc:
+                report.errors.append((position, str(exc)))
+        if rows and not dry_run:
+            try:
+                db.execute(insert(Job), rows)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        report.inserted += len(rows)
+    return report
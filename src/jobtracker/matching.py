@@ -0,0 +1,252 @@
+"""Resume-to-job match scores: TF-IDF cosine similarity of hashed bag-of-words vectors.
+
+Every document becomes a sparse vector of term counts. A resume's document is its
+file plus its name and tags; a job's is its title and AI summary. Words are hashed
+into `N_FEATURES` buckets, so vectors need no shared vocabulary and each one can be
+cached on its own: resume vectors are stored under `MATCH_CACHE_DIR`, one file per
+SHA-256 of the resume file's contents, so an unchanged resume is read and hashed
+but never tokenized again.
+
+Scoring weights counts by sublinear TF and by IDF over the resumes and jobs being
+scored, L2-normalizes the rows and gets every cosine similarity from one matrix
+product per block of jobs (NumPy, the optional `match` extra). Only buckets that
+occur in both some resume and some job get a row of the resume matrix, since no
+other bucket adds to a dot product, and each block of jobs multiplies only the rows
+for the words it uses.
+"""
+
+import hashlib
+import html
+import io
+import os
+import re
+import zipfile
+import zlib
+from itertools import chain
+from pathlib import Path
+from typing import NamedTuple, Optional, Sequence
+
+from sqlalchemy import select
+
+from jobtracker.db import APP_DIR
+from jobtracker.models import Resume
+
+MATCH_CACHE_DIR = Path(os.environ.get("JOBTRACKER_MATCH_CACHE", APP_DIR / "match-cache"))
+# Hash buckets; collisions are rare below ~100k distinct words.
+_BUCKET_BITS = 20
+N_FEATURES = 1 << _BUCKET_BITS
+# Part of every cache key: bump it when tokenization changes.
+VECTOR_VERSION = 1
+# Jobs scored per matrix product. Each block only gets columns for the words its jobs
+# use, so small blocks multiply fewer zeros; below ~32 the per-block overhead dominates.
+JOB_BLOCK = 64
+# Words, keeping the + and # of names like C++ and C#.
+_TOKEN = re.compile(r"\w[\w+#]*")
+_XML_TAG = re.compile(r"<[^>]+>")
+
+
+class MatchError(RuntimeError):
+    """Raised when match scores cannot be computed."""
+
+
+class Match(NamedTuple):
+    resume_id: str
+    score: float
+
+
+class MatchResult(NamedTuple):
+    # Best resumes per job ID, best first; jobs sharing no terms with any resume map to []
+    matches: dict[str, list[Match]]
+    resumes: int
+    # Resume vectors read from the cache instead of tokenized
+    cached: int
+    # IDs of resumes whose file could not be read; they are scored on name and tags only
+    unreadable: list[str]
+
+
+class _Rows(NamedTuple):
+    """Sparse rows in CSR layout: row i holds `buckets[indptr[i]:indptr[i + 1]]` with `counts`."""
+
+    indptr: object
+    buckets: object
+    counts: object
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise MatchError("Match scores need the numpy package (pip install 'jobtracker[match]')") from None
+    return numpy
+
+
+def _bucket(word: str) -> int:
+    # crc32 rather than hash(): cached vectors must map words the same way in every process.
+    return zlib.crc32(word.encode()) & (N_FEATURES - 1)
+
+
+def _count_rows(np, texts: Sequence[str]) -> _Rows:
+    """Term counts of each of `texts`, one row per text.
+
+    Each distinct word is hashed once; the occurrences are then counted for all
+    texts together by one `unique` over `(row, bucket)` packed into an integer.
+    """
+    words = [_TOKEN.findall(text.lower()) for text in texts]
+    flat = list(chain.from_iterable(words))
+    buckets = {word: _bucket(word) for word in set(flat)}
+    keys = np.fromiter(map(buckets.__getitem__, flat), dtype=np.uint64, count=len(flat))
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    keys |= np.repeat(np.arange(len(words), dtype=np.uint64), lengths) << np.uint64(_BUCKET_BITS)
+    keys, counts = np.unique(keys, return_counts=True)
+    indptr = np.zeros(len(words) + 1, dtype=np.int64)
+    np.cumsum(np.bincount((keys >> np.uint64(_BUCKET_BITS)).astype(np.int64), minlength=len(words)), out=indptr[1:])
+    return _Rows(indptr, (keys & np.uint64(N_FEATURES - 1)).astype(np.uint32), counts.astype(np.uint32))
+
+
+def _docx_text(data: bytes) -> str:
+    with zipfile.ZipFile(io.BytesIO(data)) as docx:
+        xml = docx.read("word/document.xml").decode("utf-8", errors="replace")
+    return html.unescape(_XML_TAG.sub(" ", xml.replace("</w:p>", "\n")))
+
+
+def document_text(path: Path, data: bytes) -> str:
+    """Text of the resume file `path` with contents `data`: plain text, or the body of a .docx.
+
+    Raises ValueError for formats whose text cannot be extracted (PDF and other binaries).
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".docx":
+        try:
+            return _docx_text(data)
+        except (zipfile.BadZipFile, KeyError) as exc:
+            raise ValueError(f"not a Word document: {exc}") from exc
+    if suffix in (".pdf", ".doc", ".odt") or b"\0" in data[:1024]:
+        raise ValueError(f"cannot extract text from {suffix or 'binary'} files")
+    return data.decode("utf-8", errors="replace")
+
+
+def _vector(np, text: str):
+    """Term counts of `text` as a (2, n) uint32 array: buckets, ascending, over their counts."""
+    row = _count_rows(np, [text])
+    return np.stack([row.buckets, row.counts])
+
+
+def file_vector(np, path: Path, cache_dir: Path = MATCH_CACHE_DIR) -> tuple:
+    """`(vector, cached)`: the term counts of the resume file at `path` (see `_vector`), and
+    whether they came from the cache. Raises OSError or ValueError for unreadable files."""
+    data = path.read_bytes()
+    digest = hashlib.sha256(f"v{VECTOR_VERSION}:{N_FEATURES}:".encode())
+    digest.update(data)
+    cached = cache_dir / f"{digest.hexdigest()}.npy"
+    try:
+        return np.load(cached), True
+    except (OSError, ValueError, EOFError):
+        pass
+    vector = _vector(np, document_text(path, data))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    part = cache_dir / f".{cached.name}.{os.getpid()}.part"
+    with open(part, "wb") as out:
+        np.save(out, vector)
+    os.replace(part, cached)
+    return vector, False
+
+
+def _merge(np, a, b):
+    """Sum of two vectors made by `_vector`."""
+    buckets, inverse = np.unique(np.concatenate([a[0], b[0]]), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate([a[1], b[1]]), minlength=len(buckets))
+    return np.stack([buckets, counts.astype(np.uint32)])
+
+
+def _stack(np, vectors: list) -> _Rows:
+    indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+    np.cumsum([v.shape[1] for v in vectors], out=indptr[1:])
+    if not vectors:
+        return _Rows(indptr, np.zeros(0, np.uint32), np.zeros(0, np.uint32))
+    return _Rows(indptr, np.concatenate([v[0] for v in vectors]), np.concatenate([v[1] for v in vectors]))
+
+
+def _tfidf(np, rows: _Rows, idf) -> tuple:
+    """`(row of each entry, weight)`: sublinear TF x IDF, each row scaled to unit length."""
+    n = len(rows.indptr) - 1
+    row_of = np.repeat(np.arange(n), np.diff(rows.indptr))
+    weights = (1 + np.log(rows.counts)) * idf[rows.buckets]
+    norms = np.sqrt(np.bincount(row_of, weights=weights * weights, minlength=n))
+    return row_of, (weights / norms[row_of]).astype(np.float32)
+
+
+def _top(np, scores, top: int):
+    """Per row of `scores`: the `top` highest `(column, score)` pairs above 0, best first."""
+    k = min(top, scores.shape[1])
+    columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    best = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-best, axis=1, kind="stable")
+    columns, best = np.take_along_axis(columns, order, axis=1), np.take_along_axis(best, order, axis=1)
+    for row_columns, row_best in zip(columns.tolist(), best.tolist()):
+        yield [(column, score) for column, score in zip(row_columns, row_best) if score > 0]
+
+
+def _score(np, resumes: _Rows, jobs: _Rows, top: int):
+    """Cosine similarities of every job to every resume, as `_top` pairs per job."""
+    n_resumes, n_jobs = len(resumes.indptr) - 1, len(jobs.indptr) - 1
+    df = np.bincount(resumes.buckets, minlength=N_FEATURES) + np.bincount(jobs.buckets, minlength=N_FEATURES)
+    idf = np.log((1 + n_resumes + n_jobs) / (1 + df)) + 1
+    resume_rows, resume_weights = _tfidf(np, resumes, idf)
+    job_rows, job_weights = _tfidf(np, jobs, idf)
+    # Only buckets in both a resume and a job add to any dot product (norms include the rest).
+    vocab = np.intersect1d(resumes.buckets, jobs.buckets)
+    if not len(vocab):
+        yield from ([] for _ in range(n_jobs))
+        return
+    shared = np.isin(resumes.buckets, vocab)
+    matrix = np.zeros((len(vocab), n_resumes), dtype=np.float32)
+    matrix[np.searchsorted(vocab, resumes.buckets[shared]), resume_rows[shared]] = resume_weights[shared]
+    columns = np.searchsorted(vocab, jobs.buckets).clip(max=len(vocab) - 1)
+    known = vocab[columns] == jobs.buckets
+    for start in range(0, n_jobs, JOB_BLOCK):
+        stop = min(start + JOB_BLOCK, n_jobs)
+        lo, hi = jobs.indptr[start], jobs.indptr[stop]
+        keep = known[lo:hi]
+        used, local = np.unique(columns[lo:hi][keep], return_inverse=True)
+        block = np.zeros((stop - start, len(used)), dtype=np.float32)
+        block[job_rows[lo:hi][keep] - start, local] = job_weights[lo:hi][keep]
+        yield from _top(np, block @ matrix[used], top)
+
+
+def resume_vectors(np, db, cache_dir: Path = MATCH_CACHE_DIR) -> tuple:
+    """`(ids, vectors, cached, unreadable)` for every resume, newest first (see `MatchResult`)."""
+    ids, vectors, unreadable, cached = [], [], [], 0
+    stmt = select(Resume.id, Resume.name, Resume.tags, Resume.file_path).order_by(Resume.created_at.desc())
+    for resume_id, name, tags, file_path in db.execute(stmt):
+        vector = _vector(np, f"{name or ''} {tags or ''}")
+        try:
+            contents, hit = file_vector(np, Path(file_path).expanduser(), cache_dir)
+        except (OSError, ValueError):
+            unreadable.append(resume_id)
+        else:
+            vector = _merge(np, vector, contents)
+            cached += hit
+        ids.append(resume_id)
+        vectors.append(vector)
+    return ids, vectors, cached, unreadable
+
+
+def match_jobs(
+    db,
+    jobs: Sequence[tuple[str, str, Optional[str]]],
+    top: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> MatchResult:
+    """Score every resume against each `(job ID, title, AI summary)` of `jobs`; keep the `top` best.
+
+    Resume vectors are cached in `cache_dir` (default: `MATCH_CACHE_DIR`).
+    """
+    np = _numpy()
+    ids, vectors, cached, unreadable = resume_vectors(np, db, cache_dir or MATCH_CACHE_DIR)
+    matches = {job_id: [] for job_id, _, _ in jobs}
+    if ids and jobs:
+        documents = _count_rows(np, [f"{title or ''} {summary or ''}" for _, title, summary in jobs])
+        scores = _score(np, _stack(np, vectors), documents, top)
+        for (job_id, _, _), best in zip(jobs, scores):
+            matches[job_id] = [Match(ids[column], round(score, 4)) for column, score in best]
+    return MatchResult(matches, len(ids), cached, unreadable)
@@ -0,0 +1,345 @@
+"""Versioned schema migrations.
+
+The schema version is stored in SQLite's ``PRAGMA user_version``. Reading it is a
+single integer lookup, so an up-to-date database costs one statement per process
+instead of reflecting every table. When the stored version is behind
+`SCHEMA_VERSION`, the pending steps run in order inside one write transaction.
+
+Every step must be idempotent: databases created before versioning existed report
+version 0 even though some of their tables (and possibly columns) already exist.
+"""
+
+import logging
+from typing import Callable
+
+from jobtracker.db import Base
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS: list[tuple[int, str, Callable]] = []
+
+
+def migration(version: int, description: str):
+    """Register `fn(conn)` as the step that upgrades the schema to `version`."""
+
+    def decorator(fn):
+        MIGRATIONS.append((version, description, fn))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return fn
+
+    return decorator
+
+
+def get_schema_version(conn) -> int:
+    return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def _set_schema_version(conn, version: int) -> None:
+    # PRAGMA values cannot be bound parameters; `version` is always an int.
+    conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+def table_columns(conn, table_name: str) -> set[str]:
+    return {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table_name})")}
+
+
+def create_indexes(conn, *table_names: str) -> None:
+    """Create every index the models declare on `table_names` that does not exist yet.
+
+    Indexes over columns a later step adds are skipped; that step creates them.
+    """
+    for name in table_names:
+        existing = table_columns(conn, name)
+        for index in Base.metadata.tables[name].indexes:
+            if {c.name for c in index.columns} <= existing:
+                index.create(conn, checkfirst=True)
+
+
+def add_columns(conn, table_name: str, *column_names: str) -> None:
+    """Add model columns missing from an existing table (ALTER TABLE ... ADD COLUMN)."""
+    table = Base.metadata.tables[table_name]
+    existing = table_columns(conn, table_name)
+    for name in column_names:
+        if name not in existing:
+            column_type = table.c[name].type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_type}")
+
+
+# -----------------------------
+# Migration steps
+# -----------------------------
+@migration(1, "initial schema")
+def _initial_schema(conn) -> None:
+    Base.metadata.create_all(conn)
+
+
+@migration(2, "secondary indexes for CLI queries")
+def _secondary_indexes(conn) -> None:
+    create_indexes(conn, "jobs", "notes", "resumes", "cover_letters")
+
+
+@migration(3, "composite (created_at, id) index for keyset pagination of jobs")
+def _jobs_keyset_index(conn) -> None:
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_jobs_created_at")
+    create_indexes(conn, "jobs")
+
+
+@migration(4, "indexes for job list filters (applied_date, source)")
+def _job_filter_indexes(conn) -> None:
+    create_indexes(conn, "jobs")
+
+
+def fts5_available(conn) -> bool:
+    options = {row[0] for row in conn.exec_driver_sql("PRAGMA compile_options")}
+    return "ENABLE_FTS5" in options
+
+
+# Keep the search documents of notes in step with the notes table.
+_NOTES_SEARCH_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS notes_search_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO search_docs (kind, ref_id, job_id, body) VALUES ('note', new.id, new.job_id, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS notes_search_au AFTER UPDATE OF content, job_id ON notes BEGIN
+        UPDATE search_docs SET body = new.content, job_id = new.job_id WHERE kind = 'note' AND ref_id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS notes_search_ad AFTER DELETE ON notes BEGIN
+        DELETE FROM search_docs WHERE kind = 'note' AND ref_id = old.id;
+    END""",
+)
+
+# Full-text search: `search_docs` holds one row per searchable text (a note, or a
+# job's AI summary) keyed by (kind, ref_id), so the sync triggers find rows through
+# an index. `search_fts` is an external-content FTS5 index over `search_docs.body`.
+_SEARCH_DDL = (
+    """CREATE TABLE IF NOT EXISTS search_docs (
+        id INTEGER PRIMARY KEY,
+        kind TEXT NOT NULL,
+        ref_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        body TEXT NOT NULL,
+        UNIQUE (kind, ref_id)
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_search_docs_job_id ON search_docs (job_id)",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+        body, content='search_docs', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS search_docs_ai AFTER INSERT ON search_docs BEGIN
+        INSERT INTO search_fts (rowid, body) VALUES (new.id, new.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_docs_ad AFTER DELETE ON search_docs BEGIN
+        INSERT INTO search_fts (search_fts, rowid, body) VALUES ('delete', old.id, old.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_docs_au AFTER UPDATE ON search_docs BEGIN
+        INSERT INTO search_fts (search_fts, rowid, body) VALUES ('delete', old.id, old.body);
+        INSERT INTO search_fts (rowid, body) VALUES (new.id, new.body);
+    END""",
+    *_NOTES_SEARCH_TRIGGERS,
+    """CREATE TRIGGER IF NOT EXISTS jobs_search_ai AFTER INSERT ON jobs
+    WHEN coalesce(new.ai_summary, '') != '' BEGIN
+        INSERT INTO search_docs (kind, ref_id, job_id, body) VALUES ('summary', new.id, new.id, new.ai_summary);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_search_au AFTER UPDATE OF ai_summary ON jobs BEGIN
+        DELETE FROM search_docs WHERE kind = 'summary' AND ref_id = old.id;
+        INSERT INTO search_docs (kind, ref_id, job_id, body)
+        SELECT 'summary', new.id, new.id, new.ai_summary WHERE coalesce(new.ai_summary, '') != '';
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_search_ad AFTER DELETE ON jobs BEGIN
+        DELETE FROM search_docs WHERE kind = 'summary' AND ref_id = old.id;
+    END""",
+    # Backfill existing rows; OR IGNORE keeps the step idempotent.
+    """INSERT OR IGNORE INTO search_docs (kind, ref_id, job_id, body)
+    SELECT 'note', id, job_id, content FROM notes""",
+    """INSERT OR IGNORE INTO search_docs (kind, ref_id, job_id, body)
+    SELECT 'summary', id, id, ai_summary FROM jobs WHERE coalesce(ai_summary, '') != ''""",
+)
+
+
+@migration(5, "FTS5 full-text index over notes and AI summaries")
+def _search_index(conn) -> None:
+    # Without FTS5 the rest of the CLI still works; `jobtracker search` reports it.
+    if not fts5_available(conn):
+        return
+    for statement in _SEARCH_DDL:
+        conn.exec_driver_sql(statement)
+
+
+# Current time in the text format SQLAlchemy stores DateTime columns in on SQLite.
+SQL_NOW = "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+# Status history: every change of `jobs.status` appends a `status_events` row, and
+# `status_counts` keeps per-status totals (jobs currently in a status, and jobs that
+# ever reached it) so the funnel never has to scan jobs or events.
+_STATUS_HISTORY_BACKFILL = (
+    # Jobs created before history existed: assume they started as 'applied' and
+    # moved to their current status when they were last updated.
+    f"""INSERT INTO status_events (job_id, from_status, to_status, changed_at)
+    SELECT id, NULL, 'applied', coalesce(applied_date, created_at, {SQL_NOW}) FROM jobs
+    WHERE status IS NOT NULL AND NOT EXISTS (SELECT 1 FROM status_events AS e WHERE e.job_id = jobs.id)
+    UNION ALL
+    SELECT id, 'applied', status, coalesce(last_updated, created_at, {SQL_NOW}) FROM jobs
+    WHERE status IS NOT NULL AND status != 'applied'
+      AND NOT EXISTS (SELECT 1 FROM status_events AS e WHERE e.job_id = jobs.id)""",
+    "DELETE FROM status_counts",
+    """INSERT INTO status_counts (status, current, reached)
+    SELECT status, sum(current), sum(reached) FROM (
+        SELECT status, count(*) AS current, 0 AS reached FROM jobs WHERE status IS NOT NULL GROUP BY status
+        UNION ALL
+        SELECT to_status, 0, count(DISTINCT job_id) FROM status_events GROUP BY to_status
+    ) GROUP BY status""",
+)
+_STATUS_HISTORY_TRIGGERS = (
+    # A job's first event starts the clock at its applied date when it has one.
+    f"""CREATE TRIGGER IF NOT EXISTS jobs_status_ai AFTER INSERT ON jobs
+    WHEN new.status IS NOT NULL BEGIN
+        INSERT INTO status_events (job_id, from_status, to_status, changed_at)
+        VALUES (new.id, NULL, new.status, coalesce(new.applied_date, new.created_at, {SQL_NOW}));
+        INSERT INTO status_counts (status, current, reached) VALUES (new.status, 1, 0)
+        ON CONFLICT (status) DO UPDATE SET current = current + 1;
+    END""",
+    # Writers stamp last_updated with the change; fall back to now when they did not.
+    f"""CREATE TRIGGER IF NOT EXISTS jobs_status_au AFTER UPDATE OF status ON jobs
+    WHEN new.status IS NOT NULL AND new.status IS NOT old.status BEGIN
+        INSERT INTO status_events (job_id, from_status, to_status, changed_at)
+        VALUES (new.id, old.status, new.status,
+                CASE WHEN new.last_updated IS NOT old.last_updated THEN new.last_updated ELSE {SQL_NOW} END);
+        UPDATE status_counts SET current = current - 1 WHERE status = old.status;
+        INSERT INTO status_counts (status, current, reached) VALUES (new.status, 1, 0)
+        ON CONFLICT (status) DO UPDATE SET current = current + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_status_ad AFTER DELETE ON jobs BEGIN
+        DELETE FROM status_events WHERE job_id = old.id;
+        UPDATE status_counts SET current = current - 1 WHERE status = old.status;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS status_events_ai AFTER INSERT ON status_events
+    WHEN NOT EXISTS (SELECT 1 FROM status_events
+                     WHERE job_id = new.job_id AND to_status = new.to_status AND id != new.id) BEGIN
+        INSERT INTO status_counts (status, current, reached) VALUES (new.to_status, 0, 1)
+        ON CONFLICT (status) DO UPDATE SET reached = reached + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS status_events_ad AFTER DELETE ON status_events
+    WHEN NOT EXISTS (SELECT 1 FROM status_events WHERE job_id = old.job_id AND to_status = old.to_status) BEGIN
+        UPDATE status_counts SET reached = reached - 1 WHERE status = old.to_status;
+    END""",
+)
+
+
+@migration(6, "status history events and per-status counters")
+def _status_history(conn) -> None:
+    for name in ("status_events", "status_counts"):
+        Base.metadata.tables[name].create(conn, checkfirst=True)
+    create_indexes(conn, "status_events")
+    # Backfill before the triggers exist so existing rows are not counted twice.
+    for statement in _STATUS_HISTORY_BACKFILL + _STATUS_HISTORY_TRIGGERS:
+        conn.exec_driver_sql(statement)
+
+
+@migration(7, "numeric salary_min/salary_max columns parsed from salary_range")
+def _salary_columns(conn) -> None:
+    from jobtracker.schemas import parse_salary_range
+
+    add_columns(conn, "jobs", "salary_min", "salary_max")
+    create_indexes(conn, "jobs")
+    rows = conn.exec_driver_sql(
+        "SELECT id, salary_range FROM jobs WHERE salary_range IS NOT NULL AND salary_min IS NULL"
+    ).all()
+    updates = [(low, high, job_id) for job_id, low, high in ((r[0], *parse_salary_range(r[1])) for r in rows)]
+    updates = [u for u in updates if u[0] is not None]
+    if updates:
+        conn.exec_driver_sql("UPDATE jobs SET salary_min = ?, salary_max = ? WHERE id = ?", updates)
+
+
+@migration(8, "normalized tags for resumes and cover letters")
+def _normalized_tags(conn) -> None:
+    from jobtracker.tags import split_tags
+
+    for name in ("tags", "resume_tags", "cover_letter_tags"):
+        Base.metadata.tables[name].create(conn, checkfirst=True)
+    create_indexes(conn, "resume_tags", "cover_letter_tags")
+    # Move the comma-separated text into the link tables; OR IGNORE keeps this idempotent.
+    for owner_table, link_table, owner_id in (
+        ("resumes", "resume_tags", "resume_id"),
+        ("cover_letters", "cover_letter_tags", "cover_letter_id"),
+    ):
+        links = [
+            (row_id, tag)
+            for row_id, tags in conn.exec_driver_sql(f"SELECT id, tags FROM {owner_table} WHERE tags IS NOT NULL")
+            for tag in split_tags(tags)
+        ]
+        if not links:
+            continue
+        conn.exec_driver_sql("INSERT OR IGNORE INTO tags (name) VALUES (?)", [(tag,) for tag in {t for _, t in links}])
+        conn.exec_driver_sql(
+            f"INSERT OR IGNORE INTO {link_table} ({owner_id}, tag_id) SELECT ?, id FROM tags WHERE name = ?", links
+        )
+
+
+_CATALOG_TABLES = ("resumes", "cover_letters")
+
+
+@migration(9, "catalog version counters for resume/cover letter caches")
+def _catalog_versions(conn) -> None:
+    Base.metadata.tables["catalog_versions"].create(conn, checkfirst=True)
+    for table in _CATALOG_TABLES:
+        conn.exec_driver_sql("INSERT OR IGNORE INTO catalog_versions (name, version) VALUES (?, 0)", (table,))
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.exec_driver_sql(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_version_{event[0].lower()} AFTER {event} ON {table} BEGIN
+                    UPDATE catalog_versions SET version = version + 1 WHERE name = '{table}';
+                END"""
+            )
+
+
+@migration(10, "notes are deleted with their job (ON DELETE CASCADE)")
+def _notes_cascade(conn) -> None:
+    if any(fk[2] == "jobs" and fk[6] == "CASCADE" for fk in conn.exec_driver_sql("PRAGMA foreign_key_list(notes)")):
+        return
+    # SQLite cannot alter a foreign key: rebuild the table. Renaming takes the old
+    # index and triggers along. Notes of jobs that no longer exist cannot satisfy
+    # the new foreign key, so they are dropped, and reported.
+    orphans = conn.exec_driver_sql("SELECT count(*) FROM notes WHERE job_id NOT IN (SELECT id FROM jobs)").scalar()
+    conn.exec_driver_sql("ALTER TABLE notes RENAME TO notes_old")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_notes_job_id_created_at")
+    Base.metadata.tables["notes"].create(conn)
+    conn.exec_driver_sql(
+        "INSERT INTO notes (id, job_id, content, created_at) "
+        "SELECT id, job_id, content, created_at FROM notes_old WHERE job_id IN (SELECT id FROM jobs)"
+    )
+    conn.exec_driver_sql("DROP TABLE notes_old")
+    if orphans:
+        logger.warning("Removed %d note(s) of jobs that no longer exist while rebuilding the notes table", orphans)
+    if fts5_available(conn):
+        for statement in _NOTES_SEARCH_TRIGGERS:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql("DELETE FROM search_docs WHERE kind = 'note' AND ref_id NOT IN (SELECT id FROM notes)")
+
+
+SCHEMA_VERSION = max(version for version, _, _ in MIGRATIONS)
+
+
+def migrate(bind) -> int:
+    """Bring the database behind `bind` up to `SCHEMA_VERSION`; return the version.
+
+    Already-current databases take the fast path: one ``PRAGMA user_version`` read.
+    """
+    # Import models so every table is registered on `Base.metadata`.
+    from jobtracker import models  # noqa: F401
+
+    with bind.connect() as conn:
+        current = get_schema_version(conn)
+        if current >= SCHEMA_VERSION:
+            return current
+        # Take the write lock up front and re-read the version under it, so two
+        # processes upgrading at the same time apply each step only once.
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            current = get_schema_version(conn)
+            for version, _, step in MIGRATIONS:
+                if version > current:
+                    step(conn)
+            if current < SCHEMA_VERSION:
+                _set_schema_version(conn, SCHEMA_VERSION)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return max(current, SCHEMA_VERSION)
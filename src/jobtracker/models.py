@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum as SqlEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Table, Text, Enum as SqlEnum
 from sqlalchemy.orm import relationship
 from .db import Base
 from .enums import JobStatus
@@ -14,6 +14,37 @@ def _now_utc():
     return datetime.now(timezone.utc)
 
 
+# -----------------------------
+# Tags
+# -----------------------------
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
+
+def _tag_link_table(name: str, owner_table: str) -> Table:
+    """Many-to-many link between `owner_table` and tags.
+
+    The (owner, tag) primary key serves "tags of this item"; the (tag, owner) index
+    serves tag filters and counts. Both cover the whole row, so no table lookups.
+    """
+    owner_id = f"{owner_table[:-1]}_id"
+    return Table(
+        name,
+        Base.metadata,
+        Column(owner_id, String, ForeignKey(f"{owner_table}.id", ondelete="CASCADE"), primary_key=True),
+        Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+        Index(f"ix_{name}_tag_id_{owner_id}", "tag_id", owner_id),
+        sqlite_with_rowid=False,
+    )
+
+
+resume_tags = _tag_link_table("resume_tags", "resumes")
+cover_letter_tags = _tag_link_table("cover_letter_tags", "cover_letters")
+
+
 # -----------------------------
 # Resume Model
 # -----------------------------
@@ -24,10 +55,12 @@ class Resume(Base):
     name = Column(String, nullable=False)
     tags = Column(String)
     file_path = Column(String, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=_now_utc)
+    created_at = Column(DateTime(timezone=True), default=_now_utc, index=True)
 
     # Back-reference to jobs that used this resume
     jobs = relationship("Job", back_populates="resume")
+    # Normalized form of `tags` (kept in sync by `jobtracker.tags.set_tags`)
+    tag_set = relationship("Tag", secondary=resume_tags, order_by="Tag.name")
 
 
 # -----------------------------
@@ -40,10 +73,12 @@ class CoverLetter(Base):
     name = Column(String, nullable=False)
     tags = Column(String)
     file_path = Column(String, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=_now_utc)
+    created_at = Column(DateTime(timezone=True), default=_now_utc, index=True)
 
     # Back-reference to jobs that used this cover letter
     jobs = relationship("Job", back_populates="cover_letter")
+    # Normalized form of `tags` (kept in sync by `jobtracker.tags.set_tags`)
+    tag_set = relationship("Tag", secondary=cover_letter_tags, order_by="Tag.name")
 
 
 # -----------------------------
@@ -51,14 +86,19 @@ class CoverLetter(Base):
 # -----------------------------
 class Job(Base):
     __tablename__ = "jobs"
+    # Newest-first listing and its keyset cursor sort on (created_at, id).
+    __table_args__ = (Index("ix_jobs_created_at_id", "created_at", "id"),)
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    company = Column(String, nullable=False)
+    company = Column(String, nullable=False, index=True)
     title = Column(String, nullable=False)
     location = Column(String)
     salary_range = Column(String)
+    # Parsed from salary_range on write, for range filters and salary statistics
+    salary_min = Column(Integer, index=True)
+    salary_max = Column(Integer, index=True)
     job_url = Column(String)
-    source = Column(String)
+    source = Column(String, index=True)
     # Use the enum's values (e.g., 'applied') when storing in the DB so
     # existing rows with lowercase values remain readable.
     status = Column(
@@ -68,15 +108,16 @@ class Job(Base):
             values_callable=lambda enum_cls: [e.value for e in enum_cls],
         ),
         default=JobStatus.APPLIED,
+        index=True,
     )
 
-    applied_date = Column(DateTime(timezone=True), nullable=True)
-    last_updated = Column(DateTime(timezone=True), default=_now_utc, onupdate=_now_utc)
+    applied_date = Column(DateTime(timezone=True), nullable=True, index=True)
+    last_updated = Column(DateTime(timezone=True), default=_now_utc, onupdate=_now_utc, index=True)
     created_at = Column(DateTime(timezone=True), default=_now_utc)
 
     # Foreign Keys
-    resume_id = Column(String, ForeignKey("resumes.id"), nullable=True)
-    cover_letter_id = Column(String, ForeignKey("cover_letters.id"), nullable=True)
+    resume_id = Column(String, ForeignKey("resumes.id"), nullable=True, index=True)
+    cover_letter_id = Column(String, ForeignKey("cover_letters.id"), nullable=True, index=True)
 
     ai_summary = Column(Text)
 
@@ -91,10 +132,54 @@ class Job(Base):
 # -----------------------------
 class Note(Base):
     __tablename__ = "notes"
+    # Serves both `note list` (notes of one job, oldest first) and the job cascade.
+    __table_args__ = (Index("ix_notes_job_id_created_at", "job_id", "created_at"),)
 
     id = Column(String, primary_key=True, default=generate_uuid)
-    job_id = Column(String, ForeignKey("jobs.id"), nullable=False)
+    # SQLite deletes a job's notes with it on connections that enforce foreign keys
+    # (`make_engine`, `init_db`); the services delete them explicitly as well.
+    job_id = Column(String, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), default=_now_utc)
 
     job = relationship("Job", back_populates="notes")
+
+
+# -----------------------------
+# Status history
+# -----------------------------
+# Both tables are written only by the SQLite triggers installed in migration 6
+# (see `jobtracker.migrations`), so every path that inserts, updates or deletes
+# jobs keeps them consistent.
+class StatusEvent(Base):
+    __tablename__ = "status_events"
+    # Per-job history in order; LEAD() over this order gives the time spent in each stage.
+    __table_args__ = (Index("ix_status_events_job_id_changed_at", "job_id", "changed_at"),)
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(String, ForeignKey("jobs.id"), nullable=False)
+    from_status = Column(String)
+    to_status = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class StatusCount(Base):
+    __tablename__ = "status_counts"
+
+    status = Column(String, primary_key=True)
+    # Jobs currently in this status
+    current = Column(Integer, nullable=False, default=0)
+    # Jobs that have ever been in this status
+    reached = Column(Integer, nullable=False, default=0)
+
+
+# -----------------------------
+# Catalog versions
+# -----------------------------
+# One counter per catalog table (resumes, cover_letters), bumped by triggers on
+# every change so long-lived processes can tell when a cached catalog is stale.
+class CatalogVersion(Base):
+    __tablename__ = "catalog_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
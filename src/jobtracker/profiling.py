@@ -0,0 +1,234 @@
+"""Per-command profiling for `jobtracker --profile` / `JOBTRACKER_PROFILE=1`.
+
+While a profiler is active, SQLAlchemy cursor events count and time every SQL
+statement, and the time spent inside the command is split into phases:
+
+  import      loading the command's module (measured by the lazy command group)
+  validation  pydantic validation of user input (`phase("validation")` blocks)
+  query       inside the database driver, executing statements and fetching their rows
+  render      writing tables and exports (`phase("render")` blocks, rich's Console.print)
+  other       everything else: argument handling, ORM bookkeeping, business logic
+
+Phases are exclusive: a statement executed while rows are being rendered counts
+as query time, not render time. SQLite computes most rows while they are fetched,
+so the time spent stepping the cursor is added to the query phase and to the
+statement's total. The report goes to stderr; with an output path it
+is also written as JSON (``.json``) or, for any other suffix, as cProfile stats
+for `pstats` / snakeviz.
+
+This module only imports the standard library at import time, so code paths that
+mark phases stay cheap when no profiler is running.
+"""
+
+import json
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+PHASES = ("validation", "query", "render")
+# Statements listed in the report, slowest (by total time) first.
+TOP_STATEMENTS = 5
+
+_active: Optional["Profiler"] = None
+_NOOP = nullcontext()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler, self.name = profiler, name
+
+    def __enter__(self):
+        self.profiler.push(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler.pop()
+
+
+def phase(name: str):
+    """Context manager attributing the time spent in its block to phase `name`."""
+    return _NOOP if _active is None else _Phase(_active, name)
+
+
+class Profiler:
+    """Collects statement timings and phase times for one command."""
+
+    def __init__(self, command: str, output: Optional[Path] = None, import_seconds: float = 0.0):
+        self.command = command
+        self.output = Path(output) if output else None
+        self.import_seconds = import_seconds
+        self.totals = defaultdict(float)
+        self.statements = {}  # SQL text -> [count, total seconds incl. fetching, max seconds per execute]
+        self._stack = []  # [phase name, start, time spent in nested phases]
+        self._started = self._elapsed = 0.0
+        self._cprofile = None
+        self._restore = []
+
+    def push(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def pop(self) -> float:
+        name, start, nested = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self.totals[name] += elapsed - nested
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        return elapsed
+
+    # SQLAlchemy event handlers ---------------------------------------------------
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.push("query")
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._record(statement, self.pop())
+
+    def _on_error(self, exception_context):
+        if self._stack and self._stack[-1][0] == "query":
+            self._record(exception_context.statement or "", self.pop())
+
+    def _record(self, statement: str, seconds: float) -> None:
+        entry = self.statements.setdefault(" ".join(statement.split()), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+    def _record_fetch(self, statement: str, seconds: float) -> None:
+        self.statements.setdefault(" ".join(statement.split()), [0, 0.0, 0.0])[1] += seconds
+
+    # Lifecycle -------------------------------------------------------------------
+
+    def _attach(self) -> None:
+        from rich.console import Console
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        handlers = (
+            ("before_cursor_execute", self._before_execute),
+            ("after_cursor_execute", self._after_execute),
+            ("handle_error", self._on_error),
+        )
+        for name, handler in handlers:
+            event.listen(Engine, name, handler)
+            self._restore.append(lambda name=name, handler=handler: event.remove(Engine, name, handler))
+
+        # rich has no render hook, so Console.print is wrapped while the profiler runs.
+        original = Console.print
+
+        def timed_print(console, *args, **kwargs):
+            with phase("render"):
+                return original(console, *args, **kwargs)
+
+        Console.print = timed_print
+        self._restore.append(lambda: setattr(Console, "print", original))
+        self._wrap_fetches()
+
+    def _wrap_fetches(self) -> None:
+        # Cursor events only cover execute(); rows are fetched later through the result's
+        # fetch strategy, which is where the driver steps the cursor.
+        from sqlalchemy.engine import cursor
+
+        strategies = (
+            cursor.CursorFetchStrategy,
+            cursor.BufferedRowCursorFetchStrategy,
+            cursor.FullyBufferedCursorFetchStrategy,
+        )
+        for cls in strategies:
+            for name in ("fetchone", "fetchmany", "fetchall"):
+                original = vars(cls).get(name)
+                if original is not None:
+                    setattr(cls, name, self._timed_fetch(original))
+                    self._restore.append(lambda cls=cls, name=name, original=original: setattr(cls, name, original))
+
+    def _timed_fetch(self, original):
+        def fetch(strategy, result, *args, **kwargs):
+            if self._stack and self._stack[-1][0] == "query":  # a strategy calling its own fetchall
+                return original(strategy, result, *args, **kwargs)
+            self.push("query")
+            try:
+                return original(strategy, result, *args, **kwargs)
+            finally:
+                self._record_fetch(result.context.statement or "", self.pop())
+
+        return fetch
+
+    def start(self) -> "Profiler":
+        self._attach()
+        if self.output and self.output.suffix != ".json":
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._started = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        global _active
+        self._elapsed = time.perf_counter() - self._started
+        if self._cprofile:
+            self._cprofile.disable()
+        while self._restore:
+            self._restore.pop()()
+        if _active is self:
+            _active = None
+        if self._cprofile:
+            self._cprofile.dump_stats(self.output)
+        elif self.output:
+            self.output.write_text(json.dumps(self.report(), indent=2) + "\n")
+        self.print_report()
+
+    # Reporting -------------------------------------------------------------------
+
+    def report(self) -> dict:
+        phases = {name: self.totals.get(name, 0.0) for name in PHASES}
+        phases["other"] = max(0.0, self._elapsed - sum(phases.values()))
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "command": self.command,
+            "command_ms": self._elapsed * 1000,
+            "statements": sum(count for count, _, _ in self.statements.values()),
+            "db_ms": phases["query"] * 1000,
+            "phases_ms": {"import": self.import_seconds * 1000, **{k: v * 1000 for k, v in phases.items()}},
+            "slowest": [
+                {"sql": sql, "count": count, "total_ms": total * 1000, "max_ms": worst * 1000}
+                for sql, (count, total, worst) in ranked
+            ],
+        }
+
+    def print_report(self) -> None:
+        from rich.console import Console
+        from rich.markup import escape
+
+        report = self.report()
+        console = Console(stderr=True, highlight=False, soft_wrap=True)
+        console.print(
+            f"[bold]Profile[/bold] {escape(report['command'])}: {report['command_ms']:.1f} ms, "
+            f"{report['statements']} SQL statement(s), {report['db_ms']:.1f} ms in the database"
+        )
+        for name, ms in report["phases_ms"].items():
+            console.print(f"  {name:<11}{ms:>9.1f} ms")
+        if report["slowest"]:
+            console.print("  Slowest statements (total, max, count):")
+        for entry in report["slowest"][:TOP_STATEMENTS]:
+            sql = entry["sql"] if len(entry["sql"]) <= 100 else entry["sql"][:97] + "..."
+            console.print(
+                f"  {entry['total_ms']:>8.2f} ms {entry['max_ms']:>8.2f} ms {entry['count']:>4}x  {sql}", markup=False
+            )
+        if self.output:
+            console.print(f"  Written to {self.output}", markup=False)
+
+
+def start(command: str, output: Optional[Path] = None, import_seconds: float = 0.0) -> Optional[Profiler]:
+    """Start profiling `command`; returns None when a profiler is already running.
+
+    A command run from inside a profiled one (e.g. by `jobtracker --profile batch`)
+    is counted in the outer profile.
+    """
+    global _active
+    if _active is not None:
+        return None
+    _active = Profiler(command, output, import_seconds)
+    return _active.start()
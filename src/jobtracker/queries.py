@@ -0,0 +1,192 @@
+"""Reusable SELECT builders for the list/read paths.
+
+Read paths select only the columns they display (no ORM instances), so large result
+sets can be streamed with `yield_per` and keyset-paginated on an index. Each builder
+returns the columns of one `jobtracker.read_models` tuple, in order.
+"""
+
+import base64
+import binascii
+import enum
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import DateTime, Enum, String, asc, desc, select, tuple_, type_coerce
+
+from jobtracker.enums import JobStatus
+from jobtracker.models import CoverLetter, Job, Note, Resume
+from jobtracker.tags import tag_filter
+
+
+def _columns(columns, raw: bool) -> list:
+    """Return `columns`, with datetime/enum columns read as stored text when `raw`.
+
+    Raw projections skip per-value Python conversion, which dominates exports of
+    large tables; SQLite stores these columns as ISO-8601 text and enum values.
+    """
+    if not raw:
+        return list(columns)
+    return [type_coerce(c, String).label(c.key) if isinstance(c.type, (DateTime, Enum)) else c for c in columns]
+
+
+# -----------------------------
+# Keyset cursors
+# -----------------------------
+def encode_cursor(created_at, job_id: str) -> str:
+    """Encode the `(created_at, id)` sort key of the last row shown into an opaque cursor.
+
+    `created_at` may be a datetime or its stored ISO-8601 text (raw projections).
+    """
+    created = created_at if isinstance(created_at, str) else created_at.isoformat()
+    raw = f"{created}|{job_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of `encode_cursor`; raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, job_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), job_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"invalid cursor: {cursor!r}") from exc
+
+
+# -----------------------------
+# Jobs
+# -----------------------------
+class JobSort(str, enum.Enum):
+    CREATED = "created"
+    APPLIED = "applied"
+    UPDATED = "updated"
+    COMPANY = "company"
+    STATUS = "status"
+
+
+# Each sort leads with an indexed column; `id` breaks ties deterministically.
+# sort -> (leading column, ascending)
+JOB_SORT_ORDER = {
+    JobSort.CREATED: ("created_at", False),
+    JobSort.APPLIED: ("applied_date", False),
+    JobSort.UPDATED: ("last_updated", False),
+    JobSort.COMPANY: ("company", True),
+    JobSort.STATUS: ("status", True),
+}
+
+
+def _job_order(sort: JobSort, jobs) -> tuple:
+    column, ascending = JOB_SORT_ORDER[JobSort(sort)]
+    direction = asc if ascending else desc
+    return direction(getattr(jobs, column)), direction(jobs.id)
+
+
+def job_filter_clauses(
+    statuses: Optional[Iterable[JobStatus]] = None,
+    company: Optional[str] = None,
+    title_contains: Optional[str] = None,
+    applied_since: Optional[datetime] = None,
+    applied_until: Optional[datetime] = None,
+    source: Optional[str] = None,
+    resume_id: Optional[str] = None,
+    min_salary: Optional[int] = None,
+    max_salary: Optional[int] = None,
+    jobs=Job,
+) -> list:
+    """Translate job list filters into SQL WHERE clauses (ANDed by the caller).
+
+    Equality and range filters hit the jobs indexes; `title_contains` is a
+    substring LIKE and is only cheap combined with a selective indexed filter.
+    `applied_until` is inclusive of the whole day. Salary bounds select ranges that
+    overlap `[min_salary, max_salary]`; jobs without a parsed salary never match.
+    `jobs` is `Job` or an alias of it, such as `archive.ALL_JOBS`.
+    """
+    clauses = []
+    if statuses:
+        clauses.append(jobs.status.in_([JobStatus(s) for s in statuses]))
+    if company:
+        clauses.append(jobs.company == company)
+    if title_contains:
+        clauses.append(jobs.title.contains(title_contains, autoescape=True))
+    if applied_since:
+        clauses.append(jobs.applied_date >= applied_since)
+    if applied_until:
+        clauses.append(jobs.applied_date < applied_until + timedelta(days=1))
+    if source:
+        clauses.append(jobs.source == source)
+    if resume_id:
+        clauses.append(jobs.resume_id == resume_id)
+    if min_salary is not None:
+        clauses.append(jobs.salary_max >= min_salary)
+    if max_salary is not None:
+        clauses.append(jobs.salary_min <= max_salary)
+    return clauses
+
+
+def job_list_select(
+    where: Iterable = (),
+    sort: JobSort = JobSort.CREATED,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    raw: bool = False,
+    jobs=Job,
+):
+    """Job listing with resume/cover-letter names, newest first by default.
+
+    `after` continues from a cursor returned by `encode_cursor` and is only valid
+    for the default `created` sort, whose `(created_at, id)` order it encodes.
+    `where` must be built for the same `jobs` entity.
+    """
+    if after and sort != JobSort.CREATED:
+        raise ValueError("cursors only apply to the default 'created' sort")
+    columns = [
+        jobs.id,
+        jobs.company,
+        jobs.title,
+        jobs.status,
+        jobs.source,
+        jobs.applied_date,
+        Resume.name.label("resume_name"),
+        CoverLetter.name.label("cover_letter_name"),
+        jobs.salary_range,
+        jobs.location,
+        jobs.job_url,
+        jobs.created_at,
+    ]
+    stmt = (
+        select(*_columns(columns, raw))
+        .outerjoin(Resume, jobs.resume_id == Resume.id)
+        .outerjoin(CoverLetter, jobs.cover_letter_id == CoverLetter.id)
+        .where(*where)
+        .order_by(*_job_order(sort, jobs))
+    )
+    if after:
+        stmt = stmt.where(tuple_(jobs.created_at, jobs.id) < tuple_(*decode_cursor(after)))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+# -----------------------------
+# Resumes, cover letters and notes
+# -----------------------------
+def catalog_list_select(model, raw: bool = False, tags: Iterable[str] = (), match_any: bool = False):
+    """Newest-first listing of a `Resume` or `CoverLetter` catalog, served by ix_<table>_created_at.
+
+    With `tags`, only rows carrying all of them (any of them with `match_any`) are listed.
+    """
+    columns = [model.id, model.name, model.tags, model.file_path, model.created_at]
+    stmt = select(*_columns(columns, raw)).order_by(model.created_at.desc())
+    if tags:
+        stmt = stmt.where(tag_filter(model, tags, match_any=match_any))
+    return stmt
+
+
+def job_header_select(job_id: str, jobs=Job):
+    """ID, company and title of one job (headings of per-job listings)."""
+    return select(jobs.id, jobs.company, jobs.title).where(jobs.id == job_id)
+
+
+def note_list_select(job_id: str, raw: bool = False, notes=Note):
+    """Notes of one job, oldest first, served by ix_notes_job_id_created_at."""
+    columns = [notes.id, notes.job_id, notes.created_at, notes.content]
+    return select(*_columns(columns, raw)).where(notes.job_id == job_id).order_by(notes.created_at)
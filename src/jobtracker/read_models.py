@@ -0,0 +1,89 @@
+"""Read models: plain named tuples for the rows list and export paths display.
+
+List commands select only the columns they show (see `jobtracker.queries`) and read
+them into these tuples instead of ORM instances, so no identity map, attribute
+instrumentation or per-object state is built for rows that are read once.
+"""
+
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, NamedTuple, Optional, Union
+
+from jobtracker.enums import JobStatus
+
+# Raw projections (exports) read datetime and enum columns as their stored text.
+_Timestamp = Union[datetime, str, None]
+
+
+class JobRow(NamedTuple):
+    """One row of `queries.job_list_select`."""
+
+    id: str
+    company: str
+    title: str
+    status: Union[JobStatus, str, None]
+    source: Optional[str]
+    applied_date: _Timestamp
+    resume_name: Optional[str]
+    cover_letter_name: Optional[str]
+    salary_range: Optional[str]
+    location: Optional[str]
+    job_url: Optional[str]
+    created_at: _Timestamp
+
+
+class JobHeader(NamedTuple):
+    """One row of `queries.job_header_select`."""
+
+    id: str
+    company: str
+    title: str
+
+
+class CatalogRow(NamedTuple):
+    """One row of `queries.catalog_list_select` (resumes and cover letters)."""
+
+    id: str
+    name: str
+    tags: Optional[str]
+    file_path: str
+    created_at: _Timestamp
+
+
+class NoteRow(NamedTuple):
+    """One row of `queries.note_list_select`."""
+
+    id: str
+    job_id: str
+    created_at: _Timestamp
+    content: str
+
+
+class TagCountRow(NamedTuple):
+    """One row of `tags.tag_counts_select`."""
+
+    tag: str
+    count: int
+
+
+def fetch_rows(db, stmt, row_type, batch_size: Optional[int] = None) -> Iterator:
+    """Execute a column projection and yield its rows as `row_type` tuples.
+
+    With `batch_size`, rows are fetched from SQLite that many at a time
+    (`yield_per`) instead of all at once. Raises ValueError when the projection's
+    columns do not match the fields of `row_type`.
+    """
+    if batch_size:
+        stmt = stmt.execution_options(yield_per=batch_size)
+    result = db.execute(stmt)
+    columns = tuple(result.keys())
+    if columns != row_type._fields:
+        result.close()
+        raise ValueError(f"{row_type.__name__} expects columns {row_type._fields}, got {columns}")
+    return map(row_type._make, result)
+
+
+def batches(rows: Iterator, size: int) -> Iterator[list]:
+    """Group `rows` into lists of at most `size`."""
+    while batch := list(islice(rows, size)):
+        yield batch
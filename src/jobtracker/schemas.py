@@ -5,6 +5,22 @@ from .enums import JobStatus  # keep your current enum import
 from pathlib import Path
 import re
 
+# "$120,000 - $190,000" or "120000 - 190000"
+_SALARY_RANGE = re.compile(r"^\$?([\d,]+)\s*-\s*\$?([\d,]+)$")
+
+
+def parse_salary_range(value: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+    """Return the numeric `(salary_min, salary_max)` of a salary range string.
+
+    Returns `(None, None)` for empty values, 'none listed' and anything that is
+    not a range.
+    """
+    m = _SALARY_RANGE.match(value.strip()) if value else None
+    if not m:
+        return None, None
+    low, high = (int(x.replace(",", "")) for x in m.groups())
+    return min(low, high), max(low, high)
+
 
 class JobCreate(BaseModel):
     company: str
@@ -33,7 +49,7 @@ class JobCreate(BaseModel):
         if s.lower() == "none listed":
             return s
         # Accept patterns like "$120,000 - $190,000" or "120000 - 190000" and normalize
-        m = re.match(r"^\$?([\d,]+)\s*-\s*\$?([\d,]+)$", s)
+        m = _SALARY_RANGE.match(s)
         if not m:
             raise ValueError("salary_range must be in format '$120,000 - $190,000' or 'none listed'")
         low, high = m.group(1), m.group(2)
@@ -0,0 +1,59 @@
+"""Full-text search over notes and job AI summaries (SQLite FTS5).
+
+The index is created and kept in sync by migration 5 (see `jobtracker.migrations`):
+triggers on `notes` and `jobs.ai_summary` maintain `search_docs`, which feeds the
+external-content `search_fts` table.
+"""
+
+from sqlalchemy import text
+
+# snippet() wraps each matched term in these markers; callers render them.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_SEARCH_SQL = text("""
+    SELECT d.job_id AS job_id, j.company AS company, j.title AS title, j.status AS status,
+           d.kind AS kind,
+           snippet(search_fts, 0, :hl_start, :hl_end, '…', :snippet_tokens) AS snippet,
+           bm25(search_fts) AS score
+    FROM search_fts
+    JOIN search_docs AS d ON d.id = search_fts.rowid
+    JOIN jobs AS j ON j.id = d.job_id
+    WHERE search_fts MATCH :query
+    ORDER BY bm25(search_fts)
+    LIMIT :limit
+    """)
+
+
+class SearchUnavailable(RuntimeError):
+    """Raised when the database has no FTS5 index (SQLite built without FTS5)."""
+
+
+def to_fts_query(terms: str) -> str:
+    """Quote every whitespace-separated term so user input is never parsed as FTS5 syntax.
+
+    Terms are ANDed; `full-time` or `c++` are matched as phrases instead of raising
+    syntax errors.
+    """
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms.split())
+
+
+def search_available(db) -> bool:
+    return db.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'search_fts'")).first() is not None
+
+
+def search(db, query: str, limit: int = 20, raw: bool = False, snippet_tokens: int = 12):
+    """Return the best `limit` matches for `query`, best first (lower bm25 score is better).
+
+    With `raw`, `query` is passed to FTS5 unchanged (phrases, OR/NOT, prefix*).
+    """
+    if not search_available(db):
+        raise SearchUnavailable("full-text search needs SQLite built with FTS5")
+    params = {
+        "query": query if raw else to_fts_query(query),
+        "limit": limit,
+        "hl_start": HIGHLIGHT_START,
+        "hl_end": HIGHLIGHT_END,
+        "snippet_tokens": snippet_tokens,
+    }
+    return db.execute(_SEARCH_SQL, params).all()
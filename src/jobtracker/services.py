@@ -0,0 +1,471 @@
+"""Typed service API over the JobTracker database, independent of typer and rich.
+
+The CLI commands are thin wrappers around these services; other programs (e.g.
+ingestion workers) can call them directly instead of shelling out to the CLI:
+
+    from jobtracker.services import JobService
+    job = JobService().add("Acme", "Backend Engineer", source="LinkedIn")
+    JobService().set_status_many(JobStatus.GHOSTED, statuses=[JobStatus.APPLIED], older_than=timedelta(days=60))
+
+Each service uses the session it was given, or opens one per call on `bind` (an
+engine or connection) or on the application engine. Per-call sessions make a
+service safe to share between threads; in a process pool, give each worker its
+own engine. Every write method commits its own work and returns plain, frozen
+DTOs that stay usable after the session is gone (and pickle across processes).
+
+Invalid input raises `ValueError` (pydantic's `ValidationError` is one); missing
+rows raise `NotFoundError`.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Mapping, Optional
+
+from sqlalchemy import delete, func, insert, literal_column, select, text, update
+from sqlalchemy.orm import Session
+
+from jobtracker.db import get_db
+from jobtracker.enums import JobStatus
+from jobtracker.importer import ImportReport, import_jobs
+from jobtracker.migrations import SQL_NOW
+from jobtracker.models import CoverLetter, Job, Note, Resume, generate_uuid
+from jobtracker.profiling import phase
+from jobtracker.queries import job_filter_clauses
+from jobtracker.schemas import CoverLetterCreate, JobCreate, JobUpdate, ResumeCreate, parse_salary_range
+from jobtracker.tags import delete_tag_links, set_tags
+
+# Rows per INSERT when bulk-adding notes.
+NOTE_BATCH_SIZE = 1000
+
+
+class NotFoundError(LookupError):
+    def __init__(self, label: str, row_id: str):
+        self.row_id = row_id
+        super().__init__(f"{label} ID {row_id} not found")
+
+
+class InUseError(ValueError):
+    """Raised when removing a resume or cover letter that jobs still reference."""
+
+
+# -----------------------------
+# DTOs
+# -----------------------------
+def _to_dto(cls, obj):
+    return cls(**{f.name: getattr(obj, f.name) for f in fields(cls)})
+
+
+@dataclass(frozen=True, slots=True)
+class JobDTO:
+    id: str
+    company: str
+    title: str
+    status: JobStatus
+    source: Optional[str]
+    job_url: Optional[str]
+    location: Optional[str]
+    salary_range: Optional[str]
+    salary_min: Optional[int]
+    salary_max: Optional[int]
+    applied_date: Optional[datetime]
+    last_updated: Optional[datetime]
+    created_at: Optional[datetime]
+    resume_id: Optional[str]
+    cover_letter_id: Optional[str]
+
+    def __post_init__(self):
+        # A status just assigned on the ORM object is still the plain string stored in the column.
+        if self.status is not None:
+            object.__setattr__(self, "status", JobStatus(self.status))
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeDTO:
+    id: str
+    name: str
+    file_path: str
+    tags: Optional[str]
+    created_at: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class CoverLetterDTO:
+    id: str
+    name: str
+    file_path: str
+    tags: Optional[str]
+    created_at: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class NoteDTO:
+    id: str
+    job_id: str
+    content: str
+    created_at: Optional[datetime]
+
+
+# -----------------------------
+# Services
+# -----------------------------
+class _Service:
+    def __init__(self, session: Optional[Session] = None, bind=None):
+        if session is not None and bind is not None:
+            raise TypeError("pass either a session or a bind, not both")
+        self._session = session
+        self._bind = bind
+
+    @contextmanager
+    def _db(self) -> Iterator[Session]:
+        if self._session is not None:
+            yield self._session
+        else:
+            with get_db(self._bind) as db:
+                yield db
+
+    @contextmanager
+    def _write(self) -> Iterator[Session]:
+        """Session whose work is committed on success and rolled back on error."""
+        with self._db() as db:
+            try:
+                yield db
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+
+def _check_catalog_refs(db, resume_id: Optional[str] = None, cover_letter_id: Optional[str] = None) -> None:
+    """Raise NotFoundError for a resume or cover letter ID that does not exist."""
+    for model, label, row_id in ((Resume, "Resume", resume_id), (CoverLetter, "Cover letter", cover_letter_id)):
+        if row_id and db.get(model, row_id) is None:
+            raise NotFoundError(label, row_id)
+
+
+def _stage_ids(db, ids: list[str]):
+    """Stage `ids` in a temp table and return a subquery of them.
+
+    Joining against a table avoids SQLite's bound-parameter limit for large ID lists.
+    """
+    db.execute(text("CREATE TEMP TABLE IF NOT EXISTS batch_job_ids (id TEXT PRIMARY KEY)"))
+    db.execute(text("DELETE FROM batch_job_ids"))
+    if ids:
+        db.execute(text("INSERT OR IGNORE INTO batch_job_ids (id) VALUES (:id)"), [{"id": i} for i in ids])
+    return select(literal_column("id")).select_from(text("batch_job_ids"))
+
+
+def _delete_jobs(db, *clauses) -> int:
+    """Delete the jobs matching `clauses` and their notes; return how many jobs were deleted.
+
+    Notes are deleted explicitly rather than left to ON DELETE CASCADE, which only
+    fires on connections with foreign keys enabled; an injected session or engine
+    not made by `make_engine` may not have them.
+    """
+    notes = delete(Note).where(Note.job_id.in_(select(Job.id).where(*clauses)))
+    db.execute(notes.execution_options(synchronize_session=False))
+    return db.execute(delete(Job).where(*clauses).execution_options(synchronize_session=False)).rowcount
+
+
+def job_batch_clauses(
+    ids: Optional[list[str]] = None,
+    statuses: Iterable[JobStatus] = (),
+    company: Optional[str] = None,
+    source: Optional[str] = None,
+    older_than: Optional[timedelta] = None,
+    db=None,
+) -> list:
+    """WHERE clauses selecting jobs for a batch operation.
+
+    `ids` (staged through a temp table on `db`) narrows the selection; `older_than`
+    keeps jobs not updated for that long.
+    """
+    clauses = job_filter_clauses(statuses=list(statuses), company=company, source=source)
+    if older_than is not None:
+        clauses.append(Job.last_updated < datetime.now(timezone.utc) - older_than)
+    if ids is not None:
+        clauses.append(Job.id.in_(_stage_ids(db, ids)))
+    return clauses
+
+
+class JobService(_Service):
+    def get(self, job_id: str) -> Optional[JobDTO]:
+        with self._db() as db:
+            job = db.get(Job, job_id)
+            return _to_dto(JobDTO, job) if job else None
+
+    def _job(self, db, job_id: str) -> Job:
+        job = db.get(Job, job_id)
+        if job is None:
+            raise NotFoundError("Job", job_id)
+        return job
+
+    def add(
+        self,
+        company: str,
+        title: str,
+        *,
+        source: Optional[str] = None,
+        job_url: Optional[str] = None,
+        location: Optional[str] = None,
+        salary_range: Optional[str] = None,
+        applied_date: Optional[datetime] = None,
+        resume_id: Optional[str] = None,
+        cover_letter_id: Optional[str] = None,
+        status: JobStatus = JobStatus.APPLIED,
+    ) -> JobDTO:
+        """Validate and add one job; `applied_date` defaults to now."""
+        with phase("validation"):
+            job_in = JobCreate(
+                company=company,
+                title=title,
+                location=location,
+                salary_range=salary_range,
+                job_url=job_url,
+                source=source,
+            )
+        salary_min, salary_max = parse_salary_range(job_in.salary_range)
+        now = datetime.now(timezone.utc)
+        job = Job(
+            company=job_in.company,
+            title=job_in.title,
+            source=job_in.source,
+            # Pydantic HttpUrl converts to an object; ensure we store a string in the DB
+            job_url=str(job_in.job_url) if job_in.job_url else (job_url or None),
+            location=job_in.location,
+            salary_range=job_in.salary_range,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            status=JobStatus(status).value,
+            applied_date=applied_date or now,
+            last_updated=now,
+            created_at=now,
+            resume_id=resume_id,
+            cover_letter_id=cover_letter_id,
+        )
+        with self._write() as db:
+            _check_catalog_refs(db, resume_id=resume_id, cover_letter_id=cover_letter_id)
+            db.add(job)
+            db.flush()
+            return _to_dto(JobDTO, job)
+
+    def add_many(self, records: Iterable[Mapping], batch_size: int = 1000) -> ImportReport:
+        """Validate and insert job records (same keys as `job import`), one transaction per batch.
+
+        Invalid records are skipped and reported by their 1-based position.
+        """
+        with self._db() as db:
+            return import_jobs(db, enumerate(records, start=1), batch_size=batch_size)
+
+    def update(self, job_id: str, **changes) -> JobDTO:
+        """Set the given fields (company, title, source, job_url, location, salary_range,
+        applied_date, resume_id, cover_letter_id) on a job."""
+        allowed = set(JobUpdate.model_fields) | {"applied_date", "resume_id", "cover_letter_id"}
+        unknown = set(changes) - allowed
+        if unknown:
+            raise ValueError(f"cannot update {', '.join(sorted(unknown))}")
+        with self._write() as db:
+            job = self._job(db, job_id)
+            _check_catalog_refs(db, **{k: v for k, v in changes.items() if k in ("resume_id", "cover_letter_id")})
+            for name, value in changes.items():
+                setattr(job, name, value)
+            # Validate the resulting row (salary_range normalization/validation)
+            with phase("validation"):
+                job_up = JobUpdate(**{name: getattr(job, name) for name in JobUpdate.model_fields})
+            if job_up.salary_range is not None:
+                job.salary_range = job_up.salary_range
+            job.salary_min, job.salary_max = parse_salary_range(job.salary_range)
+            # Ensure job_url gets stored as a string (JobUpdate may contain a HttpUrl)
+            if job_up.job_url is not None:
+                job.job_url = str(job_up.job_url)
+            job.last_updated = datetime.now(timezone.utc)
+            db.flush()
+            return _to_dto(JobDTO, job)
+
+    def set_status(self, job_id: str, status: JobStatus) -> JobDTO:
+        with self._write() as db:
+            job = self._job(db, job_id)
+            job.status = JobStatus(status).value
+            job.last_updated = datetime.now(timezone.utc)
+            db.flush()
+            return _to_dto(JobDTO, job)
+
+    def set_status_many(
+        self,
+        status: JobStatus,
+        ids: Optional[Iterable[str]] = None,
+        *,
+        statuses: Iterable[JobStatus] = (),
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        older_than: Optional[timedelta] = None,
+    ) -> int:
+        """Move every matching job to `status` in one UPDATE; return how many changed.
+
+        Jobs already in `status` are left untouched. `last_updated` is stamped by
+        SQLite, and the status-history triggers record each transition.
+        """
+        status = JobStatus(status)
+        with self._write() as db:
+            clauses = job_batch_clauses(
+                None if ids is None else list(ids), statuses, company, source, older_than, db=db
+            )
+            stmt = (
+                update(Job)
+                .where(*clauses, Job.status.is_distinct_from(status))
+                .values(status=status, last_updated=literal_column(SQL_NOW))
+                .execution_options(synchronize_session=False)
+            )
+            return db.execute(stmt).rowcount
+
+    def remove(self, job_id: str) -> JobDTO:
+        """Delete a job (and its notes); return what was removed."""
+        with self._write() as db:
+            removed = _to_dto(JobDTO, self._job(db, job_id))
+            _delete_jobs(db, Job.id == job_id)
+            return removed
+
+    def count_many(
+        self,
+        ids: Optional[Iterable[str]] = None,
+        *,
+        statuses: Iterable[JobStatus] = (),
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        older_than: Optional[timedelta] = None,
+    ) -> int:
+        """Count the jobs a batch operation with the same selection would touch."""
+        with self._db() as db:
+            clauses = job_batch_clauses(
+                None if ids is None else list(ids), statuses, company, source, older_than, db=db
+            )
+            return db.scalar(select(func.count()).select_from(Job).where(*clauses))
+
+    def remove_many(
+        self,
+        ids: Optional[Iterable[str]] = None,
+        *,
+        statuses: Iterable[JobStatus] = (),
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        older_than: Optional[timedelta] = None,
+    ) -> int:
+        """Delete every matching job in one DELETE; return how many were removed.
+
+        Notes are deleted with their job; triggers drop the status history and
+        search documents. Raises ValueError when neither IDs nor a
+        filter is given, rather than removing every job.
+        """
+        statuses = list(statuses)
+        if ids is None and not (statuses or company or source or older_than):
+            raise ValueError("Select jobs to remove by ID or filter")
+        with self._write() as db:
+            clauses = job_batch_clauses(
+                None if ids is None else list(ids), statuses, company, source, older_than, db=db
+            )
+            return _delete_jobs(db, *clauses)
+
+
+class _CatalogService(_Service):
+    model = None
+    schema = None
+    dto = None
+    label = ""
+    job_column = ""  # name of the `jobs` column referencing this catalog
+
+    def _item(self, db, item_id: str):
+        item = db.get(self.model, item_id)
+        if item is None:
+            raise NotFoundError(self.label, item_id)
+        return item
+
+    def get(self, item_id: str):
+        with self._db() as db:
+            item = db.get(self.model, item_id)
+            return _to_dto(self.dto, item) if item else None
+
+    def add(self, name: str, file_path: str, tags: Optional[str] = None):
+        """Validate (the file must exist) and add a catalog entry."""
+        item_in = self.schema(name=name, file_path=file_path, tags=tags)
+        with self._write() as db:
+            item = self.model(name=item_in.name, file_path=item_in.file_path, created_at=datetime.now(timezone.utc))
+            set_tags(db, item, tags)
+            db.add(item)
+            db.flush()
+            return _to_dto(self.dto, item)
+
+    def update(
+        self, item_id: str, *, name: Optional[str] = None, file_path: Optional[str] = None, tags: Optional[str] = None
+    ):
+        """Change the given fields; raises ValueError when none is given."""
+        if name is None and file_path is None and tags is None:
+            raise ValueError("No fields provided to update")
+        with self._write() as db:
+            item = self._item(db, item_id)
+            if name is not None:
+                item.name = name
+            if tags is not None:
+                set_tags(db, item, tags)
+            if file_path is not None:
+                item.file_path = self.schema(name=item.name, file_path=file_path, tags=item.tags).file_path
+            db.flush()
+            return _to_dto(self.dto, item)
+
+    def remove(self, item_id: str):
+        """Delete an entry that no job uses; raises InUseError otherwise."""
+        with self._write() as db:
+            item = self._item(db, item_id)
+            in_use = db.scalar(select(func.count()).select_from(Job).where(getattr(Job, self.job_column) == item_id))
+            if in_use:
+                raise InUseError(f"Cannot remove {self.label.lower()} {item.name} (used by {in_use} job(s))")
+            removed = _to_dto(self.dto, item)
+            delete_tag_links(db, self.model, item_id)
+            stmt = delete(self.model).where(self.model.id == item_id).execution_options(synchronize_session=False)
+            db.execute(stmt)
+            return removed
+
+
+class ResumeService(_CatalogService):
+    model, schema, dto, label = Resume, ResumeCreate, ResumeDTO, "Resume"
+    job_column = "resume_id"
+
+
+class CoverLetterService(_CatalogService):
+    model, schema, dto, label = CoverLetter, CoverLetterCreate, CoverLetterDTO, "Cover letter"
+    job_column = "cover_letter_id"
+
+
+class NoteService(_Service):
+    def add(self, job_id: str, content: str) -> NoteDTO:
+        with self._write() as db:
+            if db.get(Job, job_id) is None:
+                raise NotFoundError("Job", job_id)
+            note = Note(job_id=job_id, content=content, created_at=datetime.now(timezone.utc))
+            db.add(note)
+            db.flush()
+            return _to_dto(NoteDTO, note)
+
+    def add_many(self, notes: Iterable[tuple[str, str]]) -> int:
+        """Insert `(job_id, content)` pairs in one transaction; return how many were added.
+
+        Nothing is written if any job ID does not exist.
+        """
+        now = datetime.now(timezone.utc)
+        rows = [{"id": generate_uuid(), "job_id": j, "content": c, "created_at": now} for j, c in notes]
+        with self._write() as db:
+            wanted = list({row["job_id"] for row in rows})
+            found = set(db.scalars(select(Job.id).where(Job.id.in_(_stage_ids(db, wanted)))))
+            missing = next((job_id for job_id in wanted if job_id not in found), None)
+            if missing is not None:
+                raise NotFoundError("Job", missing)
+            for start in range(0, len(rows), NOTE_BATCH_SIZE):
+                db.execute(insert(Note), rows[start : start + NOTE_BATCH_SIZE])
+        return len(rows)
+
+    def list(self, job_id: str) -> list[NoteDTO]:
+        """Notes of a job, oldest first."""
+        with self._db() as db:
+            if db.get(Job, job_id) is None:
+                raise NotFoundError("Job", job_id)
+            notes = db.scalars(select(Note).where(Note.job_id == job_id).order_by(Note.created_at))
+            return [_to_dto(NoteDTO, note) for note in notes]
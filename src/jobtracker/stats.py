@@ -0,0 +1,149 @@
+"""Pipeline and salary analytics, computed in SQL.
+
+The funnel reads only `status_counts`, which triggers keep current (see migration 6
+in `jobtracker.migrations`), so its cost does not grow with the number of jobs.
+Time-in-stage pairs each `status_events` row with the job's next event through
+LEAD() and aggregates the spans. Salary statistics run over the numeric
+`salary_min`/`salary_max` columns, never over the display string.
+"""
+
+import enum
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from jobtracker.enums import JobStatus
+
+# Stages that end an application rather than advance it.
+OUTCOME_STATUSES = (JobStatus.REJECTED, JobStatus.GHOSTED)
+
+
+def _stages_cte() -> str:
+    """A VALUES table of every status with its pipeline position (enum order)."""
+    rows = ", ".join(
+        f"('{status.value}', {pos}, {int(status in OUTCOME_STATUSES)})" for pos, status in enumerate(JobStatus)
+    )
+    return f"stages (status, pos, outcome) AS (VALUES {rows})"
+
+
+_FUNNEL_SQL = text(f"""
+    WITH {_stages_cte()}
+    SELECT s.status AS status,
+           coalesce(c.reached, 0) AS reached,
+           coalesce(c.current, 0) AS current,
+           coalesce(c.reached, 0) * 1.0
+               / nullif(first_value(coalesce(c.reached, 0)) OVER (ORDER BY s.pos), 0) AS of_applied,
+           CASE WHEN s.outcome = 0 THEN
+               coalesce(c.reached, 0) * 1.0
+                   / nullif(lag(coalesce(c.reached, 0)) OVER (PARTITION BY s.outcome ORDER BY s.pos), 0)
+           END AS from_previous
+    FROM stages AS s
+    LEFT JOIN status_counts AS c ON c.status = s.status
+    ORDER BY s.pos
+    """)
+
+# Spans of the current (latest) stage end at :now when :include_current, else are dropped.
+_TIME_IN_STAGE_SQL = text(f"""
+    WITH {_stages_cte()},
+    spans AS (
+        SELECT to_status AS status,
+               julianday(lead(changed_at, 1, CASE WHEN :include_current THEN :now END)
+                         OVER (PARTITION BY job_id ORDER BY changed_at, id))
+               - julianday(changed_at) AS days
+        FROM status_events
+    ),
+    ranked AS (
+        SELECT status, days,
+               row_number() OVER (PARTITION BY status ORDER BY days) AS rn,
+               count(*) OVER (PARTITION BY status) AS n
+        FROM spans
+        WHERE days IS NOT NULL
+    )
+    SELECT r.status AS status,
+           count(*) AS jobs,
+           avg(r.days) AS avg_days,
+           avg(CASE WHEN r.rn IN ((r.n + 1) / 2, (r.n + 2) / 2) THEN r.days END) AS median_days,
+           max(r.days) AS max_days
+    FROM ranked AS r
+    JOIN stages AS s ON s.status = r.status
+    GROUP BY r.status
+    ORDER BY min(s.pos)
+    """)
+
+
+def funnel(db):
+    """Return one row per status in pipeline order: reached, current and conversion ratios.
+
+    `of_applied` is the share of applications that ever reached the stage;
+    `from_previous` is the conversion from the preceding pipeline stage (None for
+    outcome statuses).
+    """
+    return db.execute(_FUNNEL_SQL).all()
+
+
+def time_in_stage(db, include_current: bool = False, now: datetime = None):
+    """Return days spent per stage (jobs, avg, median, max) over completed stage spans.
+
+    With `include_current`, each job's current stage also counts up to `now`.
+    """
+    now = now or datetime.now(timezone.utc)
+    params = {"include_current": include_current, "now": now.strftime("%Y-%m-%d %H:%M:%S.%f")}
+    return db.execute(_TIME_IN_STAGE_SQL, params).all()
+
+
+class SalaryGroup(str, enum.Enum):
+    ALL = "all"
+    STATUS = "status"
+    SOURCE = "source"
+
+
+_SALARY_GROUP_EXPR = {
+    SalaryGroup.ALL: "'all'",
+    SalaryGroup.STATUS: "status",
+    SalaryGroup.SOURCE: "coalesce(source, '-')",
+}
+SALARY_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _salary_cte(group: SalaryGroup) -> str:
+    # A job's salary is the midpoint of its range.
+    return f"""salaries AS (
+        SELECT {_SALARY_GROUP_EXPR[SalaryGroup(group)]} AS grp, (salary_min + salary_max) / 2 AS salary
+        FROM jobs
+        WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL
+    )"""
+
+
+def salary_percentiles(db, group: SalaryGroup = SalaryGroup.ALL):
+    """Return count, min, nearest-rank percentiles (`p10` … `p90`), max and mean per group."""
+    percentiles = ",\n".join(
+        f"max(CASE WHEN rn = max(1, ({p} * n + 99) / 100) THEN salary END) AS p{p}" for p in SALARY_PERCENTILES
+    )
+    sql = f"""
+        WITH {_salary_cte(group)},
+        ranked AS (
+            SELECT grp, salary,
+                   row_number() OVER (PARTITION BY grp ORDER BY salary) AS rn,
+                   count(*) OVER (PARTITION BY grp) AS n
+            FROM salaries
+        )
+        SELECT grp AS "group", count(*) AS jobs, min(salary) AS min,
+               {percentiles},
+               max(salary) AS max, CAST(round(avg(salary)) AS INTEGER) AS mean
+        FROM ranked
+        GROUP BY grp
+        ORDER BY grp
+        """
+    return db.execute(text(sql)).all()
+
+
+def salary_histogram(db, group: SalaryGroup = SalaryGroup.ALL, bucket: int = 25_000):
+    """Return `(group, bucket_start, jobs)` rows counting salaries per `bucket`-wide bin."""
+    sql = f"""
+        WITH {_salary_cte(group)}
+        SELECT grp AS "group", (salary / :bucket) * :bucket AS bucket, count(*) AS jobs
+        FROM salaries
+        GROUP BY grp, bucket
+        ORDER BY grp, bucket
+        """
+    return db.execute(text(sql), {"bucket": bucket}).all()
@@ -0,0 +1,78 @@
+"""Normalized tags for resumes and cover letters.
+
+`Resume.tags` / `CoverLetter.tags` keep the comma-separated text as entered; the
+`tags` table and the `resume_tags` / `cover_letter_tags` link tables hold the same
+tags normalized (trimmed, lower-cased, de-duplicated) so filters and counts are
+answered from indexes instead of string splitting.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, insert, select
+
+from jobtracker.models import Tag
+
+
+def split_tags(value: Optional[str]) -> list[str]:
+    """Split comma-separated tags into normalized names, keeping first-seen order."""
+    names = (part.strip().lower() for part in (value or "").split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def link_table(model):
+    """The tag link table of `Resume` or `CoverLetter`."""
+    return model.tag_set.property.secondary
+
+
+def _owner_column(model):
+    table = link_table(model)
+    return next(c for c in table.c if c.name != "tag_id")
+
+
+def get_or_create_tags(db, names: Iterable[str]) -> list[Tag]:
+    names = list(names)
+    if not names:
+        return []
+    existing = {t.name: t for t in db.scalars(select(Tag).where(Tag.name.in_(names)))}
+    missing = [n for n in names if n not in existing]
+    if missing:
+        db.execute(insert(Tag), [{"name": n} for n in missing])
+        existing.update((t.name, t) for t in db.scalars(select(Tag).where(Tag.name.in_(missing))))
+    return [existing[n] for n in names]
+
+
+def set_tags(db, owner, value: Optional[str]) -> None:
+    """Set the text `tags` of a resume or cover letter and its normalized tag links."""
+    owner.tags = value
+    owner.tag_set = get_or_create_tags(db, split_tags(value))
+
+
+def delete_tag_links(db, model, owner_id: str) -> None:
+    """Delete the tag links of the `model` row `owner_id`, before deleting the row itself."""
+    db.execute(delete(link_table(model)).where(_owner_column(model) == owner_id))
+
+
+def tag_filter(model, names: Iterable[str], match_any: bool = False):
+    """WHERE clause selecting `model` rows tagged with all of `names` (any of them with `match_any`).
+
+    Resolved in SQL against the (tag, owner) index of the link table.
+    """
+    names = split_tags(",".join(names))
+    owner = _owner_column(model)
+    link = link_table(model)
+    matches = select(owner).join(Tag, Tag.id == link.c.tag_id).where(Tag.name.in_(names))
+    if not match_any:
+        matches = matches.group_by(owner).having(func.count() == len(names))
+    return model.id.in_(matches)
+
+
+def tag_counts_select(model):
+    """Tags in use on `model` rows with how many rows carry each, most used first."""
+    link = link_table(model)
+    count = func.count().label("count")
+    return (
+        select(Tag.name.label("tag"), count)
+        .join(link, link.c.tag_id == Tag.id)
+        .group_by(Tag.id, Tag.name)
+        .order_by(count.desc(), Tag.name)
+    )
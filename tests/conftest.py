@@ -22,13 +22,13 @@ def in_memory_db(monkeypatch):
     from sqlalchemy.orm import sessionmaker
 
     engine = create_engine("sqlite:///:memory:", future=True)
-    # Create tables
-    dbmod.Base.metadata.create_all(bind=engine)
+    # Create tables through the versioned migrations, as the CLI does
+    dbmod.init_db(engine)
 
     TestSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
     monkeypatch.setattr(dbmod, "SessionLocal", TestSessionLocal)
 
-    yield
+    yield engine
 
 
 @pytest.fixture
@@ -0,0 +1,119 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import create_engine, func, insert, select
+    from sqlalchemy.orm import Session
+    from jobtracker import db as dbmod
+    from jobtracker import archive, migrations
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, Note, StatusCount
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+@pytest.fixture
+def jobs(session, tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBTRACKER_ARCHIVE_DB", str(tmp_path / "archive.db"))
+    now = datetime.now(timezone.utc)
+    rows = [
+        ("old-rejected", JobStatus.REJECTED, 400),
+        ("old-ghosted", JobStatus.GHOSTED, 200),
+        ("new-rejected", JobStatus.REJECTED, 10),
+        ("old-applied", JobStatus.APPLIED, 400),
+    ]
+    session.execute(
+        insert(Job),
+        [
+            {"id": id, "company": id, "title": "Dev", "status": status, "last_updated": now - timedelta(days=days)}
+            for id, status, days in rows
+        ],
+    )
+    session.execute(insert(Note), [{"id": f"n-{id}", "job_id": id, "content": "visa sponsorship"} for id, *_ in rows])
+    session.commit()
+    return [id for id, *_ in rows]
+
+
+def _listed(runner, *args):
+    result = runner.invoke(app, ["job", "list", "--format", "ndjson", "--sort", "company", *args])
+    assert result.exit_code == 0, result.output
+    return [json.loads(line)["id"] for line in result.stdout.splitlines()]
+
+
+def test_archive_moves_closed_jobs_with_notes_and_history(session, runner, jobs):
+    result = runner.invoke(app, ["archive", "--older-than", "180d", "--dry-run"])
+    assert "Would archive 2 job(s) and 2 note(s)" in result.output
+    assert session.scalar(select(func.count()).select_from(Job)) == 4
+
+    result = runner.invoke(app, ["archive", "--older-than", "180d"])
+    assert result.exit_code == 0, result.output
+    assert "Archived 2 job(s) and 2 note(s)" in result.output
+    assert _listed(runner) == ["new-rejected", "old-applied"]
+    assert session.scalars(select(Note.job_id).order_by(Note.job_id)).all() == ["new-rejected", "old-applied"]
+    counts = dict(session.execute(select(StatusCount.status, StatusCount.current)).all())
+    assert counts["rejected"] == 1 and counts["ghosted"] == 0
+    conn = session.connection()
+    if migrations.fts5_available(conn):
+        docs = conn.exec_driver_sql("SELECT job_id FROM search_docs WHERE kind = 'note' ORDER BY 1").scalars().all()
+        assert docs == ["new-rejected", "old-applied"]
+    assert archive.attach_archive(session)
+    events = conn.exec_driver_sql("SELECT job_id FROM archive.status_events ORDER BY 1").scalars().all()
+    assert events == ["old-ghosted", "old-rejected"]
+
+    assert _listed(runner, "--include-archived") == ["new-rejected", "old-applied", "old-ghosted", "old-rejected"]
+    assert _listed(runner, "--include-archived", "--status", "ghosted") == ["old-ghosted"]
+    assert runner.invoke(app, ["note", "list", "old-ghosted"]).exit_code == 1
+    result = runner.invoke(app, ["note", "list", "old-gh", "--include-archived"])
+    assert result.exit_code == 0, result.output
+    assert "visa sponsorship" in result.output
+
+    # Nothing left to move; archiving again adds nothing.
+    assert "Archived 0 job(s)" in runner.invoke(app, ["archive"]).output
+    assert len(_listed(runner, "--include-archived")) == 4
+
+
+def test_interrupted_archive_run_is_completed_by_the_next(session, jobs, monkeypatch):
+    attach, calls = archive.attach_archive, []
+
+    def crash_before_delete(db, create=False):
+        calls.append(create)
+        if len(calls) == 2:  # the copy is committed; the process dies before the delete
+            raise KeyboardInterrupt
+        return attach(db, create)
+
+    monkeypatch.setattr(archive, "attach_archive", crash_before_delete)
+    with pytest.raises(KeyboardInterrupt):
+        archive.archive_jobs(session)
+    session.rollback()
+    assert session.scalar(select(func.count()).select_from(Job)) == 4  # nothing deleted yet
+
+    monkeypatch.setattr(archive, "attach_archive", attach)
+    assert archive.archive_jobs(session) == archive.ArchiveResult(2, 2)
+    assert session.scalar(select(func.count()).select_from(Job)) == 2
+    conn = session.connection()
+    counts = [
+        conn.exec_driver_sql(f"SELECT count(*), count(DISTINCT job_id) FROM archive.{table}").one()
+        for table in ("notes", "status_events")
+    ]
+    assert counts == [(2, 2), (2, 2)]
+    assert conn.exec_driver_sql("SELECT count(*) FROM archive.jobs").scalar() == 2
+
+
+def test_include_archived_without_an_archive_lists_live_jobs(runner, jobs):
+    assert _listed(runner, "--include-archived") == sorted(jobs)
+
+
+def test_archive_moves_notes_without_foreign_key_enforcement(tmp_path):
+    path = tmp_path / "plain.db"
+    dbmod.init_db(create_engine(f"sqlite:///{path}"))
+    with Session(create_engine(f"sqlite:///{path}")) as s:
+        last_updated = datetime.now(timezone.utc) - timedelta(days=400)
+        s.execute(insert(Job), [{"id": "j1", "company": "A", "title": "Dev", "status": JobStatus.REJECTED}])
+        s.execute(Job.__table__.update().values(last_updated=last_updated))
+        s.execute(insert(Note), [{"id": "n1", "job_id": "j1", "content": "x"}])
+        s.commit()
+        assert archive.archive_jobs(s) == archive.ArchiveResult(1, 1)
+        assert s.scalar(select(func.count()).select_from(Note)) == 0
@@ -0,0 +1,127 @@
+import gzip
+import sqlite3
+import threading
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import func, insert, select
+    from sqlalchemy.orm import sessionmaker
+    from jobtracker import backup, catalog
+    from jobtracker import db as dbmod
+    from jobtracker.cli.main import app
+    from jobtracker.models import Job, Resume
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """The application database as a WAL-mode file, as in normal use."""
+    engine = dbmod.make_engine(tmp_path / "jobtracker.db", profile="interactive")
+    dbmod.init_db(engine)
+    monkeypatch.setattr(dbmod, "SessionLocal", sessionmaker(bind=engine, autoflush=False, autocommit=False))
+    with engine.begin() as conn:
+        conn.execute(insert(Job), [{"id": f"job-{n}", "company": f"Co{n}", "title": "Dev"} for n in range(100)])
+    yield engine
+    engine.dispose()
+
+
+def _jobs(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(Job)).scalar()
+
+
+def test_backup_rotation_and_restore(file_db, runner, tmp_path):
+    backups = tmp_path / "backups"
+    for _ in range(3):
+        result = runner.invoke(app, ["backup", "--dir", str(backups), "--compress", "gzip", "--keep", "2"])
+        assert result.exit_code == 0, result.output
+    assert "Removed 1 old backup(s)" in result.output
+    names = [p.name for p in backup.list_backups(backups)]
+    assert len(names) == 2 and all(name.endswith(".db.gz") for name in names)
+    assert sorted(p.name for p in backups.iterdir()) == sorted(names)  # no temporary files left
+
+    with file_db.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM jobs")
+    assert runner.invoke(app, ["restore", "--dir", str(backups)], input="n\n").exit_code == 1
+    assert _jobs(file_db) == 0
+    result = runner.invoke(app, ["restore", "--dir", str(backups), "--yes"])
+    assert result.exit_code == 0, result.output
+    assert "Restored" in result.output and names[0][-12:] in result.output.replace("\n", "")
+    assert _jobs(file_db) == 100
+
+
+def test_restore_invalidates_cached_catalog_listings(file_db, tmp_path):
+    def add_resume(name):
+        with file_db.begin() as conn:
+            conn.execute(insert(Resume).values(id=name, name=name, file_path=f"/{name}.pdf"))
+
+    def listed():
+        # Through the cache, as a long-running daemon reads it
+        with dbmod.SessionLocal() as db:
+            return [entry.name for entry in catalog.catalog_entries(db, Resume)]
+
+    db_path = tmp_path / "jobtracker.db"
+    add_resume("a")
+    first = backup.create_backup(db_path, tmp_path / "b1", backup.Compression.NONE).path
+    add_resume("b")
+    second = backup.create_backup(db_path, tmp_path / "b2", backup.Compression.NONE).path
+    backup.restore_backup(first, db_path)
+    add_resume("c")  # the counter now has the value it had in the second backup
+    assert sorted(listed()) == ["a", "c"]
+
+    backup.restore_backup(second, db_path)
+    assert sorted(listed()) == ["a", "b"]
+
+
+def test_backup_is_a_snapshot_taken_under_concurrent_writes(file_db, tmp_path):
+    db_path = tmp_path / "jobtracker.db"
+    stop, written = threading.Event(), []
+
+    def writer():
+        conn = sqlite3.connect(db_path, timeout=5)
+        while not stop.is_set():
+            with conn:
+                conn.execute("INSERT INTO jobs (id, company, title) VALUES (?, 'W', 'Dev')", [f"w-{len(written)}"])
+            written.append(1)
+        conn.close()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        steps = []
+        result = backup.create_backup(
+            db_path, tmp_path / "backups", backup.Compression.GZIP, step_pages=1, progress=lambda *p: steps.append(p)
+        )
+    finally:
+        stop.set()
+        thread.join()
+    assert written and len(steps) == result.pages > 1
+
+    restored = tmp_path / "restored.db"
+    restored.write_bytes(gzip.decompress(result.path.read_bytes()))
+    with sqlite3.connect(restored) as conn:
+        assert conn.execute("PRAGMA quick_check").fetchone()[0] == "ok"
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert 100 <= conn.execute("SELECT count(*) FROM jobs").fetchone()[0] <= 100 + len(written)
+
+
+def test_restore_rejects_a_damaged_backup(file_db, tmp_path):
+    result = backup.create_backup(tmp_path / "jobtracker.db", tmp_path / "backups", backup.Compression.NONE)
+    damaged = tmp_path / "backups" / "jobtracker-20260101T000000Z.db.gz"
+    damaged.write_bytes(gzip.compress(result.path.read_bytes()[:4096] + b"\0" * 8192))
+    with pytest.raises(backup.BackupError, match="not a usable backup"):
+        backup.restore_backup(damaged, tmp_path / "jobtracker.db")
+    assert _jobs(file_db) == 100
+    assert not (tmp_path / "jobtracker.db.restore").exists()
+
+
+def test_zstd_backup_round_trip(file_db, tmp_path):
+    pytest.importorskip("zstandard")
+    result = backup.create_backup(tmp_path / "jobtracker.db", tmp_path / "backups", backup.Compression.ZSTD)
+    assert result.path.name.endswith(".db.zst")
+    with file_db.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM jobs")
+    backup.restore_backup(result.path, tmp_path / "jobtracker.db")
+    assert _jobs(file_db) == 100
@@ -0,0 +1,101 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import func, insert, select
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, StatusEvent
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _add_jobs(session, count, days_old=0, **fields):
+    stamp = datetime.now(timezone.utc) - timedelta(days=days_old)
+    rows = [
+        {"id": str(uuid.uuid4()), "company": f"Co{i}", "title": "Dev", "last_updated": stamp, **fields}
+        for i in range(count)
+    ]
+    session.execute(insert(Job), rows)
+    session.commit()
+    return [r["id"] for r in rows]
+
+
+def _statuses(session):
+    return dict(session.execute(select(Job.status, func.count()).group_by(Job.status)).all())
+
+
+def test_where_older_than_updates_stale_jobs_in_one_statement(session):
+    _add_jobs(session, 30, days_old=90)
+    _add_jobs(session, 5, days_old=10)
+    _add_jobs(session, 4, days_old=90, status=JobStatus.RECRUITER)
+
+    result = CliRunner().invoke(app, ["job", "status", "--where", "status=applied", "--older-than", "60d", "ghosted"])
+    assert result.exit_code == 0, result.output
+    assert "Updated status of 30 job(s) to ghosted" in result.stdout
+    session.expire_all()
+    assert _statuses(session) == {JobStatus.GHOSTED: 30, JobStatus.APPLIED: 5, JobStatus.RECRUITER: 4}
+
+    ghosted = session.scalars(select(Job).where(Job.status == JobStatus.GHOSTED)).all()
+    assert all(j.last_updated.date() == datetime.now(timezone.utc).date() for j in ghosted)
+    transitions = select(func.count()).where(StatusEvent.from_status == "applied", StatusEvent.to_status == "ghosted")
+    assert session.execute(transitions).scalar() == 30
+
+
+def test_ids_from_file_and_stdin(session, tmp_path):
+    ids = _add_jobs(session, 6)
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("\n".join(ids[:3] + ["missing-id", ""]) + "\n")
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["job", "status", "--ids-from", str(ids_file), "rejected"])
+    assert result.exit_code == 0, result.output
+    assert "Updated status of 3 job(s) to rejected" in result.stdout
+    assert "1 ID(s) not found" in result.stdout
+
+    result = runner.invoke(app, ["job", "status", "--ids-from", "-", "offer"], input="\n".join(ids[2:5]))
+    assert "Updated status of 3 job(s) to offer" in result.stdout
+    session.expire_all()
+    assert _statuses(session) == {JobStatus.REJECTED: 2, JobStatus.OFFER: 3, JobStatus.APPLIED: 1}
+
+
+def test_ids_from_accepts_unique_prefixes(session):
+    ids = ["3fa90000-aaaa-0000-0000-000000000000", "7c000000-bbbb-0000-0000-000000000000"]
+    ids += ["7c000000-cccc-0000-0000-000000000000"]
+    session.execute(insert(Job), [{"id": i, "company": "Co", "title": "Dev"} for i in ids])
+    session.commit()
+    runner = CliRunner()
+
+    # An ambiguous line stops the whole batch before anything changes.
+    result = runner.invoke(app, ["job", "status", "--ids-from", "-", "offer"], input="3FA9\n7c000000\n")
+    assert result.exit_code == 1
+    assert "'7c000000' is ambiguous" in result.stdout
+    assert _statuses(session) == {JobStatus.APPLIED: 3}
+
+    result = runner.invoke(app, ["job", "status", "--ids-from", "-", "offer"], input="3fa9\n7c000000-b\n3fa90\nzz\n")
+    assert result.exit_code == 0, result.output
+    assert result.stdout.index("1 ID(s) match nothing: zz") < result.stdout.index("Updated status of 2 job(s)")
+    assert "1 ID(s) not found" in result.stdout
+    session.expire_all()
+    assert _statuses(session) == {JobStatus.OFFER: 2, JobStatus.APPLIED: 1}
+
+    result = runner.invoke(app, ["job", "remove", "--ids-from", "-", "--yes"], input="7c000000-c\n")
+    assert "Removed 1 job(s)" in result.stdout
+    assert session.scalar(select(func.count()).select_from(Job)) == 2
+
+
+def test_batch_arguments_are_validated(session):
+    runner = CliRunner()
+    cases = [
+        (["--where", "title=x", "ghosted"], "expected one of status, company, source"),
+        (["--older-than", "soon", "ghosted"], "not an age"),
+        (["--where", "status=applied", "ghosted-ish"], "Unknown status"),
+        (["--where", "status=applied", "some-id", "ghosted"], "pass only the new status"),
+    ]
+    for args, message in cases:
+        result = runner.invoke(app, ["job", "status", *args])
+        assert result.exit_code == 2, args
+        assert message in result.output
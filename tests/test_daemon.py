@@ -0,0 +1,128 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import event
+    from jobtracker.catalog import catalog_entries, catalog_name, clear_cache
+    from jobtracker.cli.client import daemon_supported
+    from jobtracker.models import Resume
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+ENTRY = "from jobtracker.cli.client import run; run()"
+
+
+def test_catalog_cache_follows_catalog_version(session):
+    session.add(Resume(id="r1", name="Backend", file_path="/tmp/a.pdf"))
+    session.commit()
+    assert catalog_entries(session, Resume) == [("r1", "Backend", "")]
+
+    session.get(Resume, "r1").name = "Backend v2"
+    session.commit()
+    assert catalog_name(session, Resume, "r1") == "Backend v2"
+
+    session.delete(session.get(Resume, "r1"))
+    session.commit()
+    assert catalog_entries(session, Resume) == []
+
+
+def test_catalog_name_reads_one_row_until_the_listing_is_cached(session, in_memory_db):
+    session.add_all(Resume(id=f"r{n}", name=f"Variant {n}", file_path="/tmp/a.pdf") for n in range(50))
+    session.commit()
+    clear_cache()
+    selects = []
+    event.listen(in_memory_db, "before_cursor_execute", lambda *args: selects.append(" ".join(args[2].split())))
+
+    assert catalog_name(session, Resume, "r7") == "Variant 7"
+    assert catalog_name(session, Resume, "missing") is None
+    assert not any(s.startswith("SELECT resumes.id, resumes.name, resumes.tags") for s in selects)
+    assert "SELECT resumes.name FROM resumes WHERE resumes.id = ?" in selects
+
+    catalog_entries(session, Resume)
+    selects.clear()
+    assert catalog_name(session, Resume, "r8") == "Variant 8"
+    assert not any("FROM resumes" in s for s in selects)
+
+
+@pytest.fixture
+def daemon_env():
+    if not daemon_supported():
+        pytest.skip("Unix sockets with fd passing are not available")
+    # Unix socket paths are limited to ~100 characters; pytest's tmp_path can be longer.
+    tmp = Path(tempfile.mkdtemp(prefix="jtd", dir="/tmp"))
+    env = {**os.environ, "JOBTRACKER_DB": str(tmp / "t.db"), "JOBTRACKER_SOCKET": str(tmp / "d.sock")}
+    env.pop("JOBTRACKER_NO_DAEMON", None)
+    daemon = subprocess.Popen(
+        [sys.executable, "-c", ENTRY, "daemon", "start", "--foreground"], env=env, stdout=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 20
+    while not (tmp / "d.sock").exists():
+        assert daemon.poll() is None and time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    yield env
+    daemon.terminate()
+    daemon.wait(timeout=10)
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_failed_start_is_logged(tmp_path):
+    if not daemon_supported():
+        pytest.skip("Unix sockets with fd passing are not available")
+    tmp = Path(tempfile.mkdtemp(prefix="jtd", dir="/tmp"))
+    env = {**os.environ, "HOME": str(tmp), "JOBTRACKER_SOCKET": str(tmp / "d.sock")}
+    env["JOBTRACKER_DB"] = str(tmp_path / "missing" / "t.db")  # its directory does not exist
+    env.pop("JOBTRACKER_NO_DAEMON", None)
+    try:
+        result = _jobtracker(env, "daemon", "start")
+        assert result.returncode == 1
+        assert "Daemon failed to start" in result.stdout
+        log = (tmp / ".jobtracker" / "daemon.log").read_text()
+        assert "Traceback" in log and "unable to open database file" in log
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _jobtracker(env, *args, input=None):
+    return subprocess.run(
+        [sys.executable, "-c", ENTRY, *args], env=env, input=input, capture_output=True, text=True, timeout=30
+    )
+
+
+def _served(env):
+    status = _jobtracker(env, "daemon", "status")
+    assert status.returncode == 0, status.stdout
+    return int(status.stdout.split("Served ")[1].split()[0])
+
+
+def test_commands_are_forwarded_to_the_daemon(daemon_env):
+    # The remaining fields are prompted for on the client's stdin.
+    answers = "LinkedIn\nhttps://x.io\nRemote\nnone listed\n"
+    added = _jobtracker(daemon_env, "job", "add", "--company", "Acme", "--title", "Dev", input=answers)
+    assert added.returncode == 0, added.stderr
+    assert "Added job Acme — Dev" in added.stdout
+
+    listed = _jobtracker(daemon_env, "job", "list", "--format", "csv")
+    assert "Acme" in listed.stdout
+
+    bad = _jobtracker(daemon_env, "job", "status", "1234", "hired")
+    assert bad.returncode == 2
+    assert "Invalid value" in bad.stderr
+    assert _served(daemon_env) == 3
+
+
+def test_falls_back_to_in_process(daemon_env, tmp_path):
+    other_db = {**daemon_env, "JOBTRACKER_DB": str(tmp_path / "other.db")}
+    result = _jobtracker(other_db, "job", "list", "--format", "csv")
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "other.db").exists()
+
+    result = _jobtracker({**daemon_env, "JOBTRACKER_NO_DAEMON": "1"}, "job", "list", "--format", "csv")
+    assert result.returncode == 0, result.stderr
+    assert _served(daemon_env) == 0
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy.exc import OperationalError
+    from jobtracker import db as dbmod
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_interactive_profile_applied_on_connect(tmp_path):
+    engine = dbmod.make_engine(tmp_path / "t.db", profile="interactive")
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "busy_timeout") == 5000
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "cache_size") == -65536
+
+
+def test_read_only_profile_rejects_writes(tmp_path):
+    path = tmp_path / "ro.db"
+    dbmod.init_db(dbmod.make_engine(path, profile="interactive"))
+
+    ro = dbmod.make_engine(path, profile="read-only")
+    with ro.connect() as conn:
+        assert conn.exec_driver_sql("SELECT count(*) FROM jobs").scalar() == 0
+        with pytest.raises(OperationalError):
+            conn.exec_driver_sql("DELETE FROM jobs")
+
+
+def test_unknown_profile_and_setting_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        dbmod.make_engine(tmp_path / "x.db", profile="turbo")
+    with pytest.raises(ValueError):
+        dbmod.make_engine(tmp_path / "x.db", profile="interactive", overrides={"busy_timeout": "1; DROP TABLE jobs"})
+
+
+def test_settings_from_env_and_config_file(tmp_path):
+    config = tmp_path / "config.ini"
+    config.write_text("[engine]\nprofile = bulk-load\nbusy_timeout = 12345\n")
+
+    assert dbmod.load_engine_settings(config, environ={}) == ("bulk-load", {"busy_timeout": "12345"})
+    profile, overrides = dbmod.load_engine_settings(config, environ={"JOBTRACKER_DB_PROFILE": "read-only"})
+    assert profile == "read-only"
+
+    engine = dbmod.make_engine(tmp_path / "c.db", profile="bulk-load", overrides=overrides)
+    assert _pragma(engine, "busy_timeout") == 12345
+    assert dbmod.load_engine_settings(tmp_path / "missing.ini", environ={}) == (dbmod.DEFAULT_PROFILE, {})
+
+
+@pytest.mark.parametrize(
+    "setting, named",
+    [
+        ({"JOBTRACKER_DB_PROFILE": "turbo"}, "Unknown engine profile 'turbo'"),
+        ({"JOBTRACKER_CONFIG": "{config}"}, "Unsupported engine setting journal_mode = 'WAL; DROP TABLE jobs'"),
+    ],
+)
+def test_bad_engine_settings_are_a_one_line_cli_error(tmp_path, setting, named):
+    config = tmp_path / "config.ini"
+    config.write_text("[engine]\njournal_mode = WAL; DROP TABLE jobs\n")
+    env = {key: value for key, value in os.environ.items() if not key.startswith("JOBTRACKER_")}
+    env.update({key: value.format(config=config) for key, value in setting.items()})
+    env.update(JOBTRACKER_DB=str(tmp_path / "t.db"), JOBTRACKER_NO_DAEMON="1")
+
+    def run(*args):
+        entry = "from jobtracker.cli.client import run; run()"
+        return subprocess.run([sys.executable, "-c", entry, *args], env=env, capture_output=True, text=True, timeout=30)
+
+    result = run("job", "list")
+    assert result.returncode == 2
+    assert result.stderr.startswith(f"jobtracker: {named}")
+    assert len(result.stderr.splitlines()) == 1
+    assert run("--help").returncode == 0
+    assert not (tmp_path / "t.db").exists()
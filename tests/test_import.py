@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import event
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, Resume
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def test_csv_import_batches_and_reports_bad_rows(session, tmp_path, in_memory_db):
+    resume = Resume(name="Backend CV", file_path="/tmp/cv.pdf")
+    session.add(resume)
+    session.commit()
+
+    path = tmp_path / "jobs.csv"
+    path.write_text(
+        "Company,Title,Salary Range,Status,Resume,Applied Date\n"
+        "Acme,Dev,120000 - 150000,,backend cv,2025-02-01\n"
+        ",Missing company,,,,\n"
+        "Globex,Ops,,recruiter,,\n"
+        "Initech,QA,,,No Such Resume,\n"
+        "Hooli,SRE,,,,\n"
+    )
+    inserts = []
+    event.listen(
+        in_memory_db,
+        "before_cursor_execute",
+        lambda conn, cur, stmt, params, ctx, many: inserts.append(many) if stmt.startswith("INSERT") else None,
+    )
+
+    result = CliRunner().invoke(app, ["job", "import", str(path), "--batch-size", "2"])
+    assert result.exit_code == 1, result.stdout
+    assert "Row 3:" in result.stdout and "Row 5:" in result.stdout
+    assert "Imported 3 job(s); rejected 2 row(s)" in result.stdout
+    # One executemany per batch that had valid rows: [Acme], [Globex], [Hooli]
+    assert len(inserts) == 3
+
+    acme = session.query(Job).filter(Job.company == "Acme").one()
+    assert acme.resume_id == resume.id
+    assert acme.salary_range == "$120,000 - $150,000"
+    assert acme.applied_date.date().isoformat() == "2025-02-01"
+    assert session.query(Job).filter(Job.company == "Globex").one().status == JobStatus.RECRUITER
+
+
+def test_ndjson_import_skips_malformed_lines_and_dry_run_writes_nothing(session, tmp_path):
+    path = tmp_path / "jobs.ndjson"
+    path.write_text(json.dumps({"company": "A", "title": "T"}) + "\n{not json\n" + json.dumps(["x"]) + "\n")
+
+    dry = CliRunner().invoke(app, ["job", "import", str(path), "--dry-run"])
+    assert "Validated 1 job(s); rejected 2 row(s)" in dry.stdout
+    assert session.query(Job).count() == 0
+
+    real = CliRunner().invoke(app, ["job", "import", str(path)])
+    assert "Imported 1 job(s)" in real.stdout
+    assert session.query(Job).count() == 1
+
+
+def test_json_import_requires_known_format(tmp_path):
+    path = tmp_path / "jobs.txt"
+    path.write_text("[]")
+    result = CliRunner().invoke(app, ["job", "import", str(path)])
+    assert result.exit_code == 1
+    ok = CliRunner().invoke(app, ["job", "import", str(path), "--format", "json"])
+    assert ok.exit_code == 0, ok.stdout
@@ -0,0 +1,104 @@
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+@pytest.fixture(autouse=True)
+def wide_console(monkeypatch):
+    """Render tables at a width where every column fits, so cells are not truncated."""
+    from jobtracker.cli import cli_jobs
+
+    monkeypatch.setattr(cli_jobs.console, "width", 300)
+
+
+def _add_jobs(session, count, **fields):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    jobs = [
+        Job(id=str(uuid.uuid4()), company=f"Co{i}", title=f"T{i}", created_at=base + timedelta(days=i), **fields)
+        for i in range(count)
+    ]
+    session.add_all(jobs)
+    session.commit()
+    return jobs
+
+
+def _companies(output):
+    return re.findall(r"\bCo\d+\b", output)
+
+
+def test_list_pages_with_keyset_cursor(session):
+    _add_jobs(session, 5)
+    runner = CliRunner()
+
+    first = runner.invoke(app, ["job", "list", "--limit", "2"])
+    assert first.exit_code == 0, first.stdout
+    assert _companies(first.stdout) == ["Co4", "Co3"]
+    cursor = re.search(r"--after (\S+)", first.stdout).group(1)
+
+    second = runner.invoke(app, ["job", "list", "--limit", "2", "--after", cursor])
+    assert _companies(second.stdout) == ["Co2", "Co1"]
+    cursor = re.search(r"--after (\S+)", second.stdout).group(1)
+
+    last = runner.invoke(app, ["job", "list", "--limit", "2", "--after", cursor])
+    assert _companies(last.stdout) == ["Co0"]
+    assert "--after" not in last.stdout
+
+
+def test_list_rejects_malformed_cursor():
+    result = CliRunner().invoke(app, ["job", "list", "--after", "not-a-cursor"])
+    assert result.exit_code == 1
+    assert "Invalid --after" in result.stdout
+
+
+def test_stream_emits_every_row_in_batches(session, monkeypatch):
+    from jobtracker.cli import cli_jobs
+
+    monkeypatch.setattr(cli_jobs, "STREAM_BATCH_SIZE", 2)
+    _add_jobs(session, 5)
+
+    result = CliRunner().invoke(app, ["job", "list", "--stream"])
+    assert result.exit_code == 0, result.stdout
+    assert _companies(result.stdout) == ["Co4", "Co3", "Co2", "Co1", "Co0"]
+    assert result.stdout.count("Company") == 1
+
+    limited = CliRunner().invoke(app, ["job", "list", "--stream", "--limit", "3"])
+    assert _companies(limited.stdout) == ["Co4", "Co3", "Co2"]
+    assert "--after" in limited.stdout
+
+
+def test_filters_compile_to_sql_and_combine(session):
+    jobs = _add_jobs(session, 6)
+    jobs[1].status, jobs[1].source = JobStatus.OFFER, "referral"
+    jobs[2].status, jobs[2].source = JobStatus.REJECTED, "referral"
+    jobs[3].title = "Senior Platform Engineer"
+    jobs[4].applied_date = datetime(2025, 3, 10, 15, tzinfo=timezone.utc)
+    session.commit()
+    runner = CliRunner()
+
+    def listed(*args):
+        result = runner.invoke(app, ["job", "list", *args])
+        assert result.exit_code == 0, result.stdout
+        return _companies(result.stdout)
+
+    assert listed("--status", "offer", "--status", "rejected") == ["Co2", "Co1"]
+    assert listed("--source", "referral", "--status", "offer") == ["Co1"]
+    assert listed("--company", "Co5") == ["Co5"]
+    assert listed("--title-contains", "platform") == ["Co3"]
+    assert listed("--applied-since", "2025-03-10", "--applied-until", "2025-03-10") == ["Co4"]
+    assert listed("--sort", "company", "--limit", "2") == ["Co0", "Co1"]
+    assert "No matching jobs found." in runner.invoke(app, ["job", "list", "--company", "Nope"]).stdout
+
+
+def test_after_cursor_requires_default_sort():
+    result = CliRunner().invoke(app, ["job", "list", "--sort", "company", "--after", "abc"])
+    assert result.exit_code == 1
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app, LAZY_COMMANDS
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+HEAVY_MODULES = ("sqlalchemy", "pydantic", "rich", "jobtracker.db", "jobtracker.models")
+
+
+def _run_python(code: str, home: Path) -> subprocess.CompletedProcess:
+    env = dict(os.environ, HOME=str(home))
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env)
+
+
+def test_entry_point_does_not_import_heavy_modules(tmp_path):
+    proc = _run_python("import jobtracker.cli.main", tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    imported = {line.split("|")[-1].strip() for line in proc.stderr.splitlines() if line.startswith("import time:")}
+    heavy = sorted(m for m in imported if m in HEAVY_MODULES or m.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+
+
+def test_help_does_not_touch_database(tmp_path):
+    proc = _run_python("from jobtracker.cli.main import app; app(['--help'])", tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    for name in LAZY_COMMANDS:
+        assert name in proc.stdout
+    assert not (tmp_path / ".jobtracker").exists()
+
+
+def test_lazy_subcommand_help_runs():
+    runner = CliRunner()
+    result = runner.invoke(app, ["job", "--help"])
+    assert result.exit_code == 0
+    assert "list" in result.stdout
@@ -0,0 +1,85 @@
+import zipfile
+
+import pytest
+
+pytest.importorskip("numpy")
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from jobtracker import matching
+    from jobtracker.cli.cli_match import EXPORT_COLUMNS
+    from jobtracker.cli.main import app
+    from jobtracker.models import Job, Resume
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _docx(path, text):
+    body = "".join(f"<w:p><w:r><w:t>{line}</w:t></w:r></w:p>" for line in text.splitlines())
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("word/document.xml", f"<w:document><w:body>{body}</w:body></w:document>")
+    return path
+
+
+@pytest.fixture
+def catalog(session, tmp_path, monkeypatch):
+    monkeypatch.setattr(matching, "MATCH_CACHE_DIR", tmp_path / "cache")
+    files = tmp_path / "resumes"
+    files.mkdir()
+    (files / "backend.txt").write_text("Python backend engineer: Django, PostgreSQL, REST APIs, Kafka")
+    (files / "frontend.md").write_text("Frontend developer. React, TypeScript, CSS &amp; accessibility")
+    _docx(files / "data.docx", "Data engineer\nSpark, Airflow &amp; dbt pipelines on a Snowflake warehouse")
+    (files / "scan.pdf").write_bytes(b"%PDF-1.7\0binary")
+    session.add_all(
+        [
+            Resume(id="r1", name="Backend", file_path=str(files / "backend.txt")),
+            Resume(id="r2", name="Frontend", file_path=str(files / "frontend.md")),
+            Resume(id="r3", name="Data", file_path=str(files / "data.docx")),
+            Resume(id="r4", name="Go platform", tags="kubernetes", file_path=str(files / "scan.pdf")),
+            Job(id="j1", company="Acme", title="Senior Backend Engineer", ai_summary="Python and Kafka APIs"),
+            Job(id="j2", company="Beta", title="Analytics Engineer", ai_summary="Airflow, dbt and Snowflake"),
+            Job(id="j3", company="Gamma", title="Platform Engineer", ai_summary="Go services on Kubernetes"),
+            Job(id="j4", company="Delta", title="Chef", ai_summary="Pastry"),
+        ]
+    )
+    session.commit()
+    return files
+
+
+def test_ranks_resumes_and_reuses_cached_vectors(session, catalog, monkeypatch):
+    jobs = [(job.id, job.title, job.ai_summary) for job in session.query(Job).order_by(Job.id)]
+    result = matching.match_jobs(session, jobs, top=2)
+    assert (result.resumes, result.cached, result.unreadable) == (4, 0, ["r4"])
+    assert result.matches["j1"][0].resume_id == "r1"
+    assert result.matches["j2"][0].resume_id == "r3"
+    assert result.matches["j3"][0].resume_id == "r4"  # name and tags only
+    assert result.matches["j4"] == []
+    assert 0 < result.matches["j1"][0].score <= 1
+
+    # Unchanged files are only hashed; a changed one is tokenized again.
+    tokenized, document_text = [], matching.document_text
+
+    def spy(path, data):
+        tokenized.append(path.name)
+        return document_text(path, data)
+
+    monkeypatch.setattr(matching, "document_text", spy)
+    assert matching.match_jobs(session, jobs).cached == 3
+    (catalog / "frontend.md").write_text("Frontend developer: Svelte")
+    assert matching.match_jobs(session, jobs).cached == 2
+    assert sorted(tokenized) == ["frontend.md", "scan.pdf", "scan.pdf"]  # the PDF is never cached
+
+
+def test_match_commands(runner, catalog):
+    result = runner.invoke(app, ["match", "j2"])
+    assert result.exit_code == 0, result.output
+    assert result.output.index("Data") < result.output.index("Backend")
+
+    result = runner.invoke(app, ["match", "--all", "--format", "tsv"])
+    assert result.exit_code == 0, result.output
+    assert "1 resume file(s) could not be read" in result.stderr
+    rows = [line.split("\t") for line in result.stdout.splitlines()]
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert {(row[0], row[3]) for row in rows[1:]} == {("j1", "r1"), ("j2", "r3"), ("j3", "r4")}
+
+    assert runner.invoke(app, ["match"]).exit_code == 1
+    assert runner.invoke(app, ["match", "nope"]).exit_code == 1
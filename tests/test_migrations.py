@@ -0,0 +1,151 @@
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import create_engine, event, inspect
+    from jobtracker import db as dbmod
+    from jobtracker import migrations
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _user_version(engine) -> int:
+    with engine.connect() as conn:
+        return migrations.get_schema_version(conn)
+
+
+def test_fresh_database_is_migrated_to_current_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}", future=True)
+    assert migrations.migrate(engine) == migrations.SCHEMA_VERSION
+    assert _user_version(engine) == migrations.SCHEMA_VERSION
+    assert {"jobs", "notes", "resumes", "cover_letters"} <= set(inspect(engine).get_table_names())
+
+
+def test_current_database_takes_fast_path(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'current.db'}", future=True)
+    migrations.migrate(engine)
+
+    def fail(conn):  # pragma: no cover - must not run
+        raise AssertionError("migration step ran on an up-to-date database")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", [(v, d, fail) for v, d, _ in migrations.MIGRATIONS])
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    assert migrations.migrate(engine) == migrations.SCHEMA_VERSION
+    assert statements == ["PRAGMA user_version"]
+
+
+# The tables as create_all built them before schema versioning (user_version 0).
+BASELINE_SCHEMA = (
+    "CREATE TABLE resumes (id VARCHAR NOT NULL, name VARCHAR NOT NULL, tags VARCHAR, file_path VARCHAR NOT NULL,"
+    " created_at DATETIME, PRIMARY KEY (id))",
+    "CREATE TABLE cover_letters (id VARCHAR NOT NULL, name VARCHAR NOT NULL, tags VARCHAR,"
+    " file_path VARCHAR NOT NULL, created_at DATETIME, PRIMARY KEY (id))",
+    "CREATE TABLE jobs (id VARCHAR NOT NULL, company VARCHAR NOT NULL, title VARCHAR NOT NULL, location VARCHAR,"
+    " salary_range VARCHAR, job_url VARCHAR, source VARCHAR, status VARCHAR(15), applied_date DATETIME,"
+    " last_updated DATETIME, created_at DATETIME, resume_id VARCHAR, cover_letter_id VARCHAR, ai_summary TEXT,"
+    " PRIMARY KEY (id), FOREIGN KEY(resume_id) REFERENCES resumes (id),"
+    " FOREIGN KEY(cover_letter_id) REFERENCES cover_letters (id))",
+    "CREATE TABLE notes (id VARCHAR NOT NULL, job_id VARCHAR NOT NULL, content TEXT NOT NULL, created_at DATETIME,"
+    " PRIMARY KEY (id), FOREIGN KEY(job_id) REFERENCES jobs (id))",
+)
+
+
+def test_legacy_unversioned_database_is_upgraded(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}", future=True)
+    with engine.begin() as conn:
+        for statement in BASELINE_SCHEMA:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql(
+            "INSERT INTO resumes (id, name, tags, file_path) VALUES"
+            " ('r1', 'Backend', 'Python, backend,python', '/r1.pdf'), ('r2', 'Plain', NULL, '/r2.pdf')"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO cover_letters (id, name, tags, file_path) VALUES ('c1', 'Generic', ' Remote ', '/c1.pdf')"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO jobs (id, company, title, salary_range, status, resume_id, cover_letter_id) VALUES"
+            " ('j1', 'A', 'Dev', '$90,000 - $110,000', 'applied', 'r1', 'c1'),"
+            " ('j2', 'B', 'Ops', 'none listed', 'offer', NULL, NULL)"
+        )
+        conn.exec_driver_sql("INSERT INTO notes (id, job_id, content) VALUES ('n1', 'j1', 'a'), ('n2', 'j2', 'b')")
+    assert _user_version(engine) == 0
+    engine.dispose()  # reopen as a new process would, with foreign keys enforced
+
+    assert dbmod.init_db(engine) == migrations.SCHEMA_VERSION
+    assert _user_version(engine) == migrations.SCHEMA_VERSION
+    with engine.begin() as conn:
+        salaries = conn.exec_driver_sql("SELECT id, salary_min, salary_max FROM jobs ORDER BY id").all()
+        assert salaries == [("j1", 90000, 110000), ("j2", None, None)]
+        links = conn.exec_driver_sql(
+            "SELECT 'r', resume_id, name FROM resume_tags JOIN tags ON tags.id = tag_id UNION ALL"
+            " SELECT 'c', cover_letter_id, name FROM cover_letter_tags JOIN tags ON tags.id = tag_id ORDER BY 1, 2, 3"
+        ).all()
+        assert links == [("c", "c1", "remote"), ("r", "r1", "backend"), ("r", "r1", "python")]
+        conn.exec_driver_sql("DELETE FROM jobs WHERE id = 'j1'")
+        assert conn.exec_driver_sql("SELECT id FROM notes").scalars().all() == ["n2"]
+
+
+def test_only_pending_steps_run_in_order(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'steps.db'}", future=True)
+    ran = []
+    steps = [(v, f"step {v}", lambda conn, v=v: ran.append(v)) for v in (1, 2, 3)]
+    monkeypatch.setattr(migrations, "MIGRATIONS", steps)
+    monkeypatch.setattr(migrations, "SCHEMA_VERSION", 3)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("PRAGMA user_version = 1")
+
+    assert migrations.migrate(engine) == 3
+    assert ran == [2, 3]
+
+
+def test_salary_columns_are_added_and_backfilled(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pre_salary.db'}", future=True)
+    with engine.begin() as conn:
+        # The jobs table as released before salary_min/salary_max existed
+        conn.exec_driver_sql(
+            "CREATE TABLE jobs (id VARCHAR PRIMARY KEY, company VARCHAR NOT NULL, title VARCHAR NOT NULL,"
+            " location VARCHAR, salary_range VARCHAR, job_url VARCHAR, source VARCHAR, status VARCHAR(15),"
+            " applied_date DATETIME, last_updated DATETIME, created_at DATETIME, resume_id VARCHAR,"
+            " cover_letter_id VARCHAR, ai_summary TEXT)"
+        )
+        insert = "INSERT INTO jobs (id, company, title, salary_range, status) VALUES (?, ?, 'Dev', ?, 'applied')"
+        conn.exec_driver_sql(insert, [("1", "A", "$90,000 - $110,000"), ("2", "B", "none listed")])
+
+    assert migrations.migrate(engine) == migrations.SCHEMA_VERSION
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT id, salary_min, salary_max FROM jobs ORDER BY id").all()
+    assert rows == [("1", 90000, 110000), ("2", None, None)]
+    assert "ix_jobs_salary_min" in {ix["name"] for ix in inspect(engine).get_indexes("jobs")}
+
+
+def test_notes_are_rebuilt_to_cascade_with_their_job(tmp_path, caplog):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pre_cascade.db'}", future=True)
+    migrations.migrate(engine)
+    with engine.begin() as conn:
+        # The notes table as released before ON DELETE CASCADE, holding one orphaned note
+        conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+        conn.exec_driver_sql("DROP TABLE notes")
+        conn.exec_driver_sql(
+            "CREATE TABLE notes (id VARCHAR PRIMARY KEY, job_id VARCHAR NOT NULL REFERENCES jobs (id),"
+            " content TEXT NOT NULL, created_at DATETIME)"
+        )
+        conn.exec_driver_sql("INSERT INTO jobs (id, company, title, status) VALUES ('j1', 'A', 'Dev', 'applied')")
+        conn.exec_driver_sql("INSERT INTO notes (id, job_id, content) VALUES ('n1', 'j1', 'keep'), ('n2', 'gone', 'x')")
+        conn.exec_driver_sql("PRAGMA user_version = 9")
+    engine.dispose()  # reopen as a new process would, with foreign keys enforced
+
+    assert dbmod.init_db(engine) == migrations.SCHEMA_VERSION
+    assert [r.getMessage() for r in caplog.records if r.name == migrations.__name__] == [
+        "Removed 1 note(s) of jobs that no longer exist while rebuilding the notes table"
+    ]
+    with engine.begin() as conn:
+        assert conn.exec_driver_sql("SELECT id FROM notes").scalars().all() == ["n1"]
+        conn.exec_driver_sql("INSERT INTO notes (id, job_id, content) VALUES ('n3', 'j1', 'visa sponsorship')")
+        if migrations.fts5_available(conn):
+            # Triggers are back on the rebuilt table, so new notes are indexed again
+            refs = conn.exec_driver_sql("SELECT ref_id FROM search_docs WHERE kind = 'note'").scalars().all()
+            assert refs == ["n3"]
+        conn.exec_driver_sql("DELETE FROM jobs WHERE id = 'j1'")
+        assert conn.exec_driver_sql("SELECT count(*) FROM notes").scalar() == 0
+        assert conn.exec_driver_sql("SELECT count(*) FROM search_docs").scalar() == 0
+    assert "ix_notes_job_id_created_at" in {ix["name"] for ix in inspect(engine).get_indexes("notes")}
@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.cli.output import OutputFormat, write_rows
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, Note, Resume
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+@pytest.fixture
+def seeded(session):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    resume = Resume(name="Backend", file_path="/tmp/r.pdf", tags="py,sql", created_at=base)
+    session.add(resume)
+    session.flush()
+    jobs = [
+        Job(id=str(uuid.uuid4()), company=f"Co{i}", title="Dev", resume_id=resume.id, created_at=base + timedelta(i))
+        for i in range(3)
+    ]
+    jobs[0].status = JobStatus.OFFER
+    session.add_all(jobs)
+    session.add(Note(job_id=jobs[0].id, content="line one\nline\ttwo", created_at=base))
+    session.commit()
+    return jobs
+
+
+def test_job_list_ndjson_streams_one_object_per_row(seeded):
+    result = CliRunner().invoke(app, ["job", "list", "--format", "ndjson"])
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["company"] for r in rows] == ["Co2", "Co1", "Co0"]
+    assert rows[-1]["status"] == "offer"
+    assert rows[-1]["resume_name"] == "Backend"
+    assert rows[-1]["applied_date"] is None
+    assert rows[-1]["created_at"].startswith("2025-01-01")
+
+
+def test_job_list_csv_respects_filters_and_paging(seeded):
+    result = CliRunner().invoke(app, ["job", "list", "--format", "csv", "--limit", "1", "--status", "applied"])
+    assert result.exit_code == 0, result.output
+    rows = list(csv.DictReader(io.StringIO(result.stdout)))
+    assert [r["company"] for r in rows] == ["Co2"]
+    assert "--after" in result.stderr
+
+
+def test_resume_and_note_exports(seeded):
+    runner = CliRunner()
+    resumes = list(csv.DictReader(io.StringIO(runner.invoke(app, ["resume", "list", "--format", "csv"]).stdout)))
+    assert resumes[0]["name"] == "Backend" and resumes[0]["tags"] == "py,sql"
+
+    tsv = runner.invoke(app, ["note", "list", seeded[0].id, "--format", "tsv"]).stdout.splitlines()
+    assert tsv[0] == "id\tjob_id\tcreated_at\tcontent"
+    assert tsv[1].endswith("line one\\nline\\ttwo")
+
+    empty = runner.invoke(app, ["cover-letter", "list", "--format", "ndjson"])
+    assert empty.exit_code == 0 and empty.stdout == ""
+
+
+def test_write_rows_formats_values():
+    out = io.StringIO()
+    count = write_rows(OutputFormat.CSV, ["a", "b"], [(JobStatus.OFFER, None), ("x,y", 3)], out=out)
+    assert count == 2
+    assert out.getvalue() == 'a,b\noffer,\n"x,y",3\n'
@@ -0,0 +1,74 @@
+import re
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import event
+    from jobtracker.catalog import CatalogEntry, CatalogIndex, catalog_index
+    from jobtracker.cli.main import app
+    from jobtracker.models import Resume
+    from jobtracker.services import JobService
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _names(entries):
+    return [entry.name for entry in entries]
+
+
+def test_index_matches_prefixes_typos_and_tags():
+    index = CatalogIndex(
+        [
+            CatalogEntry("r3", "Backend Python - Stripe", "backend, fintech"),
+            CatalogEntry("r2", "Frontend React", "frontend"),
+            CatalogEntry("r1", "Backend Go", "backend, platform"),
+        ]
+    )
+    assert _names(index.search("back")) == ["Backend Python - Stripe", "Backend Go"]
+    assert _names(index.search("bakend fintech")) == ["Backend Python - Stripe"]
+    assert _names(index.search("platform")) == ["Backend Go"]
+    assert _names(index.search("go back")) == ["Backend Go"]
+    assert index.search("kotlin") == []
+    assert _names(index.search("", limit=2)) == ["Backend Python - Stripe", "Frontend React"]
+
+
+def test_index_is_built_once_per_catalog_version(session):
+    session.add(Resume(id="r1", name="Backend", file_path="/tmp/a.pdf", tags="python"))
+    session.commit()
+    index = catalog_index(session, Resume)
+    assert catalog_index(session, Resume) is index
+
+    session.add(Resume(id="r2", name="Data", file_path="/tmp/b.pdf", tags="python, ml"))
+    session.commit()
+    assert _names(catalog_index(session, Resume).search("python")) == ["Data", "Backend"]
+
+
+def test_job_add_searches_then_picks_by_number(session, runner, in_memory_db):
+    session.add_all(
+        Resume(id=f"{n:08x}-r", name=f"Variant {n}", file_path="/tmp/a.pdf", tags="backend" if n % 2 else "data")
+        for n in range(300)
+    )
+    session.add(Resume(id="ffff0000-r", name="Platform Staff", file_path="/tmp/a.pdf", tags="kubernetes"))
+    session.commit()
+    selects = []
+    event.listen(in_memory_db, "before_cursor_execute", lambda *args: selects.append(args[2]))
+
+    args = ["job", "add", "--company", "Acme", "--title", "SRE", "--source", "x", "--job-url", "https://a.io"]
+    args += ["--location", "remote", "--salary-range", "none listed", "--cover-letter-id", "none"]
+    result = runner.invoke(app, args, input="kubernets\n1\n")
+    assert result.exit_code == 0, result.output
+    assert "Resumes (newest 10 of 301)" in result.output
+    assert "Variant 150" not in result.output
+    assert "Resume attached: Platform Staff" in result.output
+    listing = "SELECT resumes.id, resumes.name, resumes.tags FROM resumes ORDER BY resumes.created_at DESC"
+    assert [" ".join(s.split()) for s in selects].count(listing) == 1
+
+    job_id = re.search(r"ID:\s*(\S+)", result.output).group(1)
+    assert JobService(session).get(job_id).resume_id == "ffff0000-r"
+    # Enter keeps the attached resume; `?` lists the whole catalog.
+    result = runner.invoke(app, ["job", "update", job_id], input="\n" * 7 + "?\n\n\n")
+    assert result.exit_code == 0, result.output
+    assert "Variant 150" in result.output
+    assert JobService(session).get(job_id).resume_id == "ffff0000-r"
+    result = runner.invoke(app, ["job", "update", job_id], input="\n" * 7 + "00000012\n\n")
+    assert JobService(session).get(job_id).resume_id == "00000012-r"
@@ -0,0 +1,90 @@
+import json
+import pstats
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from rich.console import Console
+    from sqlalchemy import text
+    from jobtracker import profiling
+    from jobtracker.cli.main import app
+    from jobtracker.models import Job
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+@pytest.fixture
+def jobs(session):
+    session.add_all(Job(company=f"Co{i}", title="Dev") for i in range(3))
+    session.commit()
+
+
+def test_profile_reports_statements_and_phases_on_stderr(runner, jobs):
+    result = runner.invoke(app, ["--profile", "job", "list", "--limit", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Co2" in result.stdout
+    assert "Profile job list --limit 2:" in result.stderr
+    assert "SQL statement(s)" in result.stderr
+    for name in ("import", "validation", "query", "render", "other"):
+        assert f"  {name}" in result.stderr
+    assert "SELECT jobs.id" in result.stderr
+    # Hooks are removed once the command finishes.
+    assert profiling._active is None
+    assert Console.print.__name__ == "print"
+
+
+def test_profile_json_output_from_env(runner, jobs, tmp_path):
+    out = tmp_path / "profile.json"
+    env = {"JOBTRACKER_PROFILE_OUTPUT": str(out)}
+    args = ["job", "add", "--company", "Acme", "--title", "Dev", "--source", "LinkedIn", "--job-url", "https://a.io"]
+    args += ["--location", "Remote", "--salary-range", "100000 - 120000"]
+    result = runner.invoke(app, args, input="\n\n", env=env)
+    assert result.exit_code == 0, result.output
+    report = json.loads(out.read_text())
+    assert report["command"].startswith("job add")
+    assert report["statements"] == sum(entry["count"] for entry in report["slowest"])
+    assert any(entry["sql"].startswith("INSERT INTO jobs") for entry in report["slowest"])
+    assert report["phases_ms"]["validation"] > 0
+    assert sum(v for k, v in report["phases_ms"].items() if k != "import") == pytest.approx(report["command_ms"])
+
+
+def test_profile_cprofile_output(runner, jobs, tmp_path):
+    out = tmp_path / "job-list.pstats"
+    result = runner.invoke(app, ["--profile-output", str(out), "job", "list", "--format", "csv"])
+    assert result.exit_code == 0, result.output
+    assert pstats.Stats(str(out)).total_calls > 0
+
+
+def test_phases_are_exclusive():
+    profiler = profiling.start("test")
+    try:
+        assert profiling.start("nested") is None
+        with profiling.phase("render"):
+            with profiling.phase("query"):
+                pass
+    finally:
+        profiler.stop()
+    assert profiling.phase("render") is profiling._NOOP
+    assert profiler.totals["render"] >= 0 and profiler.totals["query"] >= 0
+    total = sum(profiler.report()["phases_ms"][name] for name in ("validation", "query", "render", "other"))
+    assert total == pytest.approx(profiler.report()["command_ms"])
+
+
+def test_fetching_rows_counts_as_query_time(in_memory_db):
+    # SQLite finds rows as the cursor is stepped, so execute() alone returns almost at once.
+    rows = text(
+        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 500000) "
+        "SELECT i, printf('%08d', i * 7919 % 100003) FROM n WHERE i % 200 = 0"
+    )
+    profiler = profiling.start("test")
+    try:
+        with in_memory_db.connect() as conn:
+            assert len(conn.execute(rows).all()) == 2_500
+            assert len(list(conn.execute(rows).yield_per(1000))) == 2_500
+    finally:
+        profiler.stop()
+    report = profiler.report()
+    assert report["phases_ms"]["query"] > 0.8 * report["command_ms"]
+    (entry,) = [entry for entry in report["slowest"] if entry["sql"].startswith("WITH RECURSIVE")]
+    assert entry["count"] == 2
+    assert entry["total_ms"] == pytest.approx(report["db_ms"], rel=0.1)
@@ -0,0 +1,84 @@
+"""Regression test: every statement the CLI issues must be answered through an index.
+
+Runs the CLI commands against the in-memory database, captures the SQL they emit
+and checks each statement's ``EXPLAIN QUERY PLAN`` for full-table scans, and for
+temporary sort b-trees over rows that were not first narrowed by an index search.
+"""
+
+import re
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import event
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _capture(engine):
+    statements = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if re.match(r"\s*(SELECT|UPDATE|DELETE)\b", statement, re.I) and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before)
+    return statements
+
+
+def _bad_plan_steps(engine, statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in rows]
+    # A VIRTUAL TABLE scan walks a list passed as a parameter (json_each), not a table.
+    bad = [d for d in details if d.startswith("SCAN") and "USING" not in d and "VIRTUAL TABLE" not in d]
+    # Sorting is fine after an index SEARCH has narrowed the rows, not after a full scan.
+    if not details[0].startswith("SEARCH"):
+        bad += [d for d in details if "TEMP B-TREE" in d]
+    return bad
+
+
+def _new_id(result):
+    return re.search(r"ID:\s*([0-9a-fA-F-]{36})", result.stdout).group(1)
+
+
+def test_cli_queries_use_indexes(in_memory_db, tmp_path):
+    engine = in_memory_db
+    runner = CliRunner()
+    doc = tmp_path / "doc.txt"
+    doc.write_text("doc")
+
+    resume_id = _new_id(runner.invoke(app, ["resume", "add", "--name", "R", "--file-path", str(doc), "--tags", "a"]))
+    cl_id = _new_id(runner.invoke(app, ["cover-letter", "add", "--name", "C", "--file-path", str(doc), "--tags", "a"]))
+    statements = _capture(engine)
+
+    add_args = ["job", "add", "--company", "Co", "--title", "Dev", "--source", "x", "--job-url", "https://e.com"]
+    add_args += ["--location", "remote", "--salary-range", "none listed", "--resume-id", resume_id]
+    job_id = _new_id(runner.invoke(app, add_args + ["--cover-letter-id", cl_id]))
+    update = runner.invoke(app, ["job", "update", job_id], input="\n" * 12)
+    assert update.exit_code == 0, update.stdout
+    commands = [
+        ["job", "list"],
+        ["job", "list", "--status", "offer", "--status", "applied", "--sort", "updated"],
+        ["job", "list", "--company", "Co", "--source", "x", "--applied-since", "2025-01-01"],
+        ["job", "list", "--resume-id", resume_id, "--limit", "1"],
+        ["job", "status", job_id, "offer"],
+        ["note", "add", job_id, "hello"],
+        ["note", "list", job_id],
+        ["resume", "list"],
+        ["cover-letter", "list"],
+        ["resume", "list", "--tag", "a", "--tag", "b"],
+        ["cover-letter", "list", "--tag", "a", "--any"],
+        ["resume", "remove", resume_id],
+        ["cover-letter", "remove", cl_id],
+        ["job", "remove", job_id],
+    ]
+    for args in commands:
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, (args, result.stdout)
+
+    assert statements
+    failures = {s: steps for s, p in statements if (steps := _bad_plan_steps(engine, s, p))}
+    assert failures == {}
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, Note, Resume
+    from jobtracker.queries import catalog_list_select, job_list_select, note_list_select
+    from jobtracker.read_models import CatalogRow, JobRow, NoteRow, batches, fetch_rows
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+@pytest.fixture
+def seeded(session):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    resume = Resume(name="Backend", file_path="/tmp/r.pdf", tags="py", created_at=base)
+    session.add(resume)
+    session.flush()
+    jobs = [
+        Job(id=str(uuid.uuid4()), company=f"Co{i}", title="Dev", resume_id=resume.id, created_at=base + timedelta(i))
+        for i in range(5)
+    ]
+    session.add_all(jobs)
+    session.add_all(Note(job_id=jobs[0].id, content=f"note {i}", created_at=base + timedelta(i)) for i in (2, 1))
+    session.commit()
+    return jobs
+
+
+def test_projections_read_into_named_tuples(session, seeded):
+    tracked = len(session.identity_map)
+    rows = list(fetch_rows(session, job_list_select(), JobRow, batch_size=2))
+    assert [type(r) for r in rows] == [JobRow] * 5
+    assert [r.company for r in rows] == ["Co4", "Co3", "Co2", "Co1", "Co0"]
+    assert (rows[0].status, rows[0].resume_name) == (JobStatus.APPLIED, "Backend")
+    assert len(session.identity_map) == tracked
+
+    (resume,) = fetch_rows(session, catalog_list_select(Resume), CatalogRow)
+    assert (resume.name, resume.tags) == ("Backend", "py")
+    notes = fetch_rows(session, note_list_select(seeded[0].id), NoteRow)
+    assert [n.content for n in notes] == ["note 1", "note 2"]
+    assert [len(b) for b in batches(iter(rows), 2)] == [2, 2, 1]
+
+
+def test_column_mismatch_is_rejected(session, seeded):
+    with pytest.raises(ValueError, match="CatalogRow"):
+        fetch_rows(session, job_list_select(), CatalogRow)
+
+
+def test_list_commands_render_read_models(runner, seeded):
+    assert "Co4" in runner.invoke(app, ["job", "list"]).output
+    assert "Co4" in runner.invoke(app, ["job", "list", "--stream", "--limit", "2"]).output
+    assert "Backend" in runner.invoke(app, ["resume", "list"]).output
+    notes = runner.invoke(app, ["note", "list", seeded[0].id])
+    assert notes.exit_code == 0, notes.output
+    assert notes.output.index("note 1") < notes.output.index("note 2")
+    assert runner.invoke(app, ["note", "list", "missing"]).exit_code == 1
@@ -0,0 +1,100 @@
+import uuid
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import event, func, insert, select
+    from sqlalchemy.exc import IntegrityError
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, Note, Resume
+    from jobtracker.services import JobService, ResumeService
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _add_jobs(session, count, notes_per_job=0, **fields):
+    ids = [str(uuid.uuid4()) for _ in range(count)]
+    session.execute(insert(Job), [{"id": i, "company": f"Co{n}", "title": "Dev", **fields} for n, i in enumerate(ids)])
+    if notes_per_job:
+        notes = [{"job_id": i, "content": f"note {n}"} for i in ids for n in range(notes_per_job)]
+        session.execute(insert(Note), [{"id": str(uuid.uuid4()), **note} for note in notes])
+    session.commit()
+    return ids
+
+
+def _count(session, model):
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def _statements(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_remove_many_deletes_jobs_and_notes_set_based(session, in_memory_db):
+    _add_jobs(session, 50, notes_per_job=20, status=JobStatus.GHOSTED)
+    kept = _add_jobs(session, 5, notes_per_job=2)
+
+    statements = _statements(in_memory_db)
+    assert JobService(session).remove_many(statuses=[JobStatus.GHOSTED]) == 50
+    assert [" ".join(s.split()) for s in statements if s.startswith("DELETE")] == [
+        "DELETE FROM notes WHERE notes.job_id IN (SELECT jobs.id FROM jobs WHERE jobs.status IN (?))",
+        "DELETE FROM jobs WHERE jobs.status IN (?)",
+    ]
+    assert _count(session, Job) == 5
+    assert sorted(session.scalars(select(Note.job_id).distinct())) == sorted(kept)
+    assert _count(session, Note) == 10
+
+    with pytest.raises(ValueError):
+        JobService(session).remove_many()
+    with pytest.raises(IntegrityError):
+        session.execute(insert(Note).values(id="orphan", job_id="missing", content="x"))
+
+
+def test_in_use_guard_counts_instead_of_loading_jobs(session, in_memory_db, tmp_path):
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_text("cv")
+    resume = ResumeService(session).add("CV", str(pdf), "python")
+    _add_jobs(session, 200, resume_id=resume.id)
+
+    statements = _statements(in_memory_db)
+    with pytest.raises(ValueError, match=r"used by 200 job\(s\)"):
+        ResumeService(session).remove(resume.id)
+    assert not any("FROM jobs" in s and "count" not in s for s in statements)
+
+    session.query(Job).delete()
+    session.commit()
+    assert ResumeService(session).remove(resume.id).name == "CV"
+    assert _count(session, Resume) == 0
+    assert session.execute(select(func.count()).select_from(Resume.tag_set.property.secondary)).scalar() == 0
+
+
+def test_cli_bulk_remove(session, runner, tmp_path):
+    stale = _add_jobs(session, 4, notes_per_job=3, source="LinkedIn")
+    fresh = _add_jobs(session, 2, source="Referral")
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("\n".join(stale[:2] + ["missing-id"]))
+
+    result = runner.invoke(app, ["job", "remove", "--ids-from", str(ids_file)], input="n\n")
+    assert result.exit_code == 1
+    assert "Remove 2 job(s) and their notes?" in result.output
+    assert _count(session, Job) == 6
+
+    result = runner.invoke(app, ["job", "remove", "--ids-from", str(ids_file)], input="y\n")
+    assert result.exit_code == 0, result.output
+    assert "Removed 2 job(s)" in result.output
+    assert "1 ID(s) not found" in result.output
+
+    result = runner.invoke(app, ["job", "remove", "--ids-from", "-"], input="\n".join(fresh))
+    assert result.exit_code == 2
+    assert "pass --yes" in result.output
+    result = runner.invoke(app, ["job", "remove", "--where", "source=LinkedIn", "--yes"])
+    assert "Removed 2 job(s)" in result.output
+    session.expire_all()
+    assert _count(session, Job) == 2
+    assert _count(session, Note) == 0
+
+    for args in (["job", "remove"], ["job", "remove", fresh[0], "--where", "source=Referral"]):
+        assert runner.invoke(app, args).exit_code == 2
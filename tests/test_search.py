@@ -0,0 +1,74 @@
+import json
+import uuid
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import text
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.models import Job, Note
+    from jobtracker.search import search, to_fts_query
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _job(session, company, summary=None):
+    job = Job(id=str(uuid.uuid4()), company=company, title="Engineer", ai_summary=summary)
+    session.add(job)
+    session.commit()
+    return job
+
+
+def _search(*args):
+    result = CliRunner().invoke(app, ["search", *args, "--format", "ndjson"])
+    assert result.exit_code == 0, result.output
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_notes_and_summaries_are_searchable_with_snippets(session):
+    visa = _job(session, "VisaCo")
+    _job(session, "SummaryCo", summary="Remote role; the company offers visa sponsorship for engineers.")
+    other = _job(session, "OtherCo")
+    runner = CliRunner()
+    for job, words in ((visa, "Recruiter said visa sponsorship is fine"), (other, "Sponsorship not available")):
+        assert runner.invoke(app, ["note", "add", job.id, *words.split()]).exit_code == 0
+
+    hits = _search("visa", "sponsorship")
+    assert {(h["company"], h["kind"]) for h in hits} == {("VisaCo", "note"), ("SummaryCo", "summary")}
+    assert all("[visa]" in h["snippet"].lower() for h in hits)
+    assert hits[0]["score"] <= hits[1]["score"]
+
+    assert len(_search("sponsorship")) == 3
+    table = runner.invoke(app, ["search", "sponsorship"])
+    assert table.exit_code == 0 and "Search — sponsorship" in table.stdout
+
+
+def test_index_follows_updates_and_deletes(session):
+    job = _job(session, "Acme", summary="kubernetes platform team")
+    note = Note(job_id=job.id, content="onsite interview scheduled")
+    session.add(note)
+    session.commit()
+    assert [h["kind"] for h in _search("kubernetes")] == ["summary"]
+
+    job.ai_summary = "data engineering"
+    note.content = "phone screen done"
+    session.commit()
+    assert _search("kubernetes") == [] and _search("onsite") == []
+    assert len(_search("phone", "screen")) == 1
+
+    session.delete(job)
+    session.commit()
+    assert _search("data") == [] and _search("phone") == []
+    assert session.execute(text("SELECT count(*) FROM search_docs")).scalar() == 0
+
+
+def test_user_input_is_not_parsed_as_fts_syntax(session):
+    _job(session, "Hyphen", summary="full-time c++ role")
+    assert to_fts_query('full-time "c++"') == '"full-time" """c++"""'
+    assert [h["company"] for h in _search("full-time")] == ["Hyphen"]
+    assert search(session, "full* AND role", raw=True)[0].company == "Hyphen"
+
+    bad = CliRunner().invoke(app, ["search", "--raw", "AND AND"])
+    assert bad.exit_code == 1
+    assert "Invalid search query" in bad.stdout
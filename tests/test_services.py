@@ -0,0 +1,130 @@
+import dataclasses
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from pydantic import ValidationError
+    from sqlalchemy import create_engine, func, select
+    from sqlalchemy.orm import Session
+    from jobtracker import db as dbmod
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, Note, StatusEvent, resume_tags
+    from jobtracker.services import (
+        InUseError,
+        JobDTO,
+        JobService,
+        NoteService,
+        NotFoundError,
+        ResumeService,
+    )
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def test_job_lifecycle_returns_detached_dtos(session):
+    jobs = JobService(session)
+    job = jobs.add("Acme", "Backend Engineer", salary_range="150000 - 170000", job_url="https://acme.example/1")
+    assert isinstance(job, JobDTO)
+    assert type(job.status) is JobStatus
+    assert (job.status, job.salary_range, job.salary_min, job.salary_max) == (
+        JobStatus.APPLIED,
+        "$150,000 - $170,000",
+        150000,
+        170000,
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        job.company = "Other"
+    assert pickle.loads(pickle.dumps(job)) == job
+
+    updated = jobs.update(job.id, title="Staff Engineer", salary_range="none listed")
+    assert (updated.title, updated.salary_min) == ("Staff Engineer", None)
+    assert type(updated.status) is JobStatus
+    recruiter = jobs.set_status(job.id, JobStatus.RECRUITER)
+    assert type(recruiter.status) is JobStatus and recruiter.status == JobStatus.RECRUITER
+    assert jobs.set_status(job.id, "offer").status is JobStatus.OFFER
+    assert type(jobs.get(job.id).status) is JobStatus
+    assert session.scalar(select(func.count()).where(StatusEvent.job_id == job.id)) == 3
+
+    removed = jobs.remove(job.id)
+    assert removed.id == job.id and type(removed.status) is JobStatus
+    assert jobs.get(job.id) is None
+    with pytest.raises(NotFoundError):
+        jobs.set_status(job.id, JobStatus.OFFER)
+
+
+def test_invalid_input_raises_value_error(session):
+    with pytest.raises(ValidationError):
+        JobService(session).add("Acme", "Dev", salary_range="lots")
+    with pytest.raises(ValueError):
+        JobService(session).update("missing", status="offer")
+    assert session.scalar(select(func.count()).select_from(Job)) == 0
+
+
+def test_bulk_variants(session):
+    jobs = JobService(session)
+    report = jobs.add_many(
+        [
+            {"company": "A", "title": "Dev", "source": "LinkedIn"},
+            {"company": "", "title": "Dev"},
+            {"company": "B", "title": "Dev", "source": "Referral", "status": "recruiter"},
+            {"company": "C", "title": "Dev", "source": "LinkedIn"},
+        ]
+    )
+    assert report.inserted == 3
+    assert [position for position, _ in report.errors] == [2]
+
+    assert jobs.set_status_many(JobStatus.GHOSTED, statuses=[JobStatus.APPLIED], source="LinkedIn") == 2
+    assert jobs.set_status_many(JobStatus.GHOSTED, older_than=timedelta(days=1)) == 0
+    ids = session.scalars(select(Job.id).where(Job.company.in_(["A", "B"]))).all()
+    assert jobs.set_status_many(JobStatus.REJECTED, ids + ["missing"]) == 2
+
+    notes = NoteService(session)
+    assert notes.add_many([(ids[0], "first"), (ids[0], "second"), (ids[1], "third")]) == 3
+    with pytest.raises(NotFoundError):
+        notes.add_many([(ids[0], "lost"), ("missing", "nope")])
+    assert session.scalar(select(func.count()).select_from(Note)) == 3
+    assert [n.content for n in notes.list(ids[0])] == ["first", "second"]
+
+
+def test_resume_in_use_cannot_be_removed(session, tmp_path):
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_text("cv")
+    resumes = ResumeService(session)
+    resume = resumes.add(" Backend CV ", str(pdf), "backend, python")
+    assert resume.name == "Backend CV"
+    JobService(session).add("Acme", "Dev", resume_id=resume.id)
+    with pytest.raises(InUseError):
+        resumes.remove(resume.id)
+    assert resumes.update(resume.id, tags="go").tags == "go"
+
+
+def test_services_share_an_engine_across_threads(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    jobs = JobService(bind=engine)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        added = list(pool.map(lambda i: jobs.add(f"Co{i}", "Dev"), range(20)))
+    assert len({job.id for job in added}) == 20
+    assert jobs.set_status_many(JobStatus.OFFER, [job.id for job in added[:5]]) == 5
+
+
+def test_removes_work_without_foreign_key_enforcement(tmp_path):
+    path = tmp_path / "plain.db"
+    dbmod.init_db(create_engine(f"sqlite:///{path}"))
+    # A session on an engine of the caller's own, which never turns foreign keys on
+    with Session(create_engine(f"sqlite:///{path}")) as s:
+        assert s.connection().exec_driver_sql("PRAGMA foreign_keys").scalar() == 0
+        jobs, notes = JobService(s), NoteService(s)
+        first, second, third = (jobs.add(f"Co{i}", "Dev", source="LinkedIn") for i in range(3))
+        for job in (first, second, third):
+            notes.add(job.id, "recruiter call")
+        jobs.remove(first.id)
+        assert s.scalars(select(Note.job_id)).all().count(first.id) == 0
+        assert jobs.remove_many([second.id]) == 1
+        assert s.scalars(select(Note.job_id)).all() == [third.id]
+
+        resume = ResumeService(s).add("Backend CV", __file__, tags="python, go")
+        ResumeService(s).remove(resume.id)
+        assert s.scalar(select(func.count()).select_from(resume_tags)) == 0
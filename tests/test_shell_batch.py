@@ -0,0 +1,90 @@
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import func, select
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.models import Job
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _add_line(company):
+    return (
+        f"job add --company {company} --title Dev --source LinkedIn --job-url https://example.com/{company} "
+        "--location Remote --salary-range '$100,000 - $120,000'"
+    )
+
+
+def _companies(session):
+    session.expire_all()
+    return sorted(session.scalars(select(Job.company)))
+
+
+def _write(tmp_path, *lines):
+    path = tmp_path / "commands.txt"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_batch_runs_every_line_in_process(session, tmp_path):
+    commands = _write(tmp_path, "# seed two jobs", _add_line("Acme"), "", _add_line("Globex"), "job list")
+    result = CliRunner().invoke(app, ["batch", "-f", commands])
+    assert result.exit_code == 0, result.output
+    assert "Acme" in result.stdout and "Globex" in result.stdout
+    assert "Ran 3 command(s); 0 failed" in result.stderr
+    assert _companies(session) == ["Acme", "Globex"]
+
+
+def test_batch_stops_at_first_failure(session, tmp_path):
+    commands = _write(tmp_path, _add_line("Acme"), "job status 1234 hired", _add_line("Globex"))
+    result = CliRunner().invoke(app, ["batch", "-f", commands])
+    assert result.exit_code == 1
+    assert "Line 2 failed with exit code 2" in result.stderr
+    assert _companies(session) == ["Acme"]
+
+
+def test_batch_transaction_rolls_back_everything_on_failure(session, tmp_path):
+    commands = _write(tmp_path, _add_line("Acme"), _add_line("Globex"), "job bogus-command")
+    result = CliRunner().invoke(app, ["batch", "-f", commands, "--transaction"])
+    assert result.exit_code == 1
+    assert "Line 3 failed" in result.stderr
+    assert _companies(session) == []
+
+
+def test_batch_transaction_commits_once(session, tmp_path):
+    commands = _write(tmp_path, *(_add_line(f"Co{i}") for i in range(5)))
+    result = CliRunner().invoke(app, ["batch", "-f", commands, "--transaction"])
+    assert result.exit_code == 0, result.output
+    assert session.execute(select(func.count()).select_from(Job)).scalar() == 5
+
+
+def test_batch_keep_going_reports_failures(session, tmp_path):
+    commands = _write(tmp_path, "job status 1234 hired", _add_line("Acme"), "shell")
+    result = CliRunner().invoke(app, ["batch", "-f", commands, "--keep-going"])
+    assert result.exit_code == 1
+    assert "Line 1 failed" in result.stderr and "Line 3 failed" in result.stderr
+    assert "Ran 3 command(s); 2 failed" in result.stderr
+    assert _companies(session) == ["Acme"]
+
+
+def test_shell_transaction_meta_commands(session):
+    script = "\n".join(
+        [
+            "begin",
+            _add_line("Acme"),
+            "rollback",
+            "begin",
+            _add_line("Globex"),
+            "commit",
+            _add_line("Initech"),
+            "begin",
+            _add_line("Umbrella"),
+            "exit",
+        ]
+    )
+    result = CliRunner().invoke(app, ["shell", "--prompt", ""], input=script + "\n")
+    assert result.exit_code == 0, result.output
+    assert "Rolled back." in result.stdout and "Committed." in result.stdout
+    assert "Open transaction rolled back." in result.stdout
+    assert _companies(session) == ["Globex", "Initech"]
@@ -0,0 +1,89 @@
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import event
+    from typer.testing import CliRunner
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.ids import AmbiguousIdError, prefix_upper_bound, resolve_id, short_ids, unique_prefix_length
+    from jobtracker.models import Job
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+IDS = ["3fa90000-aaaa", "3fa91111-bbbb", "3fb00000-cccc", "7c000000-dddd", "7c000000-dddd-x"]
+
+
+@pytest.fixture
+def jobs(session):
+    session.add_all(Job(id=job_id, company=f"Co{i}", title="Dev") for i, job_id in enumerate(IDS))
+    session.commit()
+
+
+def test_prefix_resolution_is_an_indexed_range_scan(session, jobs, in_memory_db):
+    plans = []
+
+    def explain(conn, cursor, statement, params, context, executemany):
+        if statement.startswith("SELECT jobs.id"):
+            plans.extend(row[3] for row in cursor.connection.execute("EXPLAIN QUERY PLAN " + statement, params))
+
+    event.listen(in_memory_db, "before_cursor_execute", explain)
+    assert resolve_id(session, Job, "3FB") == "3fb00000-cccc"
+    assert any("USING COVERING INDEX" in step and "id>? AND id<?" in step for step in plans), plans
+
+    assert resolve_id(session, Job, "7c000000-dddd") == "7c000000-dddd"  # exact match wins
+    assert resolve_id(session, Job, "ffff") is None
+    with pytest.raises(AmbiguousIdError) as err:
+        resolve_id(session, Job, "3fa")
+    assert err.value.candidates == IDS[:2]
+    assert prefix_upper_bound("3fa") == "3fb"
+
+
+def test_shortest_unique_prefixes(session, jobs):
+    assert short_ids(session, Job, IDS) == {
+        "3fa90000-aaaa": "3fa90",
+        "3fa91111-bbbb": "3fa91",
+        "3fb00000-cccc": "3fb0",
+        "7c000000-dddd": "7c000000-dddd",
+        "7c000000-dddd-x": "7c000000-dddd-",
+    }
+    assert unique_prefix_length(session, Job) == 14
+
+
+def test_short_ids_probe_only_the_neighbours(session, jobs, in_memory_db, monkeypatch):
+    from jobtracker import ids
+
+    statements, plans = [], []
+
+    def record(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+        plans.extend(row[3] for row in cursor.connection.execute("EXPLAIN QUERY PLAN " + statement, params))
+
+    event.listen(in_memory_db, "before_cursor_execute", record)
+    assert short_ids(session, Job, IDS[1:3]) == {"3fa91111-bbbb": "3fa91", "3fb00000-cccc": "3fb0"}
+    assert len(statements) == 1
+    # Each wanted ID costs two index searches; the jobs table is never scanned.
+    assert sum("SEARCH jobs USING COVERING INDEX" in step for step in plans) == 2, plans
+    assert not any(step.startswith("SCAN jobs") for step in plans), plans
+
+    # Past the lookup limit, one ordered pass over the index gives the same prefixes.
+    monkeypatch.setattr(ids, "NEIGHBOUR_LOOKUPS", 1)
+    assert short_ids(session, Job, IDS[1:3]) == {"3fa91111-bbbb": "3fa91", "3fb00000-cccc": "3fb0"}
+
+
+def test_commands_accept_prefixes(session, jobs, monkeypatch):
+    from jobtracker.cli import cli_jobs
+
+    monkeypatch.setattr(cli_jobs.console, "width", 300)
+    runner = CliRunner()
+    result = runner.invoke(app, ["job", "status", "3fb", "offer"])
+    assert result.exit_code == 0 and "to offer" in result.stdout
+    assert session.get(Job, "3fb00000-cccc").status == JobStatus.OFFER
+
+    result = runner.invoke(app, ["note", "add", "3fa"] + ["hello"])
+    assert result.exit_code == 1
+    assert "ambiguous" in result.stdout and "3fa90000-aaaa, 3fa91111-bbbb" in result.stdout
+
+    listing = runner.invoke(app, ["job", "list"]).stdout
+    assert "3fa90 " in listing and "3fa90000" not in listing
+    streamed = runner.invoke(app, ["job", "list", "--stream"]).stdout
+    assert "3fa90 " in streamed and "7c000000-dddd-" in streamed
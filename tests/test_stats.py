@@ -0,0 +1,121 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import create_engine, select, text
+    from typer.testing import CliRunner
+    from jobtracker import db as dbmod
+    from jobtracker import migrations
+    from jobtracker.cli.main import app
+    from jobtracker.enums import JobStatus
+    from jobtracker.models import Job, StatusCount, StatusEvent
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _job(session, company, applied_days_ago=0):
+    job = Job(company=company, title="Engineer", applied_date=T0 + timedelta(days=applied_days_ago))
+    session.add(job)
+    session.commit()
+    return job
+
+
+def _move(session, job, status, day):
+    job.status = status
+    job.last_updated = T0 + timedelta(days=day)
+    session.commit()
+
+
+def _stats(*args):
+    result = CliRunner().invoke(app, ["stats", *args, "--format", "ndjson"])
+    assert result.exit_code == 0, result.output
+    return {row.get("status", row.get("group")): row for row in map(json.loads, result.stdout.splitlines())}
+
+
+def _counts(session):
+    return {c.status: (c.current, c.reached) for c in session.scalars(select(StatusCount)) if c.current or c.reached}
+
+
+def test_status_changes_are_recorded_and_counted(session):
+    a, b, c = _job(session, "A"), _job(session, "B"), _job(session, "C")
+    _move(session, a, JobStatus.RECRUITER, 2)
+    _move(session, a, JobStatus.FIRST, 5)
+    _move(session, b, JobStatus.RECRUITER, 4)
+    _move(session, b, JobStatus.REJECTED, 10)
+    _move(session, c, JobStatus.APPLIED, 11)  # unchanged status: no event
+
+    events = session.execute(select(StatusEvent.from_status, StatusEvent.to_status).where(StatusEvent.job_id == a.id))
+    assert events.all() == [(None, "applied"), ("applied", "recruiter"), ("recruiter", "1st_interview")]
+    assert _counts(session) == {
+        "applied": (1, 3),
+        "recruiter": (0, 2),
+        "1st_interview": (1, 1),
+        "rejected": (1, 1),
+    }
+
+    funnel = _stats("funnel")
+    assert list(funnel) == [s.value for s in JobStatus]
+    assert funnel["recruiter"]["of_applied"] == pytest.approx(2 / 3)
+    assert funnel["recruiter"]["from_previous"] == pytest.approx(2 / 3)
+    assert funnel["video_interview"]["from_previous"] == 0
+    assert funnel["rejected"]["from_previous"] is None
+
+    spans = _stats("time-in-stage")
+    assert spans["applied"]["jobs"] == 2 and spans["applied"]["avg_days"] == pytest.approx(3)
+    assert spans["recruiter"]["median_days"] == pytest.approx(4.5)
+    assert "1st_interview" not in spans
+    assert "1st_interview" in _stats("time-in-stage", "--include-current")
+
+    session.delete(b)
+    session.commit()
+    assert _counts(session) == {"applied": (1, 2), "recruiter": (0, 1), "1st_interview": (1, 1)}
+
+
+def test_imported_jobs_start_their_history(session, tmp_path):
+    src = tmp_path / "jobs.ndjson"
+    src.write_text('{"company": "X", "title": "Dev"}\n{"company": "Y", "title": "Dev", "status": "offer"}\n')
+    assert CliRunner().invoke(app, ["job", "import", str(src)]).exit_code == 0
+    assert _counts(session) == {"applied": (1, 1), "offer": (1, 1)}
+
+
+def test_migration_backfills_existing_jobs(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}", future=True)
+    dbmod.Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO jobs (id, company, title, status) VALUES ('1', 'A', 'Dev', 'applied')"))
+        conn.execute(text("INSERT INTO jobs (id, company, title, status) VALUES ('2', 'B', 'Dev', 'offer')"))
+    migrations.migrate(engine)
+    with engine.connect() as conn:
+        counts = conn.execute(text("SELECT status, current, reached FROM status_counts ORDER BY status")).all()
+    assert counts == [("applied", 1, 2), ("offer", 1, 1)]
+
+
+def test_salary_bounds_are_parsed_filtered_and_summarized(session, tmp_path):
+    src = tmp_path / "jobs.csv"
+    src.write_text(
+        "company,title,salary_range,source\n"
+        "A,Dev,100000 - 120000,LinkedIn\n"
+        'B,Dev,"$150,000 - $170,000",LinkedIn\n'
+        "C,Dev,200000 - 240000,Referral\n"
+        "D,Dev,none listed,Referral\n"
+    )
+    runner = CliRunner()
+    assert runner.invoke(app, ["job", "import", str(src)]).exit_code == 0
+    bounds = session.execute(select(Job.company, Job.salary_min, Job.salary_max).order_by(Job.company)).all()
+    assert bounds == [("A", 100000, 120000), ("B", 150000, 170000), ("C", 200000, 240000), ("D", None, None)]
+
+    listed = runner.invoke(app, ["job", "list", "--min-salary", "160000", "--max-salary", "210000", "--format", "csv"])
+    assert sorted(line.split(",")[1] for line in listed.stdout.splitlines()[1:]) == ["B", "C"]
+
+    overall = _stats("salary")["all"]
+    assert (overall["jobs"], overall["min"], overall["p50"], overall["max"]) == (3, 110000, 160000, 220000)
+    by_source = _stats("salary", "--by", "source")
+    assert by_source["Referral"]["jobs"] == 1 and by_source["LinkedIn"]["p90"] == 160000
+
+    result = runner.invoke(app, ["stats", "salary", "--histogram", "--bucket", "50000", "--format", "ndjson"])
+    histogram = [(row["bucket"], row["jobs"]) for row in map(json.loads, result.stdout.splitlines())]
+    assert histogram == [(100000, 1), (150000, 1), (200000, 1)]
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+try:  # pragma: no cover - skip when project not on PYTHONPATH / not installed
+    from sqlalchemy import create_engine, text
+    from typer.testing import CliRunner
+    from jobtracker import db as dbmod
+    from jobtracker import migrations
+    from jobtracker.cli.main import app
+except Exception as exc:  # pragma: no cover - skip when imports fail
+    pytest.skip(f"Missing runtime dependency or import error: {exc}", allow_module_level=True)
+
+
+def _names(*args):
+    result = CliRunner().invoke(app, [*args, "--format", "ndjson"])
+    assert result.exit_code == 0, result.output
+    return sorted(json.loads(line).get("name") or json.loads(line)["tag"] for line in result.stdout.splitlines())
+
+
+@pytest.mark.parametrize("catalog", ["resume", "cover-letter"])
+def test_tag_filters_and_counts(catalog, tmp_path, in_memory_db):
+    doc = tmp_path / "doc.pdf"
+    doc.write_text("doc")
+    runner = CliRunner()
+    for name, tags in (("A", "Backend, senior"), ("B", "backend,junior"), ("C", "frontend,senior"), ("D", "")):
+        result = runner.invoke(app, [catalog, "add", "--name", name, "--file-path", str(doc), "--tags", tags])
+        assert result.exit_code == 0, result.output
+
+    assert _names(catalog, "list", "--tag", "backend", "--tag", "senior") == ["A"]
+    assert _names(catalog, "list", "--tag", "junior", "--tag", "frontend", "--any") == ["B", "C"]
+    assert _names(catalog, "list", "--tag", "BACKEND") == ["A", "B"]
+
+    counts = runner.invoke(app, [catalog, "tags", "--format", "csv"]).stdout.splitlines()
+    assert counts[:3] == ["tag,count", "backend,2", "senior,2"]
+
+    b_id = json.loads(runner.invoke(app, [catalog, "list", "--tag", "junior", "--format", "ndjson"]).stdout)["id"]
+    assert runner.invoke(app, [catalog, "update", b_id, "--tags", "senior"]).exit_code == 0
+    assert _names(catalog, "list", "--tag", "backend", "--tag", "senior") == ["A"]
+    assert _names(catalog, "list", "--tag", "senior") == ["A", "B", "C"]
+
+    assert runner.invoke(app, [catalog, "remove", b_id]).exit_code == 0
+    with in_memory_db.connect() as conn:
+        links = conn.execute(text("SELECT count(*) FROM resume_tags UNION ALL SELECT count(*) FROM cover_letter_tags"))
+        assert sum(links.scalars()) == 4
+
+
+def test_migration_moves_comma_separated_tags(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}", future=True)
+    dbmod.Base.metadata.tables["resumes"].create(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO resumes (id, name, tags, file_path) VALUES ('r1', 'R', 'py, SQL,py', '/r')"))
+    migrations.migrate(engine)
+    with engine.connect() as conn:
+        tags = conn.execute(text("SELECT t.name FROM resume_tags JOIN tags AS t ON t.id = tag_id ORDER BY 1"))
+        assert tags.scalars().all() == ["py", "sql"]